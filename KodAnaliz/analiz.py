@@ -0,0 +1,159 @@
+import ast
+from functools import cached_property
+from klon import alt_agaclari_ozetle
+from kurallar import kurallari_uygula
+from profil import asama
+# Ağır bağımlılıklar (sklearn, radon, numpy) yalnızca onları kullanan analiz çalıştığında yüklenir
+# Analiz çıktılarını değiştiren her güncellemede artırılır; önbellek anahtarlarının parçasıdır
+ANALIZ_SURUMU = "1.4"
+# 1. Kod Benzerlik Analizi
+class AyristirilmisKod:
+    """Kodu bir kez ayrıştırır ve benzerlik boyutlarının tüm özelliklerini tek ağaç gezintisinde toplar."""
+    def __init__(self, kod: str):
+        self.kod = kod
+        with asama("AyristirilmisKod.parse"):
+            self.agac = ast.parse(kod)
+        self.dugum_turleri = []
+        self.degiskenler = []
+        self.fonksiyonlar = []
+        self.siniflar = []
+        self.moduller = []
+        # Metriklerdeki "Import Sayısı" import deyimlerini sayar; moduller ise deyimdeki her adı tutar
+        self.import_sayisi = 0
+        self.stringler = []
+        self.dongu_sayisi = 0
+        self.kosul_sayisi = 0
+        with asama("AyristirilmisKod.gezinti"):
+            self._gez()
+        # Yorumlar ağaçta yer almadığından satırlardan okunur
+        self.yorumlar = [line.strip() for line in kod.split('\n') if line.strip().startswith('#')]
+    @cached_property
+    def yapi_ozetleri(self) -> list:
+        """Deyim alt ağaçlarının tanımlayıcılardan bağımsız özetleri; yapısal benzerlik bunların kümesiyle ölçülür.
+
+        Yalnızca benzerlik hesapları kullandığından ilk erişimde üretilir; metrik ve kural analizleri bu
+        gezintinin maliyetini ödemez.
+        """
+        with asama("AyristirilmisKod.alt_agac_ozetleri"):
+            return [k.normal for k in alt_agaclari_ozetle(self.agac)]
+    def _gez(self):
+        for node in ast.walk(self.agac):
+            self.dugum_turleri.append(type(node).__name__)
+            if isinstance(node, ast.Name):
+                self.degiskenler.append(node.id)
+            elif isinstance(node, ast.FunctionDef):
+                self.fonksiyonlar.append(node.name)
+            elif isinstance(node, ast.ClassDef):
+                self.siniflar.append(node.name)
+            elif isinstance(node, ast.Import):
+                self.moduller.extend(a.name for a in node.names)
+                self.import_sayisi += 1
+            elif isinstance(node, ast.Constant) and isinstance(node.value, str):
+                self.stringler.append(node.value)
+            elif isinstance(node, (ast.For, ast.While)):
+                self.dongu_sayisi += 1
+            elif isinstance(node, ast.If):
+                self.kosul_sayisi += 1
+def _kume_benzerligi(a, b) -> float:
+    return len(set(a).intersection(b)) / max(len(set(a) | set(b)), 1)
+def _sayi_benzerligi(a: int, b: int) -> float:
+    return min(a, b) / max(a, b) if max(a, b) > 0 else 0
+def kod_benzerlik_hesapla(kod1, kod2, token_modeli=None) -> dict:
+    if not kod1 or not kod2:
+        raise ValueError("Kodlar boş olamaz.")
+    # Her kod yalnızca bir kez ayrıştırılır; önceden ayrıştırılmış nesneler de kabul edilir
+    a1 = kod1 if isinstance(kod1, AyristirilmisKod) else AyristirilmisKod(kod1)
+    a2 = kod2 if isinstance(kod2, AyristirilmisKod) else AyristirilmisKod(kod2)
+    # 1. Token Benzerliği
+    # Eğitilmiş bir token_modeli (token_modeli.TokenModeli) verilirse IDF ağırlıklı Python token'ları kullanılır
+    with asama("kod_benzerlik_hesapla.token"):
+        if token_modeli is not None:
+            token_benzerlik = token_modeli.cift_benzerligi(a1, a2) / 100
+        else:
+            from sklearn.feature_extraction.text import CountVectorizer
+            from sklearn.metrics.pairwise import cosine_similarity
+            vectorizer = CountVectorizer().fit_transform([a1.kod, a2.kod])
+            token_benzerlik = cosine_similarity(vectorizer)[0][1]
+    # 2. Yapısal Benzerlik
+    yapisal_benzerlik = _kume_benzerligi(a1.yapi_ozetleri, a2.yapi_ozetleri)
+    # 3. Değişken Adları Benzerliği
+    degisken_benzerlik = _kume_benzerligi(a1.degiskenler, a2.degiskenler)
+    # 4. Fonksiyon Adları Benzerliği
+    fonksiyon_benzerlik = _kume_benzerligi(a1.fonksiyonlar, a2.fonksiyonlar)
+    # 5. Sınıf Adları Benzerliği
+    sinif_benzerlik = _kume_benzerligi(a1.siniflar, a2.siniflar)
+    # 6. Modül Benzerliği
+    modul_benzerlik = _kume_benzerligi(a1.moduller, a2.moduller)
+    # 7. String Benzerliği
+    string_benzerlik = _kume_benzerligi(a1.stringler, a2.stringler)
+    # 8. Yorum Satırları Benzerliği
+    yorum_benzerlik = _kume_benzerligi(a1.yorumlar, a2.yorumlar)
+    # 9. Döngü Türleri Benzerliği
+    dongu_benzerlik = _sayi_benzerligi(a1.dongu_sayisi, a2.dongu_sayisi)
+    # 10. Koşul Yapıları Benzerliği
+    kosul_benzerlik = _sayi_benzerligi(a1.kosul_sayisi, a2.kosul_sayisi)
+    return {
+        "Token Benzerliği": token_benzerlik * 100,
+        "Yapısal Benzerlik": yapisal_benzerlik * 100,
+        "Değişken Adları Benzerliği": degisken_benzerlik * 100,
+        "Fonksiyon Adları Benzerliği": fonksiyon_benzerlik * 100,
+        "Sınıf Adları Benzerliği": sinif_benzerlik * 100,
+        "Modül Benzerliği": modul_benzerlik * 100,
+        "String Benzerliği": string_benzerlik * 100,
+        "Yorum Satırları Benzerliği": yorum_benzerlik * 100,
+        "Döngü Türleri Benzerliği": dongu_benzerlik * 100,
+        "Koşul Yapıları Benzerliği": kosul_benzerlik * 100
+    }
+# 3. Metrik Analizi
+def metrik_uret(kod) -> dict:
+    import numpy as np
+    from radon.complexity import cc_visit_ast
+    from radon.raw import analyze
+    # Kod bir kez ayrıştırılır; aynı ağaç karmaşıklık ve sayım metriklerinde kullanılır
+    ayrisim = kod if isinstance(kod, AyristirilmisKod) else AyristirilmisKod(kod)
+    with asama("metrik_uret.karmasiklik"):
+        karmaşıklık = cc_visit_ast(ayrisim.agac)
+    with asama("metrik_uret.ham_metrikler"):
+        raw_metrics = analyze(ayrisim.kod)
+    return {
+        "Karmaşıklık Seviyesi": len(karmaşıklık),
+        "Toplam Satır": raw_metrics.loc,
+        "Boş Satır": raw_metrics.lloc,
+        "Yorum Satırı": raw_metrics.comments,
+        "Fonksiyon Sayısı": len(ayrisim.fonksiyonlar),
+        "Değişken Sayısı": len(ayrisim.degiskenler),
+        "Import Sayısı": ayrisim.import_sayisi,
+        "Yorum Oranı": raw_metrics.comments / raw_metrics.loc * 100 if raw_metrics.loc else 0,
+        "Kod Satırı Oranı": raw_metrics.lloc / raw_metrics.loc * 100 if raw_metrics.loc else 0,
+        "Karmaşıklık Ortalama": np.mean([n.complexity for n in karmaşıklık]) if karmaşıklık else 0
+    }
+# 4. Kod Koku Analizi
+def kod_kokularini_tespit_et(kod: str) -> list:
+    # Koku kuralları kurallar.py'de kayıtlıdır; ağaç tek geçişte gezilir
+    return [bulgu.mesaj for bulgu in kurallari_uygula(kod, "koku")]
+# 5. Cover Oranı Hesaplaması
+def cover_orani_hesapla(proje_kod: str, test_kod: str) -> dict:
+    # Kod çifti havuzdaki bir işçi süreçte, kendi geçici dizininde ve zaman aşımıyla çalıştırılır
+    from kapsama import kapsama_hesapla
+    with asama("cover_orani_hesapla.isci"):
+        sonuc = kapsama_hesapla(proje_kod, test_kod)
+    if sonuc["Hata"]:
+        print(sonuc["Hata"])
+    return sonuc
+# Güvenlik ve Hata Analizi
+def kod_guvenligi_ve_hata_tahmini(kod: str) -> list:
+    # Güvenlik kuralları kurallar.py'de kayıtlıdır; kural kimliği ve konumu için kurallari_uygula kullanılır
+    return [bulgu.mesaj for bulgu in kurallari_uygula(kod, "guvenlik")]
+# Tek Geçişte Tüm Analizler
+def tum_analizler(kod) -> dict:
+    """Metrik, kod kokusu ve güvenlik sonuçlarını tek ayrıştırma ve tek kural geçişiyle üretir.
+
+    Sonuçlar metrik_uret, kod_kokularini_tespit_et ve kod_guvenligi_ve_hata_tahmini ile aynıdır.
+    """
+    ayrisim = kod if isinstance(kod, AyristirilmisKod) else AyristirilmisKod(kod)
+    bulgular = kurallari_uygula(ayrisim.agac)
+    return {
+        "Metrikler": metrik_uret(ayrisim),
+        "Kokular": [b.mesaj for b in bulgular if b.kategori == "koku"],
+        "Güvenlik": [b.mesaj for b in bulgular if b.kategori == "guvenlik"],
+    }
@@ -0,0 +1,175 @@
+import ast
+import hashlib
+import queue
+import threading
+import time
+from collections import Counter, OrderedDict
+from analiz import metrik_uret
+from klon import EN_AZ_DUGUM, alt_agaclari_ozetle, tekrar_eden_bloklar
+from kurallar import KURAL_KAYDI, Bulgu, KuralDenetcisi, kullanilan_ad
+# Artımlı (Blok Bazlı) Analiz
+# Ölü kod ve tekrar eden kod kuralları tüm modüle bağlıdır; bloklardan toplanan özetlerle ayrıca hesaplanır
+_MODUL_KURALLARI = {"K003", "K004"}
+_DEVAM_SATIRLARI = ("else", "elif", "except", "finally", ")", "]", "}")
+def ust_duzey_bloklar(kod: str) -> list:
+    """Kodu sütun 0'da başlayan üst düzey deyimlere göre (başlangıç satırı, metin) bloklarına böler.
+
+    Dekoratörler ve else/except gibi devam satırları önceki bloğa eklenir. Bölme salt metin üzerinde
+    yapılır; çok satırlı string gibi yanlış bölünen bloklar ayrıştırılırken komşularıyla birleştirilir.
+    """
+    bloklar = []
+    satirlar = kod.split("\n")
+    baslangic = 0
+    for i, satir in enumerate(satirlar):
+        if i == 0 or not satir or satir[0] in " \t#" or satir.startswith(_DEVAM_SATIRLARI):
+            continue
+        onceki = satirlar[baslangic].lstrip()
+        if onceki.startswith("@") and all(s.startswith("@") or not s.strip() for s in satirlar[baslangic:i]):
+            continue
+        # Satır sonu blokta kalır; böylece blokların satır sayıları toplamı tüm kodunkine eşit olur
+        bloklar.append((baslangic + 1, "\n".join(satirlar[baslangic:i]) + "\n"))
+        baslangic = i
+    bloklar.append((baslangic + 1, "\n".join(satirlar[baslangic:])))
+    return bloklar
+class _BlokSonucu:
+    __slots__ = ("metrikler", "bulgular", "tanimlar", "cagrilar", "alt_agaclar")
+class ArtimliAnalizci:
+    """Üst düzey blokların analiz sonuçlarını blok metninin özetine göre önbellekte tutar.
+
+    Bir düzenlemeden sonra yalnızca metni değişen bloklar yeniden ayrıştırılıp analiz edilir; modül
+    geneli sonuçlar blok sonuçlarının birleştirilmesiyle elde edilir. Birden fazla iş parçacığından
+    çağrılabilir.
+    """
+    def __init__(self, en_fazla_blok: int = 10000):
+        self.en_fazla_blok = en_fazla_blok
+        self._onbellek = OrderedDict()
+        self._kilit = threading.Lock()
+        self._blok_kurallari = [k for kimlik, k in KURAL_KAYDI.items() if kimlik not in _MODUL_KURALLARI]
+    def _blogu_analiz_et(self, metin: str) -> _BlokSonucu:
+        agac = ast.parse(metin)
+        sonuc = _BlokSonucu()
+        sonuc.metrikler = metrik_uret(metin)
+        sonuc.bulgular = KuralDenetcisi(self._blok_kurallari).denetle(agac)
+        sonuc.tanimlar, sonuc.cagrilar = [], set()
+        # Alt ağaç özetleri konumdan bağımsızdır; bloklar arası klonlar birleştirmede bulunur
+        sonuc.alt_agaclar = [k for k in alt_agaclari_ozetle(agac) if k.boyut >= EN_AZ_DUGUM]
+        for node in ast.walk(agac):
+            if isinstance(node, ast.FunctionDef):
+                sonuc.tanimlar.append((node.name, node.lineno, node.col_offset))
+            elif isinstance(node, (ast.Name, ast.Attribute)):
+                sonuc.cagrilar.add(kullanilan_ad(node))
+        return sonuc
+    def _blok_sonucu(self, metin: str):
+        """Önbellekteki sonucu döndürür; yoksa analiz eder. İkinci değer yeniden analiz yapılıp yapılmadığıdır."""
+        anahtar = hashlib.blake2b(metin.encode("utf-8"), digest_size=16).digest()
+        with self._kilit:
+            if anahtar in self._onbellek:
+                self._onbellek.move_to_end(anahtar)
+                return self._onbellek[anahtar], False
+        sonuc = self._blogu_analiz_et(metin)
+        with self._kilit:
+            self._onbellek[anahtar] = sonuc
+            while len(self._onbellek) > self.en_fazla_blok:
+                self._onbellek.popitem(last=False)
+        return sonuc, True
+    def analiz_et(self, kod: str) -> dict:
+        """Metrik, kod kokusu ve güvenlik sonuçlarını döndürür; 'Yeniden Analiz' değişen blok sayısıdır."""
+        baslangic = time.perf_counter()
+        bloklar = []
+        yeniden = 0
+        bekleyen = None
+        for satir_no, metin in ust_duzey_bloklar(kod):
+            if bekleyen is not None:
+                satir_no, metin = bekleyen[0], bekleyen[1] + metin
+            try:
+                sonuc, analiz_edildi = self._blok_sonucu(metin)
+            except SyntaxError:
+                # Yanlış bölünmüş olabilir; sonraki blokla birleştirilerek yeniden denenir
+                bekleyen = (satir_no, metin)
+                continue
+            bekleyen = None
+            yeniden += analiz_edildi
+            bloklar.append((satir_no - 1, sonuc))
+        if bekleyen is not None:
+            # Kod gerçekten hatalıysa SyntaxError burada yükselir; değilse bölme başarısızdır ve kod tek blok sayılır
+            ast.parse(kod)
+            sonuc, analiz_edildi = self._blok_sonucu(kod)
+            bloklar, yeniden = [(0, sonuc)], int(analiz_edildi)
+        return self._birlestir(bloklar, yeniden, time.perf_counter() - baslangic)
+    def _birlestir(self, bloklar, yeniden: int, sure: float) -> dict:
+        metrikler = Counter()
+        karmasiklik_toplami = 0
+        bulgular = []
+        tanimlar, cagrilar, alt_agaclar = [], set(), []
+        for kayma, sonuc in bloklar:
+            for ad in ("Karmaşıklık Seviyesi", "Toplam Satır", "Boş Satır", "Yorum Satırı", "Fonksiyon Sayısı", "Değişken Sayısı", "Import Sayısı"):
+                metrikler[ad] += sonuc.metrikler[ad]
+            karmasiklik_toplami += sonuc.metrikler["Karmaşıklık Ortalama"] * sonuc.metrikler["Karmaşıklık Seviyesi"]
+            bulgular.extend(b._replace(satir=b.satir + kayma) for b in sonuc.bulgular)
+            tanimlar.extend((ad, satir + kayma, sutun) for ad, satir, sutun in sonuc.tanimlar)
+            cagrilar.update(sonuc.cagrilar)
+            alt_agaclar.extend(k._replace(lineno=k.lineno + kayma, end_lineno=k.end_lineno + kayma) for k in sonuc.alt_agaclar)
+        # Blok sınırlarını aşan kurallar (ölü kod, tekrar eden kod) kuraldaki mesajlarla üretilir
+        bulgular.extend(
+            _bulgu("K003", f"Fonksiyon {ad} kullanılmıyor (ölü kod)", satir, sutun)
+            for ad, satir, sutun in tanimlar if ad not in cagrilar
+        )
+        bulgular.extend(_bulgu("K004", mesaj, k.lineno, k.col_offset) for mesaj, k in tekrar_eden_bloklar(alt_agaclar))
+        bulgular.sort(key=lambda b: (b.satir, b.sutun))
+        toplam_satir = metrikler["Toplam Satır"]
+        metrikler = dict(metrikler)
+        metrikler["Yorum Oranı"] = metrikler["Yorum Satırı"] / toplam_satir * 100 if toplam_satir else 0
+        metrikler["Kod Satırı Oranı"] = metrikler["Boş Satır"] / toplam_satir * 100 if toplam_satir else 0
+        seviye = metrikler["Karmaşıklık Seviyesi"]
+        metrikler["Karmaşıklık Ortalama"] = karmasiklik_toplami / seviye if seviye else 0
+        return {
+            "Metrikler": metrikler,
+            "Kokular": [b.mesaj for b in bulgular if b.kategori == "koku"],
+            "Güvenlik": [b.mesaj for b in bulgular if b.kategori == "guvenlik"],
+            "Bulgular": bulgular,
+            "Blok Sayısı": len(bloklar),
+            "Yeniden Analiz": yeniden,
+            "Süre": sure,
+        }
+def _bulgu(kimlik: str, mesaj: str, satir: int, sutun: int) -> Bulgu:
+    return Bulgu(kimlik, KURAL_KAYDI[kimlik].kategori, mesaj, satir, sutun)
+class ArkaPlanAnalizcisi:
+    """Analizi arka plandaki bir iş parçacığında çalıştırır ve sonucu Tk olay döngüsüne iletir.
+
+    Yalnızca en son gönderilen kod analiz edilir; araya giren düzenlemeler birleştirilir. Sonuçlar
+    Tk'nin after döngüsünde okunduğundan geri_cagir her zaman ana iş parçacığında çalışır.
+    """
+    def __init__(self, tk_kok, geri_cagir, analizci: ArtimliAnalizci = None, yoklama_ms: int = 50):
+        self.tk_kok = tk_kok
+        self.geri_cagir = geri_cagir
+        self.analizci = analizci or ArtimliAnalizci()
+        self.yoklama_ms = yoklama_ms
+        self._istek = None
+        self._kosul = threading.Condition()
+        self._sonuclar = queue.Queue()
+        threading.Thread(target=self._calis, daemon=True).start()
+        self.tk_kok.after(self.yoklama_ms, self._sonuclari_aktar)
+    def gonder(self, kod: str):
+        with self._kosul:
+            self._istek = kod
+            self._kosul.notify()
+    def _calis(self):
+        while True:
+            with self._kosul:
+                while self._istek is None:
+                    self._kosul.wait()
+                kod, self._istek = self._istek, None
+            try:
+                self._sonuclar.put(self.analizci.analiz_et(kod))
+            except SyntaxError as e:
+                self._sonuclar.put({"Hata": f"Syntax hatası (satır {e.lineno}): {e.msg}"})
+            except Exception as e:
+                # Beklenmeyen hata iş parçacığını sonlandırmaz; sonraki düzenlemeler analiz edilmeye devam eder
+                self._sonuclar.put({"Hata": f"{type(e).__name__}: {e}"})
+    def _sonuclari_aktar(self):
+        sonuc = None
+        while not self._sonuclar.empty():
+            sonuc = self._sonuclar.get_nowait()
+        if sonuc is not None:
+            self.geri_cagir(sonuc)
+        self.tk_kok.after(self.yoklama_ms, self._sonuclari_aktar)
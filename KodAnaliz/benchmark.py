@@ -0,0 +1,491 @@
+import ast
+import json
+import os
+import random
+import sys
+import time
+from contextlib import contextmanager
+import analiz
+# Sentetik Kod Üretimi
+def _rastgele_ad(rastgele) -> str:
+    return "".join(rastgele.choice("abcdefghijklmnoprstuvyz") for _ in range(rastgele.randint(4, 9)))
+def sentetik_modul_uret(satir_sayisi: int, tohum: int = 0, rastgele_adlar: bool = False, ic_ice: int = 0) -> str:
+    """Yaklaşık verilen satır sayısında, fonksiyon ve sınıflardan oluşan geçerli bir Python modülü üretir.
+
+    rastgele_adlar verilirse fonksiyon, sınıf ve değişken adları tohuma göre rastgele seçilir; böylece
+    farklı tohumlarla üretilen modüllerin token kümeleri birbirinden ayrışır. ic_ice, fonksiyon
+    gövdelerindeki döngülerin kaç if seviyesi içine yerleştirileceğidir.
+    """
+    rastgele = random.Random(tohum)
+    satirlar = ["import os", "import sys", "# Sentetik modül", ""]
+    i = 0
+    onceki = None
+    while len(satirlar) < satir_sayisi:
+        if rastgele_adlar:
+            fonksiyon, sinif, degisken = (_rastgele_ad(rastgele) for _ in range(3))
+            onceki = onceki or fonksiyon
+        else:
+            fonksiyon, onceki, sinif, degisken = f"fonksiyon_{i}", f"fonksiyon_{max(i - 1, 0)}", f"Sinif{i}", "toplam"
+        if i % 5 == 4:
+            satirlar += [
+                f"class {sinif}:",
+                f"    def metot_{i}(self, deger):",
+                f"        return deger * {rastgele.randint(2, 99)}",
+                "",
+            ]
+        else:
+            satirlar += [
+                f"def {fonksiyon}(a, b):",
+                f"    # fonksiyon {i}",
+                f"    {degisken} = a + b",
+            ]
+            satirlar += [f"    {'    ' * d}if a > {-d - 1}:" for d in range(ic_ice)]
+            girinti = "    " * ic_ice
+            satirlar += [
+                f"    {girinti}for j in range({rastgele.randint(2, 50)}):",
+                f"        {girinti}if j % {rastgele.randint(2, 9)} == 0:",
+                f"            {girinti}{degisken} += j",
+                f"    while {degisken} > {rastgele.randint(100, 999)}:",
+                f"        {degisken} -= 1",
+                f"    print(\"sonuç {i}\", {degisken})",
+                f"    return {onceki}({degisken}, b) if {degisken} < 0 else {degisken}",
+                "",
+            ]
+            onceki = fonksiyon
+        i += 1
+    return "\n".join(satirlar) + "\n"
+# Ayrıştırma Sayacı
+@contextmanager
+def ayristirma_sayaci():
+    """Blok içindeki ast.parse çağrılarını sayar; sayaç sözlüğünün 'adet' anahtarı okunur."""
+    sayac = {"adet": 0}
+    orijinal = ast.parse
+    def sayan_parse(*args, **kwargs):
+        sayac["adet"] += 1
+        return orijinal(*args, **kwargs)
+    ast.parse = sayan_parse
+    try:
+        yield sayac
+    finally:
+        ast.parse = orijinal
+def _sure_olc(fonksiyon, tekrar: int) -> float:
+    baslangic = time.perf_counter()
+    for _ in range(tekrar):
+        fonksiyon()
+    return (time.perf_counter() - baslangic) / tekrar
+# 1. Benzerlik Ayrıştırma Maliyeti
+def benzerlik_benchmark(boyutlar=(100, 1000, 5000), tekrar: int = 3):
+    """kod_benzerlik_hesapla çağrısı başına ayrıştırma sayısını ve iki tekil ayrıştırmaya göre maliyetini ölçer."""
+    print(f"{'Satır':>8} {'Parse/çağrı':>12} {'Benzerlik (ms)':>15} {'2x parse (ms)':>14} {'Oran':>6}")
+    for boyut in boyutlar:
+        kod1 = sentetik_modul_uret(boyut, tohum=1)
+        kod2 = sentetik_modul_uret(boyut, tohum=2)
+        with ayristirma_sayaci() as sayac:
+            analiz.kod_benzerlik_hesapla(kod1, kod2)
+        benzerlik_suresi = _sure_olc(lambda: analiz.kod_benzerlik_hesapla(kod1, kod2), tekrar)
+        parse_suresi = _sure_olc(lambda: (ast.parse(kod1), ast.parse(kod2)), tekrar)
+        print(f"{boyut:>8} {sayac['adet']:>12} {benzerlik_suresi * 1000:>15.1f} {parse_suresi * 1000:>14.1f} {benzerlik_suresi / parse_suresi:>6.2f}")
+# 2. LSH Geri Çağırma Oranı
+def _kodu_boz(kod: str, rastgele, oran: float = 0.1) -> str:
+    """Satırların bir kısmını silerek ve kopyalayarak kodun yakın bir kopyasını üretir; sözdizimi korunur."""
+    satirlar = kod.split("\n")
+    for _ in range(int(len(satirlar) * oran)):
+        i = rastgele.randrange(len(satirlar))
+        if satirlar[i].startswith("    print(") or satirlar[i].startswith("    # "):
+            satirlar[i] = satirlar[i] + "\n" + satirlar[i] if rastgele.random() < 0.5 else "    pass"
+    return "\n".join(satirlar)
+def lsh_benchmark(dosya_sayisi: int = 400, kopya_orani: float = 0.25, esik: float = 70, satir: int = 120):
+    """Sentetik korpusta LSH adaylarının, tam çift-çift token benzerliği eşiği aşan çiftleri bulma oranını ölçer."""
+    import numpy as np
+    import korpus
+    from lsh_indeksi import LSHIndeksi
+    rastgele = random.Random(0)
+    kodlar = []
+    for i in range(dosya_sayisi):
+        if kodlar and rastgele.random() < kopya_orani:
+            kodlar.append(_kodu_boz(rastgele.choice(kodlar), rastgele))
+        else:
+            kodlar.append(sentetik_modul_uret(satir, tohum=i, rastgele_adlar=True))
+    tam = korpus.korpus_benzerlik_hesapla(kodlar)["Token Benzerliği"]
+    gercek = {(i, j) for i, j in zip(*np.nonzero(np.triu(tam >= esik, k=1)))}
+    indeks = LSHIndeksi()
+    baslangic = time.perf_counter()
+    for i, kod in enumerate(kodlar):
+        indeks.ekle(i, kod)
+    ekleme_suresi = time.perf_counter() - baslangic
+    adaylar = set()
+    baslangic = time.perf_counter()
+    for i, kod in enumerate(kodlar):
+        adaylar.update((min(i, j), max(i, j)) for j, _ in indeks.sorgula(kod) if j != i)
+    sorgu_suresi = (time.perf_counter() - baslangic) / len(kodlar)
+    geri_cagirma = len(gercek & adaylar) / len(gercek) if gercek else 1.0
+    toplam_cift = dosya_sayisi * (dosya_sayisi - 1) // 2
+    print(f"Dosya: {dosya_sayisi}, eşik: %{esik}, gerçek çift: {len(gercek)}, aday çift: {len(adaylar)} ({len(adaylar) / toplam_cift:.2%} / tüm çiftler)")
+    print(f"Geri çağırma: {geri_cagirma:.3f}, ekleme: {ekleme_suresi / len(kodlar) * 1000:.2f} ms/dosya, sorgu: {sorgu_suresi * 1000:.2f} ms")
+# 3. Kod Kokusu Ölçeklenmesi
+def koku_benchmark(boyutlar=(1000, 10000, 100000)):
+    """kod_kokularini_tespit_et süresinin satır sayısıyla doğrusal arttığını gösterir."""
+    print(f"{'Satır':>8} {'Süre (ms)':>10} {'µs/satır':>9} {'Koku':>7}")
+    for boyut in boyutlar:
+        kod = sentetik_modul_uret(boyut)
+        baslangic = time.perf_counter()
+        kokular = analiz.kod_kokularini_tespit_et(kod)
+        sure = time.perf_counter() - baslangic
+        print(f"{boyut:>8} {sure * 1000:>10.1f} {sure / boyut * 1e6:>9.2f} {len(kokular):>7}")
+# 4. Metrik Üretimi
+def metrik_benchmark(boyutlar=(100, 1000, 10000), tekrar: int = 3):
+    """metrik_uret çağrısı başına ayrıştırma sayısını ve süresini ölçer."""
+    print(f"{'Satır':>8} {'Parse/çağrı':>12} {'Metrik (ms)':>12} {'1x parse (ms)':>14}")
+    for boyut in boyutlar:
+        kod = sentetik_modul_uret(boyut)
+        with ayristirma_sayaci() as sayac:
+            analiz.metrik_uret(kod)
+        metrik_suresi = _sure_olc(lambda: analiz.metrik_uret(kod), tekrar)
+        parse_suresi = _sure_olc(lambda: ast.parse(kod), tekrar)
+        print(f"{boyut:>8} {sayac['adet']:>12} {metrik_suresi * 1000:>12.1f} {parse_suresi * 1000:>14.1f}")
+# 5. Toplu Analiz Paralel Ölçeklenmesi
+def paralel_benchmark(dosya_sayisi: int = 200, satir: int = 400, is_sayilari=None):
+    """toplu_analiz'in 1'den çekirdek sayısına kadar işçi sayısıyla hızlanmasını ölçer."""
+    import tempfile
+    from toplu_analiz import toplu_analiz
+    is_sayilari = is_sayilari or sorted({1, 2, 4, 8, os.cpu_count() or 1})
+    with tempfile.TemporaryDirectory() as dizin:
+        for i in range(dosya_sayisi):
+            with open(os.path.join(dizin, f"modul_{i}.py"), "w", encoding="utf-8") as f:
+                f.write(sentetik_modul_uret(satir, tohum=i))
+        print(f"{'İşçi':>5} {'Süre (sn)':>10} {'Dosya/sn':>9} {'Hızlanma':>9}")
+        ilk_sure = None
+        for is_sayisi in is_sayilari:
+            baslangic = time.perf_counter()
+            adet = sum(1 for _ in toplu_analiz(dizin, is_sayisi))
+            sure = time.perf_counter() - baslangic
+            ilk_sure = ilk_sure or sure
+            print(f"{is_sayisi:>5} {sure:>10.2f} {adet / sure:>9.1f} {ilk_sure / sure:>9.2f}")
+# 6. Soğuk Başlangıç (İçe Aktarma) Süresi
+# Modül bölünmeden önce proje.py'nin en üstte yüklediği bağımlılıklar
+ESKI_BAGIMLILIKLAR = (
+    "tkinter, sklearn.feature_extraction.text, sklearn.metrics.pairwise, graphviz, radon.metrics, "
+    "radon.complexity, radon.raw, coverage, matplotlib.pyplot, seaborn, numpy, tqdm"
+)
+def ice_aktarma_benchmark(tekrar: int = 3):
+    """Her modülü yeni bir yorumlayıcıda içe aktararak soğuk başlangıç süresini ölçer."""
+    import subprocess
+    import sys
+    dizin = os.path.dirname(os.path.abspath(__file__))
+    olcumler = [
+        ("Önceki proje.py bağımlılıkları", f"import {ESKI_BAGIMLILIKLAR}"),
+        ("analiz", "import analiz"),
+        ("cli", "import cli"),
+        ("toplu_analiz", "import toplu_analiz"),
+        ("proje (arayüz)", "import proje"),
+        ("analiz + metrik_uret çağrısı", "import analiz; analiz.metrik_uret('x = 1')"),
+    ]
+    print(f"{'İçe aktarma':<32} {'Süre (ms)':>10}")
+    for ad, komut in olcumler:
+        kod = f"import time; t = time.perf_counter(); {komut}; print(time.perf_counter() - t)"
+        sureler = [
+            float(subprocess.run([sys.executable, "-c", kod], cwd=dizin, capture_output=True, text=True, check=True).stdout)
+            for _ in range(tekrar)
+        ]
+        print(f"{ad:<32} {min(sureler) * 1000:>10.1f}")
+# 7. Çağrı Grafı Boyutu
+def graf_benchmark(boyutlar=(1000, 10000), tekrar: int = 3):
+    """AST grafındaki düğüm sayısını çağrı grafınınkiyle ve DOT üretim süresiyle karşılaştırır."""
+    from kod_grafi import KodGrafi
+    print(f"{'Satır':>8} {'AST düğümü':>11} {'Tanım':>7} {'Katlanmış':>10} {'DOT (ms)':>10}")
+    for satir in boyutlar:
+        kod = sentetik_modul_uret(satir)
+        ast_dugumu = sum(1 for _ in ast.walk(ast.parse(kod)))
+        graf = KodGrafi(kod)
+        katlanmis = len(graf.alt_graf(derinlik=1)["Düğümler"])
+        sure = _sure_olc(lambda: KodGrafi(kod).dot("Kod"), tekrar)
+        print(f"{satir:>8} {ast_dugumu:>11} {len(graf.tanimlar):>7} {katlanmis:>10} {sure * 1000:>10.1f}")
+# 8. Token Modeli ile Korpus Sorgusu
+def token_modeli_benchmark(dosya_sayisi: int = 500, satir: int = 200):
+    """Yeni bir kodun korpusa token benzerliğini çift başına CountVectorizer ile ve eğitilmiş modelle karşılaştırır."""
+    from sklearn.feature_extraction.text import CountVectorizer
+    from sklearn.metrics.pairwise import cosine_similarity
+    from token_modeli import TokenModeli
+    kodlar = [sentetik_modul_uret(satir, tohum=i, rastgele_adlar=True) for i in range(dosya_sayisi)]
+    yeni = sentetik_modul_uret(satir, tohum=dosya_sayisi, rastgele_adlar=True)
+    baslangic = time.perf_counter()
+    for kod in kodlar:
+        cosine_similarity(CountVectorizer().fit_transform([yeni, kod]))[0][1]
+    cift_basina = time.perf_counter() - baslangic
+    baslangic = time.perf_counter()
+    model = TokenModeli().egit(range(dosya_sayisi), kodlar)
+    egitim = time.perf_counter() - baslangic
+    sorgu = _sure_olc(lambda: model.benzerlikler(yeni), 3)
+    print(f"{dosya_sayisi} dosya: çift başına {cift_basina * 1000:.0f} ms, model eğitimi {egitim * 1000:.0f} ms (bir kez), model sorgusu {sorgu * 1000:.1f} ms")
+# 9. Klon Tespiti Ölçeklenmesi
+def klon_benchmark(dosya_sayilari=(50, 200, 800), satir: int = 200):
+    """Dosya sayısı arttıkça klon indeksinin süresinin doğrusala yakın kaldığını gösterir."""
+    from klon import KlonIndeksi
+    print(f"{'Dosya':>7} {'Satır':>9} {'Süre (s)':>9} {'Grup':>7}")
+    for dosya_sayisi in dosya_sayilari:
+        kodlar = [sentetik_modul_uret(satir, tohum=i, rastgele_adlar=True) for i in range(dosya_sayisi)]
+        baslangic = time.perf_counter()
+        indeks = KlonIndeksi()
+        for i, kod in enumerate(kodlar):
+            indeks.ekle(i, kod)
+        gruplar = indeks.klonlar()
+        print(f"{dosya_sayisi:>7} {dosya_sayisi * satir:>9} {time.perf_counter() - baslangic:>9.2f} {len(gruplar):>7}")
+# 10. Giriş Noktası Ölçümleri ve Taban Karşılaştırması
+def _test_kodu_uret(kod: str) -> str:
+    """Sentetik modülün üst düzey fonksiyonlarını çağıran, çıktısı susturulmuş bir test kodu üretir."""
+    adlar = [node.name for node in ast.parse(kod).body if isinstance(node, ast.FunctionDef)]
+    return "\n".join([
+        "import contextlib, io",
+        "import proje_kod",
+        "with contextlib.redirect_stdout(io.StringIO()):",
+        f"    for ad in {adlar!r}:",
+        "        getattr(proje_kod, ad)(1, 2)",
+    ]) + "\n"
+def _graf_olustur(girdi: dict):
+    import gorsel
+    return gorsel.kodu_graf_olustur(girdi["kod"], os.path.join(girdi["dizin"], "benchmark"), kip="cagri", goster=False)
+GIRIS_NOKTALARI = [
+    ("kod_benzerlik_hesapla", lambda girdi: analiz.kod_benzerlik_hesapla(girdi["kod"], girdi["diger"])),
+    ("metrik_uret", lambda girdi: analiz.metrik_uret(girdi["kod"])),
+    ("kod_kokularini_tespit_et", lambda girdi: analiz.kod_kokularini_tespit_et(girdi["kod"])),
+    ("kod_guvenligi_ve_hata_tahmini", lambda girdi: analiz.kod_guvenligi_ve_hata_tahmini(girdi["kod"])),
+    # Kapsama işçi süreçte çalışır; bellek ve ayrıştırma sayısı yalnızca ana süreç tarafını gösterir
+    ("cover_orani_hesapla", lambda girdi: analiz.cover_orani_hesapla(girdi["kod"], girdi["test"])),
+    ("kodu_graf_olustur", _graf_olustur),
+]
+def giris_noktasini_olc(fonksiyon, girdi: dict, tekrar: int = 3) -> dict:
+    """Bir ısınma çalıştırmasından sonra en kısa duvar süresini, tracemalloc tepe belleğini ve ayrıştırma sayısını ölçer.
+
+    Profil açıksa (KODANALIZ_PROFIL) süre ölçümü sırasında biriken aşama süreleri çağrı başına ortalanarak eklenir.
+    """
+    import tracemalloc
+    import profil
+    # Isınma: tembel içe aktarmalar ve havuz kurulumu ölçüme karışmaz
+    fonksiyon(girdi)
+    profil.sifirla()
+    sureler = []
+    for _ in range(tekrar):
+        baslangic = time.perf_counter()
+        fonksiyon(girdi)
+        sureler.append(time.perf_counter() - baslangic)
+    asamalar = {ad: kayit["Süre"] / tekrar for ad, kayit in profil.asama_raporu().items()}
+    with ayristirma_sayaci() as sayac:
+        tracemalloc.start()
+        try:
+            fonksiyon(girdi)
+            _, tepe = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+    sonuc = {"Süre": min(sureler), "Bellek": tepe, "Ayrıştırma": sayac["adet"]}
+    if profil.profil_acik_mi():
+        sonuc["Aşamalar"] = asamalar
+    return sonuc
+def olcumleri_calistir(boyutlar=(100, 1000, 5000), tekrar: int = 3, ic_ice: int = 0, girisler=None) -> dict:
+    """Her giriş noktasını her boyutta ölçer; sonuç anahtarları "ad@satır" biçimindedir."""
+    import platform
+    import tempfile
+    sonuclar = {}
+    print(f"{'Giriş noktası':<32} {'Satır':>7} {'Süre (ms)':>10} {'Tepe bellek (KB)':>17} {'Parse':>6}")
+    with tempfile.TemporaryDirectory() as dizin:
+        for boyut in boyutlar:
+            kod = sentetik_modul_uret(boyut, tohum=1, ic_ice=ic_ice)
+            girdi = {"kod": kod, "diger": sentetik_modul_uret(boyut, tohum=2, ic_ice=ic_ice), "test": _test_kodu_uret(kod), "dizin": dizin}
+            for ad, fonksiyon in GIRIS_NOKTALARI:
+                if girisler and ad not in girisler:
+                    continue
+                olcum = giris_noktasini_olc(fonksiyon, girdi, tekrar)
+                sonuclar[f"{ad}@{boyut}"] = olcum
+                print(f"{ad:<32} {boyut:>7} {olcum['Süre'] * 1000:>10.1f} {olcum['Bellek'] / 1024:>17.0f} {olcum['Ayrıştırma']:>6}")
+                for asama_adi, sure in olcum.get("Aşamalar", {}).items():
+                    print(f"    {asama_adi:<44} {sure * 1000:>10.1f}")
+    return {
+        "Ortam": {"Python": platform.python_version(), "Platform": platform.platform(), "Analiz Sürümü": analiz.ANALIZ_SURUMU, "İç İçe": ic_ice, "Tekrar": tekrar},
+        "Sonuçlar": sonuclar,
+    }
+def taban_kaydet(olcumler: dict, yol: str):
+    with open(yol, "w", encoding="utf-8") as f:
+        json.dump(olcumler, f, ensure_ascii=False, indent=2)
+def taban_karsilastir(olcumler: dict, taban: dict, tolerans: float = 0.25, en_az_sure: float = 0.005, en_az_bellek: int = 64 * 1024) -> list:
+    """Tabana göre gerilemeleri açıklayan mesajların listesini döndürür; boş liste gerileme olmadığını gösterir.
+
+    Süre ve bellek tolerans oranını ve küçük ölçümlerdeki gürültüye karşı mutlak alt sınırları birlikte
+    aşarsa, ayrıştırma sayısı ise herhangi bir artışta gerileme sayılır.
+    """
+    gerilemeler = []
+    for anahtar, olcum in olcumler["Sonuçlar"].items():
+        onceki = taban["Sonuçlar"].get(anahtar)
+        if onceki is None:
+            continue
+        if olcum["Süre"] > onceki["Süre"] * (1 + tolerans) and olcum["Süre"] - onceki["Süre"] > en_az_sure:
+            gerilemeler.append(f"{anahtar}: süre {onceki['Süre'] * 1000:.1f} ms -> {olcum['Süre'] * 1000:.1f} ms")
+        if olcum["Bellek"] > onceki["Bellek"] * (1 + tolerans) and olcum["Bellek"] - onceki["Bellek"] > en_az_bellek:
+            gerilemeler.append(f"{anahtar}: tepe bellek {onceki['Bellek'] / 1024:.0f} KB -> {olcum['Bellek'] / 1024:.0f} KB")
+        if olcum["Ayrıştırma"] > onceki["Ayrıştırma"]:
+            gerilemeler.append(f"{anahtar}: ayrıştırma sayısı {onceki['Ayrıştırma']} -> {olcum['Ayrıştırma']}")
+    return gerilemeler
+# 11. Özellik Deposu Boyutu ve Açılış Süresi
+def ozellik_deposu_benchmark(dosya_sayilari=(1000, 10000, 100000), ornek: int = 200, satir: int = 100):
+    """Özellik deposunu pickle'lanmış dize listeleriyle disk boyutu ve açılış süresinde karşılaştırır.
+
+    Analiz maliyeti ölçülen şey olmadığından ornek kadar sentetik modülün özellikleri tekrarlanarak
+    büyük korpuslar oluşturulur.
+    """
+    import pickle
+    import tempfile
+    from ozellik_deposu import OzellikDeposu, OzellikDeposuYazici, dosya_ozellikleri
+
+    def _boyut(dizin):
+        return sum(os.path.getsize(os.path.join(dizin, ad)) for ad in os.listdir(dizin))
+    ozellikler = [dosya_ozellikleri(sentetik_modul_uret(satir, tohum=i, rastgele_adlar=True)) for i in range(ornek)]
+    print(f"{'Dosya':>7} {'Yazma (s)':>10} {'Depo (MB)':>10} {'Pickle (MB)':>12} {'Açılış (ms)':>12} {'Matris (ms)':>12} {'Pickle yükleme (ms)':>20}")
+    for dosya_sayisi in dosya_sayilari:
+        with tempfile.TemporaryDirectory() as dizin:
+            depo_dizini = os.path.join(dizin, "depo")
+            baslangic = time.perf_counter()
+            with OzellikDeposuYazici(depo_dizini) as yazici:
+                for i in range(dosya_sayisi):
+                    yazici.ozellikleri_ekle(f"dosya_{i}.py", ozellikler[i % ornek])
+            yazma = time.perf_counter() - baslangic
+            pickle_yolu = os.path.join(dizin, "ozellikler.pickle")
+            with open(pickle_yolu, "wb") as f:
+                # Kayıtlar ayrı ayrı yazılır; tek listede tekrar eden nesneler pickle belleğinde paylaşılırdı
+                for i in range(dosya_sayisi):
+                    pickle.dump(ozellikler[i % ornek], f, protocol=pickle.HIGHEST_PROTOCOL)
+            baslangic = time.perf_counter()
+            depo = OzellikDeposu(depo_dizini)
+            acilis = time.perf_counter() - baslangic
+            baslangic = time.perf_counter()
+            for alan in ("degiskenler", "yapi_ozetleri"):
+                depo.kume_matrisi(alan)
+            matris = time.perf_counter() - baslangic
+            baslangic = time.perf_counter()
+            with open(pickle_yolu, "rb") as f:
+                kayitlar = [pickle.load(f) for _ in range(dosya_sayisi)]
+            pickle_yukleme = time.perf_counter() - baslangic
+            print(f"{dosya_sayisi:>7} {yazma:>10.2f} {_boyut(depo_dizini) / 2 ** 20:>10.1f} {os.path.getsize(pickle_yolu) / 2 ** 20:>12.1f} "
+                  f"{acilis * 1000:>12.1f} {matris * 1000:>12.1f} {pickle_yukleme * 1000:>20.0f}")
+            del depo, kayitlar
+# 12. Proje İndeksi Ölçeklenmesi
+def sentetik_proje_uret(kok: str, modul_sayisi: int, paket_boyutu: int = 100, tohum: int = 0):
+    """Paketlere bölünmüş, birbirini mutlak, göreli ve takma adla içe aktaran modüller yazar."""
+    rastgele = random.Random(tohum)
+    for i in range(modul_sayisi):
+        paket = os.path.join(kok, "proje", f"paket_{i // paket_boyutu}")
+        if i % paket_boyutu == 0:
+            os.makedirs(paket, exist_ok=True)
+            open(os.path.join(kok, "proje", "__init__.py"), "a").close()
+            with open(os.path.join(paket, "__init__.py"), "w") as f:
+                f.write(f"from .modul_{i} import fonksiyon_0\n")
+        satirlar, cagrilar = [], []
+        for j, hedef in enumerate(rastgele.sample(range(i), min(i, 3))):
+            hedef_paket = f"paket_{hedef // paket_boyutu}"
+            if hedef // paket_boyutu == i // paket_boyutu:
+                satirlar.append(f"from .modul_{hedef} import fonksiyon_{j} as f{j}")
+                cagrilar.append(f"f{j}()")
+            elif j % 2:
+                satirlar.append(f"import proje.{hedef_paket}.modul_{hedef} as m{j}")
+                cagrilar.append(f"m{j}.fonksiyon_{j}()")
+            else:
+                satirlar.append(f"from proje.{hedef_paket} import modul_{hedef}")
+                cagrilar.append(f"modul_{hedef}.fonksiyon_{j}()")
+        for j in range(5):
+            satirlar += [f"def fonksiyon_{j}():", *(f"    {c}" for c in (cagrilar if j == 4 else cagrilar[j:j + 1])), "    return 0"]
+        if i == modul_sayisi - 1:
+            satirlar += ["if __name__ == '__main__':", "    fonksiyon_4()"]
+        with open(os.path.join(paket, f"modul_{i}.py"), "w") as f:
+            f.write("\n".join(satirlar) + "\n")
+def proje_indeksi_benchmark(modul_sayilari=(1000, 10000), is_sayilari=(1, None)):
+    """İndeks kurulumunun (özetleme + çözüm) modül sayısıyla doğrusal ölçeklendiğini gösterir."""
+    import tempfile
+    from proje_indeksi import ProjeIndeksi
+    print(f"{'Modül':>7} {'İş':>4} {'Süre (s)':>9} {'ms/modül':>9} {'Ulaşılabilir':>13} {'Ölü kod':>8}")
+    for modul_sayisi in modul_sayilari:
+        with tempfile.TemporaryDirectory() as kok:
+            sentetik_proje_uret(kok, modul_sayisi)
+            for is_sayisi in is_sayilari:
+                baslangic = time.perf_counter()
+                indeks = ProjeIndeksi.olustur(kok, is_sayisi)
+                olu_kod = indeks.olu_kod()
+                indeks.baglasim()
+                sure = time.perf_counter() - baslangic
+                print(f"{modul_sayisi:>7} {is_sayisi or os.cpu_count():>4} {sure:>9.2f} {sure / modul_sayisi * 1000:>9.3f} {len(indeks.ulasilabilir):>13} {len(olu_kod):>8}")
+# 13. Toplu Grafik Çizimi
+def rapor_benchmark(dosya_sayisi: int = 40, satir: int = 200, is_sayilari=(1, None)):
+    """Grafik başına yeni figür açmayı yeniden kullanılan figürle ve paralel rapor üretimini grafik/sn olarak karşılaştırır."""
+    import tempfile
+    import gorsel
+    import rapor
+    from analiz import metrik_uret
+    # GrafikCizici Agg arka ucunu pyplot yüklenmeden önce seçer
+    cizici = rapor.GrafikCizici()
+    import matplotlib.pyplot as plt
+    metrikler = [{ad: float(deger) for ad, deger in metrik_uret(sentetik_modul_uret(satir, tohum=i)).items()} for i in range(dosya_sayisi)]
+    with tempfile.TemporaryDirectory() as dizin:
+        cizici.ciz("metrik", metrikler[0], os.path.join(dizin, "isinma.png"))
+        baslangic = time.perf_counter()
+        for i, veri in enumerate(metrikler):
+            figur, ax = plt.subplots(figsize=rapor._BOYUTLAR["metrik"])
+            gorsel.grafik_ciz(list(veri.keys()), list(veri.values()), "Kod Metrikleri", "Metrikler", "Değerler", ax=ax)
+            figur.savefig(os.path.join(dizin, f"yeni_{i}.png"), dpi=cizici.dpi)
+            plt.close(figur)
+        yeni_figur = time.perf_counter() - baslangic
+        baslangic = time.perf_counter()
+        for i, veri in enumerate(metrikler):
+            cizici.ciz("metrik", veri, os.path.join(dizin, f"ortak_{i}.png"))
+        ortak_figur = time.perf_counter() - baslangic
+        print(f"Metrik grafiği: yeni figür {dosya_sayisi / yeni_figur:.1f} grafik/sn, yeniden kullanılan figür {dosya_sayisi / ortak_figur:.1f} grafik/sn")
+        kok = os.path.join(dizin, "kaynak")
+        os.makedirs(kok)
+        for i in range(dosya_sayisi):
+            with open(os.path.join(kok, f"modul_{i}.py"), "w", encoding="utf-8") as f:
+                f.write(sentetik_modul_uret(satir, tohum=i, rastgele_adlar=True))
+        print(f"{'İş':>4} {'Dosya':>6} {'Grafik':>7} {'Süre (s)':>9} {'Grafik/sn':>10} {'Çizim grafik/sn':>16}")
+        for is_sayisi in is_sayilari:
+            ozet = rapor.rapor_olustur(kok, os.path.join(dizin, f"rapor_{is_sayisi}"), is_sayisi=is_sayisi)
+            print(f"{ozet['İş Sayısı']:>4} {ozet['Dosya Sayısı']:>6} {ozet['Grafik Sayısı']:>7} {ozet['Süre']:>9.2f} {ozet['Grafik/sn']:>10.2f} {ozet['Çizim Grafik/sn']:>16.2f}")
+    plt.close("all")
+def bolumleri_calistir():
+    ice_aktarma_benchmark()
+    benzerlik_benchmark()
+    lsh_benchmark()
+    koku_benchmark()
+    metrik_benchmark()
+    paralel_benchmark()
+    graf_benchmark()
+    token_modeli_benchmark()
+    klon_benchmark()
+    ozellik_deposu_benchmark()
+    proje_indeksi_benchmark()
+    rapor_benchmark()
+def main(argv=None):
+    import argparse
+    parser = argparse.ArgumentParser(description="Numaralı benchmark bölümlerini ya da giriş noktası ölçümlerini çalıştırır.")
+    parser.add_argument("komut", nargs="?", choices=["bolumler", "olc"], default="bolumler")
+    parser.add_argument("--boyutlar", type=int, nargs="+", default=[100, 1000, 5000], help="Sentetik modül satır sayıları")
+    parser.add_argument("--tekrar", type=int, default=3)
+    parser.add_argument("--ic-ice", type=int, default=0, help="Fonksiyon gövdelerindeki iç içe if seviyesi")
+    parser.add_argument("--giris", action="append", help="Yalnızca verilen giriş noktalarını ölç (tekrarlanabilir)")
+    parser.add_argument("--profil", action="store_true", help="Aşama sürelerini de raporla (KODANALIZ_PROFIL=1 ile aynı)")
+    parser.add_argument("--kaydet", help="Ölçümleri taban olarak JSON dosyasına yaz")
+    parser.add_argument("--karsilastir", help="Ölçümleri bu taban dosyasıyla karşılaştır; gerileme varsa çıkış kodu 1 olur")
+    parser.add_argument("--tolerans", type=float, default=0.25, help="Süre ve bellek için izin verilen göreli artış")
+    args = parser.parse_args(argv)
+    if args.komut == "bolumler":
+        bolumleri_calistir()
+        return
+    if args.profil:
+        import profil
+        profil.profil_ac()
+    olcumler = olcumleri_calistir(args.boyutlar, args.tekrar, args.ic_ice, args.giris)
+    if args.kaydet:
+        taban_kaydet(olcumler, args.kaydet)
+    if args.karsilastir:
+        with open(args.karsilastir, encoding="utf-8") as f:
+            gerilemeler = taban_karsilastir(olcumler, json.load(f), args.tolerans)
+        for gerileme in gerilemeler:
+            print(f"GERİLEME {gerileme}")
+        if gerilemeler:
+            sys.exit(1)
+        print("Tabana göre gerileme yok.")
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+import csv
+import json
+import sys
+from array import array
+# Makine Tarafından Okunabilir Çıktılar
+def jsonl_akisi(sonuclar, hedef):
+    """Her sonucu hazır olur olmaz hedef akışa tek satırlık JSON olarak yazar ve aynen geçirir.
+
+    Üreteç zincirinin bir halkası olduğundan sonuçlar bellekte biriktirilmez.
+    """
+    for sonuc in sonuclar:
+        hedef.write(json.dumps(sonuc, ensure_ascii=False, default=float))
+        hedef.write("\n")
+        hedef.flush()
+        yield sonuc
+def jsonl_oku(kaynak):
+    """JSONL akışındaki kayıtları sırayla üretir."""
+    for satir in kaynak:
+        if satir.strip():
+            yield json.loads(satir)
+class SutunluOzet:
+    """Dosya başına sayısal özet alanlarını sütun sütun sıkışık dizilerde (array('d')) biriktirir."""
+    def __init__(self):
+        self.dosyalar = []
+        self.sutunlar = {}
+    def __len__(self):
+        return len(self.dosyalar)
+    def ekle(self, sonuc: dict):
+        satir = {"Hatalı": 1.0 if "Hata" in sonuc else 0.0, "Süre": sonuc.get("Süre", 0.0)}
+        if "Hata" not in sonuc:
+            satir.update(sonuc["Metrikler"])
+            satir["Koku Sayısı"] = len(sonuc["Kokular"])
+            satir["Güvenlik Bulgusu"] = len(sonuc["Güvenlik"])
+        for ad in satir:
+            # Sonradan ortaya çıkan sütunlar önceki satırlar için NaN ile doldurulur
+            if ad not in self.sutunlar:
+                self.sutunlar[ad] = array("d", [float("nan")] * len(self.dosyalar))
+        for ad, sutun in self.sutunlar.items():
+            sutun.append(float(satir.get(ad, float("nan"))))
+        self.dosyalar.append(sonuc["Dosya"])
+    def akis(self, sonuclar):
+        """Sonuçları özete ekleyerek aynen geçirir."""
+        for sonuc in sonuclar:
+            self.ekle(sonuc)
+            yield sonuc
+    def csv_yaz(self, yol: str):
+        adlar = list(self.sutunlar)
+        with open(yol, "w", newline="", encoding="utf-8") as f:
+            yazici = csv.writer(f)
+            yazici.writerow(["Dosya"] + adlar)
+            for i, dosya in enumerate(self.dosyalar):
+                yazici.writerow([dosya] + [self.sutunlar[ad][i] for ad in adlar])
+    def npz_yaz(self, yol: str):
+        """Sütunları sıkıştırılmış NumPy dizileri olarak yazar; her sütun ayrı bir dizidir."""
+        import numpy as np
+        diziler = {ad: np.frombuffer(sutun, dtype=np.float64) for ad, sutun in self.sutunlar.items()}
+        np.savez_compressed(yol, Dosya=np.array(self.dosyalar), **diziler)
+def jsonl_hedefi_ac(yol: str):
+    """'-' için standart çıktıyı, aksi halde yazma kipinde açılmış dosyayı döndürür."""
+    return sys.stdout if yol == "-" else open(yol, "w", encoding="utf-8")
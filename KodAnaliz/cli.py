@@ -0,0 +1,108 @@
+import argparse
+import json
+import sys
+# Arayüzsüz Komut Satırı Giriş Noktası
+# Yalnızca hafif modüller içe aktarılır; her alt komut kendi bağımlılığını çalıştığı anda yükler
+import analiz
+def _oku(yol: str) -> str:
+    if yol == "-":
+        return sys.stdin.read()
+    with open(yol, encoding="utf-8") as f:
+        return f.read()
+def _yaz(kayit: dict):
+    print(json.dumps(kayit, ensure_ascii=False, default=float))
+def _dosya_basina(analiz_fonksiyonu, alan: str):
+    def calistir(args):
+        for yol in args.dosyalar:
+            _yaz({"Dosya": yol, alan: analiz_fonksiyonu(_oku(yol))})
+    return calistir
+def _benzerlik(args):
+    token_modeli = None
+    if args.model:
+        from token_modeli import TokenModeli
+        token_modeli = TokenModeli.yukle(args.model)
+    _yaz({"Dosya-1": args.dosya1, "Dosya-2": args.dosya2, "Benzerlik": analiz.kod_benzerlik_hesapla(_oku(args.dosya1), _oku(args.dosya2), token_modeli)})
+def _model_egit(args):
+    from token_modeli import TokenModeli
+    from toplu_analiz import python_dosyalarini_bul
+    yollar = list(python_dosyalarini_bul(args.kok))
+    def kodlar():
+        for yol in yollar:
+            with open(yol, encoding="utf-8", errors="replace") as f:
+                yield f.read()
+    TokenModeli(2 ** args.ozellik_biti).egit(yollar, kodlar()).kaydet(args.cikti)
+    _yaz({"Model": args.cikti, "Dosya Sayısı": len(yollar)})
+def _model_sorgula(args):
+    from token_modeli import TokenModeli
+    token_modeli = TokenModeli.yukle(args.model)
+    for yol in args.dosyalar:
+        _yaz({"Dosya": yol, "En Benzerler": token_modeli.en_benzerler(_oku(yol), args.k)})
+def _proje(args):
+    from proje_indeksi import ProjeIndeksi
+    indeks = ProjeIndeksi.olustur(args.kok, args.is_sayisi, args.giris)
+    _yaz({"Modül Sayısı": len(indeks.moduller), "Giriş Noktaları": indeks.giris_noktalari, "Ulaşılabilir": len(indeks.ulasilabilir)})
+    for hata in indeks.hatalar():
+        _yaz(hata)
+    for kayit in indeks.olu_kod():
+        _yaz({"Ölü Kod": kayit})
+    if args.baglasim:
+        for kayit in indeks.baglasim():
+            _yaz({"Bağlaşım": kayit})
+def _rapor(args):
+    from rapor import rapor_olustur
+    _yaz(rapor_olustur(args.kok, args.cikti, args.bicim, args.is_sayisi, args.dpi))
+def _toplu(args):
+    from toplu_analiz import main as toplu_main
+    toplu_main(args.arguman)
+def _servis(args):
+    from servis import main as servis_main
+    servis_main(args.arguman)
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="kodanaliz", description="Kod analizlerini arayüz açmadan çalıştırır; sonuçlar JSON satırları olarak yazılır.")
+    alt = parser.add_subparsers(dest="komut", required=True)
+    for komut, fonksiyon, alan, aciklama in [
+        ("metrik", analiz.metrik_uret, "Metrikler", "Radon tabanlı kod metrikleri"),
+        ("koku", analiz.kod_kokularini_tespit_et, "Kokular", "Kod kokusu tespiti"),
+        ("guvenlik", analiz.kod_guvenligi_ve_hata_tahmini, "Güvenlik", "Güvenlik ve hata tahmini"),
+    ]:
+        alt_parser = alt.add_parser(komut, help=aciklama)
+        alt_parser.add_argument("dosyalar", nargs="+", help="Analiz edilecek dosyalar ('-' standart girdi)")
+        alt_parser.set_defaults(calistir=_dosya_basina(fonksiyon, alan))
+    benzerlik_parser = alt.add_parser("benzerlik", help="İki dosyanın on boyutlu benzerliği")
+    benzerlik_parser.add_argument("dosya1")
+    benzerlik_parser.add_argument("dosya2")
+    benzerlik_parser.add_argument("--model", help="Token benzerliği için eğitilmiş token modeli (model-egit çıktısı)")
+    benzerlik_parser.set_defaults(calistir=_benzerlik)
+    egit_parser = alt.add_parser("model-egit", help="Dizindeki .py dosyalarıyla TF-IDF token modeli eğitir")
+    egit_parser.add_argument("kok")
+    egit_parser.add_argument("-o", "--cikti", default="token_modeli.pkl")
+    egit_parser.add_argument("--ozellik-biti", type=int, default=20, help="Özetlenmiş sözlük boyutu 2**N")
+    egit_parser.set_defaults(calistir=_model_egit)
+    sorgu_parser = alt.add_parser("model-sorgula", help="Dosyaları token modelindeki korpusa karşı sıralar")
+    sorgu_parser.add_argument("model")
+    sorgu_parser.add_argument("dosyalar", nargs="+")
+    sorgu_parser.add_argument("-k", type=int, default=10)
+    sorgu_parser.set_defaults(calistir=_model_sorgula)
+    proje_parser = alt.add_parser("proje", help="Proje geneli import çözümü, ölü kod ve modül bağlaşımı")
+    proje_parser.add_argument("kok")
+    proje_parser.add_argument("--giris", action="append", help="Giriş noktası modül adı (tekrarlanabilir; verilmezse otomatik bulunur)")
+    proje_parser.add_argument("-j", "--is-sayisi", type=int, default=None)
+    proje_parser.add_argument("--baglasim", action="store_true", help="Modül başına fan-in/fan-out da yazılır")
+    proje_parser.set_defaults(calistir=_proje)
+    rapor_parser = alt.add_parser("rapor", help="Dosya başına grafikleri paralel çizer ve tek bir HTML raporu yazar")
+    rapor_parser.add_argument("kok")
+    rapor_parser.add_argument("-o", "--cikti", default="rapor", help="Grafiklerin ve index.html'in yazılacağı dizin")
+    rapor_parser.add_argument("--bicim", choices=["png", "svg"], default="png")
+    rapor_parser.add_argument("-j", "--is-sayisi", type=int, default=None)
+    rapor_parser.add_argument("--dpi", type=int, default=80)
+    rapor_parser.set_defaults(calistir=_rapor)
+    toplu_parser = alt.add_parser("toplu", help="Dizin genelinde paralel analiz (toplu_analiz.py argümanları)", add_help=False)
+    toplu_parser.add_argument("arguman", nargs=argparse.REMAINDER)
+    toplu_parser.set_defaults(calistir=_toplu)
+    servis_parser = alt.add_parser("servis", help="Yerel HTTP analiz servisi ve yük üreteci (servis.py argümanları)", add_help=False)
+    servis_parser.add_argument("arguman", nargs=argparse.REMAINDER)
+    servis_parser.set_defaults(calistir=_servis)
+    args = parser.parse_args(argv)
+    args.calistir(args)
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,157 @@
+import ast
+import os
+from analiz import metrik_uret
+from profil import asama
+# matplotlib, seaborn ve graphviz yalnızca bir grafik çizildiğinde yüklenir
+# 2. Kodun Graph Gösterimi
+def kodu_graf_olustur(kod: str, baslik: str, kip: str = "ast", derinlik: int = None, odak: str = None, katla=(), en_fazla_dugum: int = 400, goster: bool = True):
+    """kip="ast" her AST düğümünü çizer; kip="cagri" sınıf/fonksiyon çağrı ve içerme grafını SVG olarak yazar.
+
+    Çağrı grafı en_fazla_dugum sınırını aşarsa ve derinlik verilmemişse üst düzey tanımlara katlanır.
+    goster False ise graf yalnızca dosyaya yazılır, pencere veya tarayıcı açılmaz.
+    """
+    if kip == "cagri":
+        return _cagri_grafi_olustur(kod, baslik, derinlik, odak, katla, en_fazla_dugum, goster)
+    import matplotlib.pyplot as plt
+    from graphviz import Digraph, ExecutableNotFound
+    with asama("kodu_graf_olustur.graf"):
+        agac = ast.parse(kod)
+        graph = Digraph(comment=baslik)
+        for node in ast.walk(agac):
+            node_id = id(node)
+            graph.node(str(node_id), type(node).__name__)
+            for child in ast.iter_child_nodes(node):
+                graph.edge(str(node_id), str(id(child)))
+    try:
+        with asama("kodu_graf_olustur.render"):
+            graph.render(f"{baslik}_graph", format="png", cleanup=True)
+        if not goster:
+            return f"{baslik}_graph.png"
+        img = plt.imread(f"{baslik}_graph.png")
+        plt.figure(figsize=(12, 8))
+        plt.imshow(img)
+        plt.axis('off')
+        plt.title(f"{baslik} Graph Gösterimi", fontsize=20)
+        plt.show()
+    except (FileNotFoundError, ExecutableNotFound):
+        print("Graphviz dot executable bulunamadı. Lütfen Graphviz'in kurulu ve PATH'e ekli olduğundan emin olun.")
+def _cagri_grafi_olustur(kod, baslik, derinlik, odak, katla, en_fazla_dugum, goster):
+    import webbrowser
+    from graphviz import ExecutableNotFound
+    from kod_grafi import KodGrafi
+    with asama("kodu_graf_olustur.graf"):
+        graf = KodGrafi(kod)
+    if derinlik is None and odak is None and len(graf.tanimlar) > en_fazla_dugum:
+        derinlik = 1
+    secenekler = {"derinlik": derinlik, "odak": odak, "katla": katla}
+    try:
+        # SVG dosya açılmadan üretilir; dot yoksa boş .svg dosyası kalmaz
+        with asama("kodu_graf_olustur.render"):
+            svg = graf.svg(baslik, **secenekler)
+        yol = f"{baslik}_graph.svg"
+        with open(yol, "w", encoding="utf-8") as f:
+            f.write(svg)
+    except ExecutableNotFound:
+        # dot yoksa DOT metni yazılır; başka bir araçla açılabilir
+        yol = f"{baslik}_graph.dot"
+        with asama("kodu_graf_olustur.dot"), open(yol, "w", encoding="utf-8") as f:
+            f.write(graf.dot(baslik, **secenekler))
+        print(f"Graphviz dot executable bulunamadı; graf DOT olarak yazıldı: {yol}")
+        return yol
+    if goster:
+        webbrowser.open("file://" + os.path.abspath(yol))
+    return yol
+# Görselleştirme Fonksiyonları
+# ax verilmezse her fonksiyon kendi figürünü açar ve plt.show() ile gösterir; verilirse yalnızca o eksene
+# çizer, figürü açık bırakır (rapor.py aynı figür ve eksenleri dosyaya yazarken yeniden kullanır)
+def _eksen(ax, boyut, polar: bool = False):
+    if ax is not None:
+        return ax, False
+    import matplotlib.pyplot as plt
+    _, ax = plt.subplots(figsize=boyut, subplot_kw=dict(polar=True) if polar else None)
+    return ax, True
+def _goster(goster: bool):
+    if goster:
+        import matplotlib.pyplot as plt
+        plt.show()
+# Kiviyat Grafiği Fonksiyonu
+# Kalite Analizini Gösteren İşlev
+def kalite_analiz_goster(kod: str, ax=None):
+    # Dinamik analiz için metrikler hesaplanıyor
+    metrikler = metrik_uret(kod)
+    kategoriler = ["Karmaşıklık", "Toplam Satır", "Boş Satır", "Yorum Satırı", "Fonksiyon Sayısı"]
+    veriler = [
+        metrikler['Karmaşıklık Seviyesi'],
+        metrikler['Toplam Satır'],
+        metrikler['Boş Satır'],
+        metrikler['Yorum Satırı'],
+        metrikler['Fonksiyon Sayısı']
+    ]
+    # Kiviyat grafiği oluşturuluyor
+    return kiviyat_grafigi(veriler, kategoriler, "SonarQube Kalite Analizi", ax=ax)
+# Kiviyat grafiği fonksiyonu (sabit kaldı, üst üste binme problemi burada yoktu)
+def kiviyat_grafigi(veriler, kategoriler, baslik="Yazılım Kalite Analizi", ax=None):
+    """ax verilecekse kutupsal (polar) bir eksen olmalıdır."""
+    import numpy as np
+    # Verilerin ve kategorilerin aynı uzunlukta olduğundan emin ol
+    if len(veriler) != len(kategoriler):
+        print("Hata: Veriler ve kategoriler aynı uzunlukta olmalıdır.")
+        return
+    veriler = np.concatenate((veriler, [veriler[0]]))  # Grafiği kapatmak için
+    açılar = np.linspace(0, 2 * np.pi, len(veriler))
+    ax, goster = _eksen(ax, (8, 8), polar=True)
+    ax.fill(açılar, veriler, color='blue', alpha=0.25)
+    ax.plot(açılar, veriler, color='blue', linewidth=2)
+    ax.set_yticks([])
+    ax.set_xticks(np.linspace(0, 2 * np.pi, len(kategoriler) + 1))
+    ax.set_xticklabels(kategoriler + [kategoriler[0]])  # İlk kategoriyi ekleyerek döngüyü kapat
+    ax.set_title(baslik, size=16, weight="bold")
+    _goster(goster)
+    return ax
+def yazilim_kalite_verisi():
+    metrikler = [85, 75, 90, 65, 80]  # Örnek metrik verileri
+    kategoriler = ["Kod Kalitesi", "Güvenlik", "Performans", "Okunabilirlik", "Hata Oranı"]
+    return metrikler, kategoriler
+def grafik_ciz(labels, values, title, xlabel, ylabel, palette="Blues_d", ax=None):
+    import seaborn as sns
+    ax, goster = _eksen(ax, (12, 8))
+    # Kategori başına tek değer olduğundan sns.barplot'un istatistik katmanı yerine yalnızca paleti kullanılır
+    ax.bar(labels, values, color=sns.color_palette(palette, len(labels)))
+    ax.set_title(title, fontsize=20)
+    ax.set_xlabel(xlabel, fontsize=14)
+    ax.set_ylabel(ylabel, fontsize=14)
+    ax.tick_params(axis="x", labelrotation=45, labelsize=12)
+    ax.figure.tight_layout()
+    _goster(goster)
+    return ax
+def kod_koku_gorsellestir(kokular: list, ax=None):
+    import seaborn as sns
+    # Kokuların kategorize edilmesi
+    kokular_kategorize = {}
+    for koku in kokular:
+        kategori = koku.split("(")[0].strip()
+        kokular_kategorize[kategori] = kokular_kategorize.get(kategori, 0) + 1
+    labels = list(kokular_kategorize.keys())
+    values = list(kokular_kategorize.values())
+    ax, goster = _eksen(ax, (16, 10))  # Grafik boyutu artırıldı
+    ax.bar(labels, values, color=sns.color_palette("coolwarm", len(labels)))
+    # Çubuklar üzerine değerler ekleniyor
+    for i, value in enumerate(values):
+        ax.text(i, value + 0.1, f"{value:.0f}", ha="center", fontsize=12)  # Çubuk üzeri etiket hizalandı
+    ax.set_title("Kod Koku Analizi", fontsize=24)  # Başlık boyutu artırıldı
+    ax.set_xlabel("Kod Koku Türleri", fontsize=18)  # X ekseni etiketi
+    ax.set_ylabel("Frekans", fontsize=18)  # Y ekseni etiketi
+    ax.tick_params(axis="x", labelrotation=45, labelsize=14)  # X ekseni değer boyutu
+    ax.tick_params(axis="y", labelsize=14)  # Y ekseni değer boyutu
+    ax.figure.tight_layout()  # Çakışmaları engeller
+    _goster(goster)
+    return ax
+def cover_orani_gorsellestir(oran: float, ax=None):
+    labels = ["Kaplanan Kısım", "Kaplanmayan Kısım"]
+    values = [oran, 100 - oran]
+    ax, goster = _eksen(ax, (8, 8))
+    ax.bar(labels, values, color=["green", "gray"])
+    ax.set_title("Kod Cover Oranı", fontsize=20)
+    ax.set_ylabel("Oran (%)", fontsize=14)
+    _goster(goster)
+    return ax
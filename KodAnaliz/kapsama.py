@@ -0,0 +1,141 @@
+import atexit
+import io
+import multiprocessing
+import os
+import signal
+import sys
+import tempfile
+# Yalıtılmış Kapsama (Coverage) Çalıştırıcısı
+class _ZamanAsimi(BaseException):
+    # Test kodundaki "except Exception" blokları zaman aşımını yutamasın
+    pass
+def _alarm(signum, frame):
+    raise _ZamanAsimi()
+def _isci_baslat():
+    # coverage her işte değil, işçi başına bir kez yüklenir
+    import warnings
+    import coverage
+    # Test kodu proje kodunu hiç içe aktarmazsa oran zaten 0 olarak döner
+    warnings.filterwarnings("ignore", category=coverage.exceptions.CoverageWarning)
+def _kapsama_isi(proje_kod: str, test_kod: str, zaman_asimi: float) -> dict:
+    """Kod çiftini geçici bir dizinde çalıştırır ve kapsama verisini bellekte toplar.
+
+    Satır dizisinde 1 çalışan, 0 çalışmayan, -1 çalıştırılabilir olmayan satırı gösterir.
+    """
+    import coverage
+    import numpy as np
+    sonuc = {"Hata": None}
+    eski_dizin = os.getcwd()
+    with tempfile.TemporaryDirectory() as dizin:
+        proje_yolu = os.path.join(dizin, "proje_kod.py")
+        test_yolu = os.path.join(dizin, "test_kod.py")
+        with open(proje_yolu, "w", encoding="utf-8") as f:
+            f.write(proje_kod)
+        with open(test_yolu, "w", encoding="utf-8") as f:
+            f.write(test_kod)
+        cov = coverage.Coverage(data_file=None, branch=True, include=[proje_yolu], config_file=False)
+        os.chdir(dizin)
+        sys.path.insert(0, dizin)
+        zamanlayici = hasattr(signal, "setitimer")
+        if zamanlayici:
+            eski_isleyici = signal.signal(signal.SIGALRM, _alarm)
+            signal.setitimer(signal.ITIMER_REAL, zaman_asimi)
+        cov.start()
+        try:
+            try:
+                exec(compile(test_kod, test_yolu, "exec"), {"__name__": "test_kod", "__file__": test_yolu})
+            finally:
+                # Alarm kapsama durdurulmadan önce iptal edilir; iptalden hemen önce gelen geç bir
+                # SIGALRM de buradan yükselir ve aşağıdaki except tarafından yakalanır
+                if zamanlayici:
+                    signal.setitimer(signal.ITIMER_REAL, 0)
+        except _ZamanAsimi:
+            sonuc["Hata"] = f"Test kodu {zaman_asimi} sn içinde tamamlanmadı"
+        except BaseException as e:
+            sonuc["Hata"] = f"Test kodu çalıştırılırken hata oluştu: {e!r}"
+        finally:
+            if zamanlayici:
+                signal.setitimer(signal.ITIMER_REAL, 0)
+                signal.signal(signal.SIGALRM, eski_isleyici)
+            cov.stop()
+            os.chdir(eski_dizin)
+            sys.path.remove(dizin)
+            # Sonraki işler aynı adlı modülleri yeniden yükleyebilsin
+            for modul in ("proje_kod", "test_kod"):
+                sys.modules.pop(modul, None)
+        _, calistirilabilir, _, eksik, _ = cov.analysis2(proje_yolu)
+        satir_sayisi = len(proje_kod.splitlines())
+        satirlar = np.full(satir_sayisi, -1, dtype=np.int8)
+        for satir in calistirilabilir:
+            if 0 < satir <= satir_sayisi:
+                satirlar[satir - 1] = 0 if satir in eksik else 1
+        dallar = sorted((a, b) for a, b in (cov.get_data().arcs(proje_yolu) or []) if a > 0 and b > 0)
+        try:
+            dal_orani = cov.report(file=io.StringIO())
+        except coverage.exceptions.NoDataError:
+            dal_orani = 0
+    calisan = len(calistirilabilir) - len(eksik)
+    sonuc.update({
+        "Cover Oranı": calisan / len(calistirilabilir) * 100 if calistirilabilir else 0,
+        "Dal Dahil Cover Oranı": dal_orani,
+        "Satırlar": satirlar,
+        "Dallar": dallar,
+    })
+    return sonuc
+def _hata_sonucu(mesaj: str) -> dict:
+    return {"Hata": mesaj, "Cover Oranı": 0, "Dal Dahil Cover Oranı": 0, "Satırlar": None, "Dallar": []}
+class KapsamaCalistirici:
+    """Kapsama hesaplarını havuzdaki işçi süreçlerde, her çifti kendi geçici dizininde çalıştırır.
+
+    Zaman aşımı işçide SIGALRM ile uygulanır; işçi buna rağmen yanıt vermezse havuz yeniden kurulur.
+    """
+    def __init__(self, is_sayisi: int = None, zaman_asimi: float = 10.0):
+        self.is_sayisi = is_sayisi or os.cpu_count() or 1
+        self.zaman_asimi = zaman_asimi
+        self._havuz = None
+    def _havuzu_kur(self):
+        self._havuz = multiprocessing.Pool(self.is_sayisi, initializer=_isci_baslat)
+    def _gonder(self, proje_kod: str, test_kod: str):
+        if self._havuz is None:
+            self._havuzu_kur()
+        return self._havuz.apply_async(_kapsama_isi, (proje_kod, test_kod, self.zaman_asimi))
+    def hesapla(self, proje_kod: str, test_kod: str) -> dict:
+        return next(self.toplu_hesapla([(proje_kod, test_kod)]))
+    def toplu_hesapla(self, ciftler):
+        """(proje_kod, test_kod) çiftlerini eşzamanlı çalıştırır ve sonuçları giriş sırasıyla üretir.
+
+        İşçide oluşan hatalar çiftin sonucundaki "Hata" alanına yazılır; diğer çiftler etkilenmez.
+        """
+        ciftler = list(ciftler)
+        isler = [self._gonder(proje_kod, test_kod) for proje_kod, test_kod in ciftler]
+        i = 0
+        while i < len(isler):
+            try:
+                yield isler[i].get(self.zaman_asimi + 5)
+            except multiprocessing.TimeoutError:
+                # Takılan işçi sonlandırılır; bitmemiş işler yeni havuza yeniden gönderilir
+                self.kapat()
+                yield _hata_sonucu(f"İşçi {self.zaman_asimi} sn içinde yanıt vermedi")
+                isler[i + 1:] = [self._gonder(*cift) for cift in ciftler[i + 1:]]
+            except Exception as e:
+                # Örneğin ayrıştırılamayan proje kodu; işçi sağlam kaldığından havuz korunur
+                yield _hata_sonucu(f"Kapsama hesaplanırken hata oluştu: {e!r}")
+            i += 1
+    def kapat(self):
+        if self._havuz is not None:
+            self._havuz.terminate()
+            self._havuz.join()
+            self._havuz = None
+    def __enter__(self):
+        return self
+    def __exit__(self, *exc):
+        self.kapat()
+_varsayilan_calistirici = None
+def kapsama_hesapla(proje_kod: str, test_kod: str) -> dict:
+    """Süreç boyunca paylaşılan varsayılan çalıştırıcı ile tek bir kapsama hesabı yapar."""
+    global _varsayilan_calistirici
+    if _varsayilan_calistirici is None:
+        _varsayilan_calistirici = KapsamaCalistirici()
+        # Havuz süreç çıkışında kapatılır, işçiler yetim kalmaz
+        atexit.register(_varsayilan_calistirici.kapat)
+    return _varsayilan_calistirici.hesapla(proje_kod, test_kod)
@@ -0,0 +1,139 @@
+import ast
+import zlib
+from collections import defaultdict, namedtuple
+# Alt Ağaç Özetleriyle Klon Tespiti
+# Her düğümün özeti çocuklarının özetlerinden aşağıdan yukarıya tek geçişte hesaplanır (Merkle ağacı)
+EN_AZ_DUGUM = 15
+# Tip-2 klonlarda yok sayılan tanımlayıcı alanları; sabitler yalnızca türleriyle özetlenir
+_TANIMLAYICI_ALANLARI = {"id", "arg", "attr", "name", "asname", "names", "module"}
+# Konum alanları ast düğümleriyle aynı adı taşır; kayıtlar kural motoruna düğüm gibi verilebilir
+AltAgac = namedtuple("AltAgac", ["normal", "tam", "boyut", "lineno", "col_offset", "end_lineno", "ebeveyn"])
+# str/bytes ve tür nesnelerinin hash'i süreçten sürece değişir; özetlere yalnızca tam sayılardan oluşan
+# demetler girer, böylece özetler diske yazılıp başka süreçlerde karşılaştırılabilir
+_TUR_KODLARI = {}
+def _tur_kodu(tur) -> int:
+    kod = _TUR_KODLARI.get(tur)
+    if kod is None:
+        kod = _TUR_KODLARI[tur] = zlib.crc32(tur.__name__.encode())
+    return kod
+def _kararli(deger):
+    if isinstance(deger, str):
+        return (1, zlib.crc32(deger.encode("utf-8", "surrogatepass")))
+    if isinstance(deger, bytes):
+        return (2, zlib.crc32(deger))
+    if deger is None:
+        return (3,)
+    if deger is Ellipsis:
+        return (4,)
+    if isinstance(deger, (tuple, frozenset)):
+        return (6, tuple(sorted(hash(_kararli(d)) for d in deger)) if isinstance(deger, frozenset) else tuple(_kararli(d) for d in deger))
+    return (5, _tur_kodu(type(deger)), deger)
+def alt_agaclari_ozetle(agac) -> list:
+    """Ağaçtaki her deyimin (ast.stmt) tanımlayıcılardan bağımsız ve birebir özetlerini döndürür.
+
+    normal özet ad ve sabit değerlerini yok sayar (Tip-2), tam özet yalnızca konumları yok sayar
+    (Tip-1). ebeveyn, deyimi kapsayan en yakın deyimin normal özetidir. Özetler süreçler arasında
+    kararlıdır.
+    """
+    AST, stmt = ast.AST, ast.stmt
+    ozetler = {}
+    deyimler = []
+    # Özyineleme yerine açık yığın: çok derin ifadelerde de özyineleme sınırına takılmaz.
+    # Düğüm önce çocuklarıyla birlikte yığına konur, çocukları özetlendikten sonra ikinci kez ele alınır.
+    yigin = [(agac, None, False)]
+    while yigin:
+        node, ebeveyn_deyim, cocuklar_hazir = yigin.pop()
+        tur = type(node)
+        if not cocuklar_hazir:
+            yigin.append((node, ebeveyn_deyim, True))
+            alt_ebeveyn = node if isinstance(node, stmt) else ebeveyn_deyim
+            for alan in tur._fields:
+                deger = getattr(node, alan, None)
+                if isinstance(deger, AST):
+                    yigin.append((deger, alt_ebeveyn, False))
+                elif isinstance(deger, list):
+                    yigin.extend((d, alt_ebeveyn, False) for d in deger if isinstance(d, AST))
+            continue
+        tur_kodu = _tur_kodu(tur)
+        normal, tam = [tur_kodu], [tur_kodu]
+        boyut = 1
+        for alan in tur._fields:
+            deger = getattr(node, alan, None)
+            if isinstance(deger, AST):
+                cocuk = ozetler[id(deger)]
+                normal.append(cocuk[0])
+                tam.append(cocuk[1])
+                boyut += cocuk[2]
+            elif isinstance(deger, list):
+                if deger and (deger[0] is None or isinstance(deger[0], AST)):
+                    cocuklar = [ozetler[id(d)] if d is not None else (None, None, 0) for d in deger]
+                    normal.append(tuple(c[0] for c in cocuklar))
+                    tam.append(tuple(c[1] for c in cocuklar))
+                    boyut += sum(c[2] for c in cocuklar)
+                else:
+                    # Global/Nonlocal adları gibi düğüm olmayan listeler
+                    kararli = tuple(_kararli(d) for d in deger)
+                    normal.append(len(deger) if alan in _TANIMLAYICI_ALANLARI else kararli)
+                    tam.append(kararli)
+            elif tur is ast.Constant:
+                if alan == "value":
+                    normal.append(_tur_kodu(type(deger)))
+                    tam.append(_kararli(deger))
+            else:
+                kararli = _kararli(deger)
+                normal.append(0 if alan in _TANIMLAYICI_ALANLARI else kararli)
+                tam.append(kararli)
+        ozetler[id(node)] = (hash(tuple(normal)), hash(tuple(tam)), boyut)
+        if isinstance(node, stmt):
+            deyimler.append((node, ebeveyn_deyim))
+    kayitlar = [
+        AltAgac(*ozetler[id(node)], node.lineno, node.col_offset, node.end_lineno,
+                ozetler[id(ebeveyn)][0] if ebeveyn is not None else None)
+        for node, ebeveyn in deyimler
+    ]
+    kayitlar.sort(key=lambda k: (k.lineno, k.col_offset))
+    return kayitlar
+def klon_gruplari(kayitlar, en_az_dugum: int = EN_AZ_DUGUM) -> list:
+    """(anahtar, AltAgac) çiftlerini normal özete göre gruplar ve birden fazla kopyası olanları döndürür.
+
+    Bütünüyle daha büyük bir klonun içinde kalan gruplar (tüm kopyaları aynı ebeveyn grubunda ve kopya
+    sayısı aynı olanlar) ayrıca raporlanmaz. Gruplar büyükten küçüğe sıralıdır.
+    """
+    gruplar = defaultdict(list)
+    for anahtar, kayit in kayitlar:
+        if kayit.boyut >= en_az_dugum:
+            gruplar[kayit.normal].append((anahtar, kayit))
+    sonuc = []
+    for normal, uyeler in gruplar.items():
+        if len(uyeler) < 2:
+            continue
+        ebeveynler = {kayit.ebeveyn for _, kayit in uyeler}
+        if len(ebeveynler) == 1:
+            ebeveyn = next(iter(ebeveynler))
+            if ebeveyn in gruplar and len(gruplar[ebeveyn]) == len(uyeler):
+                continue
+        sonuc.append({
+            "Tip": 1 if len({kayit.tam for _, kayit in uyeler}) == 1 else 2,
+            "Düğüm Sayısı": uyeler[0][1].boyut,
+            "Konumlar": [(anahtar, kayit.lineno, kayit.end_lineno) for anahtar, kayit in uyeler],
+            "Kayıtlar": [kayit for _, kayit in uyeler],
+        })
+    sonuc.sort(key=lambda g: (-g["Düğüm Sayısı"], g["Konumlar"][0][1]))
+    return sonuc
+def tekrar_eden_bloklar(kayitlar, en_az_dugum: int = EN_AZ_DUGUM):
+    """Tek bir modülün AltAgac kayıtlarından kopyası olan her deyim için (mesaj, kayıt) üretir."""
+    for grup in klon_gruplari(((None, k) for k in kayitlar), en_az_dugum):
+        satirlar = ", ".join(str(satir) for _, satir, _ in grup["Konumlar"])
+        for kayit in grup["Kayıtlar"]:
+            yield f"Tekrar eden kod bloğu tespit edildi (Tip-{grup['Tip']}, satırlar {satirlar})", kayit
+class KlonIndeksi:
+    """Birden fazla dosyanın deyim özetlerini tutar; klonlar dosya içinde ve dosyalar arasında aranır."""
+    def __init__(self, en_az_dugum: int = EN_AZ_DUGUM):
+        self.en_az_dugum = en_az_dugum
+        self._kayitlar = []
+    def ekle(self, anahtar, kod):
+        agac = kod if isinstance(kod, ast.AST) else getattr(kod, "agac", None) or ast.parse(kod)
+        self._kayitlar.extend((anahtar, k) for k in alt_agaclari_ozetle(agac) if k.boyut >= self.en_az_dugum)
+    def klonlar(self) -> list:
+        """Klon gruplarını [{"Tip", "Düğüm Sayısı", "Konumlar": [(anahtar, satır, bitiş satırı)]}] olarak döndürür."""
+        return [{ad: deger for ad, deger in grup.items() if ad != "Kayıtlar"} for grup in klon_gruplari(self._kayitlar, self.en_az_dugum)]
@@ -0,0 +1,127 @@
+import ast
+from collections import Counter, namedtuple
+# Fonksiyon ve Sınıf Düzeyinde Çağrı/İçerme Grafı
+# AST düğüm başına değil, tanım başına bir graf düğümü üretilir; büyük modüller de okunabilir kalır
+MODUL = "<modül>"
+Tanim = namedtuple("Tanim", ["ad", "tur", "satir", "ebeveyn", "derinlik"])
+class _TanimToplayici:
+    """Tanımları nitelikli adlarıyla, çağrıları da çözülmemiş halleriyle tek geçişte toplar."""
+    def __init__(self):
+        self.tanimlar = {MODUL: Tanim(MODUL, "modul", 0, None, 0)}
+        self.cagrilar = []
+    def topla(self, agac):
+        # Özyinelemeli NodeVisitor yerine açık yığın: a + a + ... gibi çok derin ifadelerde özyineleme
+        # sınırına takılmaz. Her öğe kapsayan tanım ve sınıfı taşıdığından kapsamın geri alınması gerekmez
+        yigin = [(agac, MODUL, None)]
+        while yigin:
+            node, kapsam, sinif = yigin.pop()
+            if isinstance(node, (ast.ClassDef, ast.FunctionDef, ast.AsyncFunctionDef)):
+                tur = "sinif" if isinstance(node, ast.ClassDef) else "fonksiyon"
+                ad = node.name if kapsam == MODUL else f"{kapsam}.{node.name}"
+                self.tanimlar[ad] = Tanim(ad, tur, node.lineno, kapsam, self.tanimlar[kapsam].derinlik + 1)
+                kapsam = ad
+                if tur == "sinif":
+                    sinif = ad
+            elif isinstance(node, ast.Call):
+                if isinstance(node.func, ast.Name):
+                    self.cagrilar.append((kapsam, None, node.func.id))
+                elif isinstance(node.func, ast.Attribute) and isinstance(node.func.value, ast.Name) and node.func.value.id in ("self", "cls"):
+                    self.cagrilar.append((kapsam, sinif, node.func.attr))
+            # Çocuklar ters sırayla konduğundan gezinti sırası NodeVisitor ile aynıdır
+            yigin.extend((cocuk, kapsam, sinif) for cocuk in reversed(list(ast.iter_child_nodes(node))))
+        return self
+class KodGrafi:
+    """Modüldeki sınıf/fonksiyon tanımları arasındaki içerme ve çağrı kenarları.
+
+    Çağrılar yalnızca modülde tanımlı adlara çözülür: düz adlar kapsayan tanımlardan başlayarak
+    modül düzeyine doğru aranır, self/cls üzerinden yapılan çağrılar kapsayan sınıfın metotlarına bağlanır.
+    """
+    def __init__(self, kod):
+        agac = kod if isinstance(kod, ast.AST) else ast.parse(kod)
+        toplayici = _TanimToplayici().topla(agac)
+        self.tanimlar = toplayici.tanimlar
+        self.icerme = [(t.ebeveyn, ad) for ad, t in self.tanimlar.items() if t.ebeveyn not in (None, MODUL)]
+        self.cagrilar = Counter()
+        for cagiran, sinif, ad in toplayici.cagrilar:
+            hedef = self._coz(cagiran, sinif, ad)
+            if hedef is not None:
+                self.cagrilar[cagiran, hedef] += 1
+    def _coz(self, cagiran: str, sinif: str, ad: str):
+        if sinif is not None:
+            hedef = f"{sinif}.{ad}"
+            return hedef if hedef in self.tanimlar else None
+        kapsam = cagiran
+        while kapsam is not None:
+            hedef = ad if kapsam == MODUL else f"{kapsam}.{ad}"
+            if hedef in self.tanimlar:
+                return hedef
+            kapsam = self.tanimlar[kapsam].ebeveyn
+        return None
+    def _temsilci(self, ad: str, derinlik, katla) -> str:
+        """Düğümü, katlanan en dış atasına ya da derinlik sınırındaki atasına eşler."""
+        yol = []
+        while ad is not None:
+            yol.append(ad)
+            ad = self.tanimlar[ad].ebeveyn
+        for ata in reversed(yol):
+            if ata in katla or (derinlik is not None and self.tanimlar[ata].derinlik >= derinlik):
+                return ata
+        return yol[0]
+    def alt_graf(self, odak: str = None, derinlik: int = None, katla=(), komsuluk: int = 1) -> dict:
+        """Gösterilecek düğüm ve kenarları döndürür.
+
+        derinlik verilirse daha derindeki tanımlar atalarına katlanır; katla içindeki tanımların alt
+        ağaçları tek düğümde toplanır. odak verilirse yalnızca odak tanımın alt ağacı ile ondan
+        komsuluk adım uzaklıktaki çağıran/çağrılan tanımlar tutulur.
+        """
+        katla = set(katla)
+        temsilci = {ad: self._temsilci(ad, derinlik, katla) for ad in self.tanimlar}
+        katlanan = Counter(t for ad, t in temsilci.items() if ad != t)
+        icerme = {(temsilci[a], temsilci[b]) for a, b in self.icerme}
+        cagrilar = Counter()
+        for (a, b), adet in self.cagrilar.items():
+            cagrilar[temsilci[a], temsilci[b]] += adet
+        dugumler = set(temsilci.values())
+        if odak is not None:
+            if odak not in self.tanimlar:
+                raise KeyError(f"Tanım bulunamadı: {odak}")
+            secilen = {t for ad, t in temsilci.items() if ad == odak or ad.startswith(odak + ".")}
+            sinir = set(secilen)
+            for _ in range(komsuluk):
+                sinir = {b for a, b in cagrilar if a in sinir} | {a for a, b in cagrilar if b in sinir}
+                sinir -= secilen
+                secilen |= sinir
+            dugumler = secilen
+        # Modül düğümü yalnızca modül düzeyinden yapılan çağrılar varsa gösterilir
+        kenarlar = {(a, b) for a, b in cagrilar if a in dugumler and b in dugumler and a != b}
+        if not any(MODUL in kenar for kenar in kenarlar):
+            dugumler = dugumler - {MODUL}
+        return {
+            "Düğümler": sorted(dugumler, key=lambda ad: (self.tanimlar[ad].satir, ad)),
+            "Katlanan": {ad: katlanan[ad] for ad in dugumler if katlanan[ad]},
+            "İçerme": sorted((a, b) for a, b in icerme if a in dugumler and b in dugumler and a != b),
+            "Çağrılar": {kenar: cagrilar[kenar] for kenar in sorted(kenarlar)},
+        }
+    def dot(self, baslik: str = "Kod", **secenekler) -> str:
+        """alt_graf seçenekleriyle seçilen grafı DOT metni olarak üretir; graphviz paketi gerekmez."""
+        graf = self.alt_graf(**secenekler)
+        satirlar = [f"digraph {_tirnakla(baslik)} {{", "  rankdir=LR;", '  node [fontname="Arial", fontsize=10];']
+        for ad in graf["Düğümler"]:
+            tanim = self.tanimlar[ad]
+            etiket = tanim.ad.rsplit(".", 1)[-1]
+            if ad in graf["Katlanan"]:
+                etiket += f" (+{graf['Katlanan'][ad]})"
+            sekil = {"sinif": "box", "modul": "folder"}.get(tanim.tur, "ellipse")
+            satirlar.append(f"  {_tirnakla(ad)} [label={_tirnakla(etiket)}, shape={sekil}, tooltip={_tirnakla(f'{ad} (satır {tanim.satir})')}];")
+        for a, b in graf["İçerme"]:
+            satirlar.append(f"  {_tirnakla(a)} -> {_tirnakla(b)} [style=dashed, arrowhead=none, color=gray];")
+        for (a, b), adet in graf["Çağrılar"].items():
+            satirlar.append(f"  {_tirnakla(a)} -> {_tirnakla(b)}" + (f" [label={adet}];" if adet > 1 else ";"))
+        satirlar.append("}")
+        return "\n".join(satirlar) + "\n"
+    def svg(self, baslik: str = "Kod", **secenekler) -> str:
+        """Seçilen grafı dot ile doğrudan SVG'ye çevirir; ara dosya veya PNG üretilmez."""
+        from graphviz import Source
+        return Source(self.dot(baslik, **secenekler)).pipe(format="svg", encoding="utf-8")
+def _tirnakla(metin: str) -> str:
+    return '"' + str(metin).replace("\\", "\\\\").replace('"', '\\"') + '"'
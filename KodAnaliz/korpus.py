@@ -0,0 +1,110 @@
+import numpy as np
+from scipy import sparse
+from sklearn.feature_extraction.text import CountVectorizer
+from sklearn.preprocessing import normalize
+from analiz import AyristirilmisKod
+# Korpus Benzerlik Motoru
+# Boyut adları ve sıraları kod_benzerlik_hesapla sonucuyla aynıdır
+KUME_BOYUTLARI = [
+    ("Yapısal Benzerlik", "yapi_ozetleri"),
+    ("Değişken Adları Benzerliği", "degiskenler"),
+    ("Fonksiyon Adları Benzerliği", "fonksiyonlar"),
+    ("Sınıf Adları Benzerliği", "siniflar"),
+    ("Modül Benzerliği", "moduller"),
+    ("String Benzerliği", "stringler"),
+    ("Yorum Satırları Benzerliği", "yorumlar"),
+]
+SAYI_BOYUTLARI = [
+    ("Döngü Türleri Benzerliği", "dongu_sayisi"),
+    ("Koşul Yapıları Benzerliği", "kosul_sayisi"),
+]
+BOYUTLAR = ["Token Benzerliği"] + [ad for ad, _ in KUME_BOYUTLARI] + [ad for ad, _ in SAYI_BOYUTLARI]
+def _ikili_matris(ozellik_listeleri) -> sparse.csr_matrix:
+    """Her satırı bir dosyanın özellik kümesi olan 0/1 seyrek matris üretir."""
+    sozluk = {}
+    indptr = [0]
+    indices = []
+    for ozellikler in ozellik_listeleri:
+        for ozellik in set(ozellikler):
+            indices.append(sozluk.setdefault(ozellik, len(sozluk)))
+        indptr.append(len(indices))
+    veri = np.ones(len(indices), dtype=np.int32)
+    return sparse.csr_matrix((veri, indices, indptr), shape=(len(ozellik_listeleri), max(len(sozluk), 1)))
+class KorpusOzellikleri:
+    """Korpustaki her kodu bir kez ayrıştırır ve tüm benzerlik boyutlarını seyrek matrislerde tutar.
+
+    token_modeli verilirse token boyutu her seferinde yeni bir sözlük kurmak yerine eğitilmiş TF-IDF
+    modeliyle hesaplanır.
+    """
+    def __init__(self, kodlar, token_modeli=None):
+        ayrisimlar = [k if isinstance(k, AyristirilmisKod) else AyristirilmisKod(k) for k in kodlar]
+        self.adet = len(ayrisimlar)
+        # Token sayımları L2 normalize edilir; kosinüs benzerliği tek bir çarpıma indirgenir
+        if token_modeli is not None:
+            self.token = token_modeli.donustur(ayrisimlar)
+        else:
+            self.token = normalize(CountVectorizer().fit_transform([a.kod for a in ayrisimlar]).astype(np.float64))
+        self.kumeler = {ad: _ikili_matris([getattr(a, alan) for a in ayrisimlar]) for ad, alan in KUME_BOYUTLARI}
+        self.kume_boyutlari = {ad: np.diff(matris.indptr) for ad, matris in self.kumeler.items()}
+        self.sayilar = {ad: np.array([getattr(a, alan) for a in ayrisimlar], dtype=np.float64) for ad, alan in SAYI_BOYUTLARI}
+    @classmethod
+    def depodan(cls, depo, token) -> "KorpusOzellikleri":
+        """Kodları yeniden ayrıştırmadan bir OzellikDeposu'ndan kurar.
+
+        Depo kaynak metni tutmadığından token satırları (ör. aynı sırayla eğitilmiş TokenModeli.korpus)
+        ayrıca verilir.
+        """
+        ozellikler = cls.__new__(cls)
+        ozellikler.adet = len(depo)
+        ozellikler.token = token
+        ozellikler.kumeler = {ad: depo.kume_matrisi(alan) for ad, alan in KUME_BOYUTLARI}
+        ozellikler.kume_boyutlari = {ad: np.diff(matris.indptr) for ad, matris in ozellikler.kumeler.items()}
+        ozellikler.sayilar = {ad: np.asarray(depo.sayi_sutunu(alan)) for ad, alan in SAYI_BOYUTLARI}
+        return ozellikler
+    def blok_benzerlik(self, baslangic: int, bitis: int) -> dict:
+        """[baslangic, bitis) satırlarının tüm korpusa karşı on boyutlu benzerliklerini (%) döndürür."""
+        sonuc = {"Token Benzerliği": (self.token[baslangic:bitis] @ self.token.T).toarray() * 100}
+        for ad, matris in self.kumeler.items():
+            # Kesişim X·Xᵀ ile, birleşim |A| + |B| - |A∩B| ile hesaplanır
+            kesisim = (matris[baslangic:bitis] @ matris.T).toarray()
+            boyutlar = self.kume_boyutlari[ad]
+            birlesim = boyutlar[baslangic:bitis, None] + boyutlar[None, :] - kesisim
+            sonuc[ad] = kesisim / np.maximum(birlesim, 1) * 100
+        for ad, sayilar in self.sayilar.items():
+            en_buyuk = np.maximum.outer(sayilar[baslangic:bitis], sayilar)
+            en_kucuk = np.minimum.outer(sayilar[baslangic:bitis], sayilar)
+            sonuc[ad] = np.divide(en_kucuk, en_buyuk, out=np.zeros_like(en_buyuk), where=en_buyuk > 0) * 100
+        return {ad: sonuc[ad] for ad in BOYUTLAR}
+def korpus_benzerlik_hesapla(kodlar, blok_boyutu: int = 512) -> dict:
+    """Tüm kod çiftleri için her boyutta N×N benzerlik (%) matrisi döndürür."""
+    ozellikler = kodlar if isinstance(kodlar, KorpusOzellikleri) else KorpusOzellikleri(kodlar)
+    matrisler = {ad: np.empty((ozellikler.adet, ozellikler.adet)) for ad in BOYUTLAR}
+    for baslangic in range(0, ozellikler.adet, blok_boyutu):
+        bitis = min(baslangic + blok_boyutu, ozellikler.adet)
+        for ad, blok in ozellikler.blok_benzerlik(baslangic, bitis).items():
+            matrisler[ad][baslangic:bitis] = blok
+    return matrisler
+def en_benzer_kodlar(kodlar, k: int = 5, olcut: str = "Ortalama", blok_boyutu: int = 512) -> list:
+    """Her kod için kendisi hariç en benzer k kodu [(indeks, skor, boyut skorları), ...] olarak döndürür.
+
+    olcut bir boyut adı ya da on boyutun ortalaması için "Ortalama" olabilir. Hesap blok blok
+    yapıldığından bellek kullanımı N×N yerine blok_boyutu×N ile sınırlıdır.
+    """
+    if olcut != "Ortalama" and olcut not in BOYUTLAR:
+        raise ValueError(f"Bilinmeyen benzerlik ölçütü: {olcut}")
+    ozellikler = kodlar if isinstance(kodlar, KorpusOzellikleri) else KorpusOzellikleri(kodlar)
+    sonuclar = []
+    for baslangic in range(0, ozellikler.adet, blok_boyutu):
+        bitis = min(baslangic + blok_boyutu, ozellikler.adet)
+        blok = ozellikler.blok_benzerlik(baslangic, bitis)
+        skorlar = np.mean([blok[ad] for ad in BOYUTLAR], axis=0) if olcut == "Ortalama" else blok[olcut].copy()
+        np.fill_diagonal(skorlar[:, baslangic:bitis], -np.inf)
+        k_etkin = min(k, ozellikler.adet - 1)
+        if k_etkin <= 0:
+            sonuclar.extend([] for _ in range(bitis - baslangic))
+            continue
+        adaylar = np.argpartition(-skorlar, k_etkin - 1, axis=1)[:, :k_etkin]
+        for satir, satir_adaylari in enumerate(adaylar):
+            satir_adaylari = sorted(satir_adaylari, key=lambda j: -skorlar[satir, j])
+            sonuclar.append([(int(j), float(skorlar[satir, j]), {ad: float(blok[ad][satir, j]) for ad in BOYUTLAR}) for j in satir_adaylari])
+    return sonuclar
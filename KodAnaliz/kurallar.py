@@ -0,0 +1,231 @@
+import ast
+import re
+import time
+from collections import Counter, namedtuple
+from klon import alt_agaclari_ozetle, tekrar_eden_bloklar
+from profil import asama
+# Kural Motoru
+Bulgu = namedtuple("Bulgu", ["kural", "kategori", "mesaj", "satir", "sutun"])
+class Kural:
+    """Kural tabanı. denetle yalnızca dugum_turleri'ndeki düğümler için çağrılır ve mesaj üretir;
+    tüm ağaca bağlı kurallar gezinti bitince bitir içinde (mesaj, düğüm) çiftleri üretir.
+
+    Kayıttaki nesneler çalıştırmalar arasında paylaşıldığından, çalıştırmaya özgü durum baslat ile
+    oluşturulup denetle/bitir'e parametre olarak verilir.
+    """
+    kimlik = None
+    kategori = "guvenlik"
+    dugum_turleri = ()
+    def baslat(self):
+        return None
+    def denetle(self, node, durum):
+        return ()
+    def bitir(self, durum):
+        return ()
+class _FonksiyonKurali(Kural):
+    def __init__(self, kimlik, kategori, dugum_turleri, fonksiyon):
+        self.kimlik = kimlik
+        self.kategori = kategori
+        self.dugum_turleri = dugum_turleri
+        self.fonksiyon = fonksiyon
+    def denetle(self, node, durum):
+        return self.fonksiyon(node)
+KURAL_KAYDI = {}
+def kural_kaydet(kural_nesnesi: Kural) -> Kural:
+    if kural_nesnesi.kimlik in KURAL_KAYDI:
+        raise ValueError(f"Kural kimliği zaten kayıtlı: {kural_nesnesi.kimlik}")
+    KURAL_KAYDI[kural_nesnesi.kimlik] = kural_nesnesi
+    return kural_nesnesi
+def kural(kimlik: str, *dugum_turleri, kategori: str = "guvenlik"):
+    """Düğüm başına mesaj üreten bir fonksiyonu kural olarak kaydeden dekoratör."""
+    def kaydet(fonksiyon):
+        kural_kaydet(_FonksiyonKurali(kimlik, kategori, dugum_turleri, fonksiyon))
+        return fonksiyon
+    return kaydet
+class KuralDenetcisi:
+    """Ağacı tek bir kez gezer ve her düğümü yalnızca o düğüm türüyle ilgilenen kurallara iletir.
+
+    zamanla verilirse her kuralın toplam süresi ve çağrı sayısı sureler/cagrilar sayaçlarında birikir.
+    """
+    def __init__(self, kurallar=None, zamanla: bool = False):
+        self.kurallar = list(KURAL_KAYDI.values() if kurallar is None else kurallar)
+        self.zamanla = zamanla
+        self.sureler = Counter()
+        self.cagrilar = Counter()
+        self._dagitim = {}
+        for k in self.kurallar:
+            for tur in k.dugum_turleri:
+                self._dagitim.setdefault(tur, []).append(k)
+    def _ekle(self, k: Kural, mesaj: str, node):
+        self.bulgular.append(Bulgu(k.kimlik, k.kategori, mesaj, getattr(node, "lineno", 0), getattr(node, "col_offset", 0)))
+    def _calistir(self, k: Kural, fonksiyon, *args):
+        if not self.zamanla:
+            return list(fonksiyon(*args))
+        baslangic = time.perf_counter()
+        sonuc = list(fonksiyon(*args))
+        self.sureler[k.kimlik] += time.perf_counter() - baslangic
+        self.cagrilar[k.kimlik] += 1
+        return sonuc
+    def denetle(self, agac) -> list:
+        """Bulguları kaynak koddaki konumlarına göre sıralı döndürür."""
+        self.bulgular = []
+        self._durumlar = {k.kimlik: k.baslat() for k in self.kurallar}
+        # Özyinelemeli NodeVisitor yerine açık yığın: a + a + ... gibi çok derin ifadelerde özyineleme
+        # sınırına takılmaz. Çocuklar ters sırayla yığına konduğundan gezinti sırası NodeVisitor ile aynıdır
+        yigin = [agac]
+        while yigin:
+            node = yigin.pop()
+            for k in self._dagitim.get(type(node), ()):
+                for mesaj in self._calistir(k, k.denetle, node, self._durumlar[k.kimlik]):
+                    self._ekle(k, mesaj, node)
+            yigin.extend(reversed(list(ast.iter_child_nodes(node))))
+        for k in self.kurallar:
+            for mesaj, node in self._calistir(k, k.bitir, self._durumlar[k.kimlik]):
+                self._ekle(k, mesaj, node)
+        self.bulgular.sort(key=lambda b: (b.satir, b.sutun))
+        return self.bulgular
+def kurallari_uygula(kod, kategori: str = None, zamanla: bool = False) -> list:
+    """Kodu (veya ayrıştırılmış ağacı) kayıtlı kurallarla tek geçişte denetler; kategori verilirse yalnız o kategori çalışır."""
+    with asama("kurallari_uygula.parse"):
+        agac = kod if isinstance(kod, ast.AST) else ast.parse(kod)
+    kurallar = [k for k in KURAL_KAYDI.values() if kategori is None or k.kategori == kategori]
+    with asama(f"kurallari_uygula.{kategori or 'tumu'}"):
+        return KuralDenetcisi(kurallar, zamanla).denetle(agac)
+# Güvenlik Kuralları
+@kural("G001", ast.Try)
+def _try_blogu(node):
+    yield "Try-Except Bloğu Kullanılmış"
+def ice_aktarilan_adlar(node) -> list:
+    """Import/ImportFrom düğümünün tüm adlarını takma adlarıyla ("numpy as np", ".yardimci.oku") döndürür."""
+    if isinstance(node, ast.ImportFrom):
+        kaynak = "." * node.level + (node.module or "")
+        adlar = [f"{kaynak}.{a.name}" if node.module else kaynak + a.name for a in node.names]
+    else:
+        adlar = [a.name for a in node.names]
+    return [f"{ad} as {a.asname}" if a.asname else ad for ad, a in zip(adlar, node.names)]
+@kural("G002", ast.Import)
+def _modul_ice_aktarimi(node):
+    yield f"Modül İçe Aktarımı: {', '.join(ice_aktarilan_adlar(node))}"
+@kural("G003", ast.Call)
+def _tehlikeli_fonksiyon(node):
+    if isinstance(node.func, ast.Name) and node.func.id in ['eval', 'exec']:
+        yield f"Tehlikeli Fonksiyon Kullanımı: {node.func.id}"
+@kural("G004", ast.FunctionDef)
+def _sifre_parametresi(node):
+    if "password" in [arg.arg.lower() for arg in node.args.args]:
+        yield f"Fonksiyon {node.name} şifre parametresi içeriyor."
+@kural("G005", ast.With)
+def _with_blogu(node):
+    yield "With bloğu kullanımı, kaynak yönetimi kontrol edilmeli."
+def _nitelikli_ad(node) -> str:
+    """subprocess.run gibi Attribute/Name zincirini noktalı ada çevirir; çözülemezse boş döner."""
+    parcalar = []
+    while isinstance(node, ast.Attribute):
+        parcalar.append(node.attr)
+        node = node.value
+    if not isinstance(node, ast.Name):
+        return ""
+    parcalar.append(node.id)
+    return ".".join(reversed(parcalar))
+@kural("G006", ast.Call)
+def _shell_true(node):
+    ad = _nitelikli_ad(node.func)
+    if ad.startswith("subprocess.") and any(
+        k.arg == "shell" and isinstance(k.value, ast.Constant) and k.value.value is True for k in node.keywords
+    ):
+        yield f"{ad} çağrısında shell=True kullanımı, komut enjeksiyonu riski."
+@kural("G007", ast.Call)
+def _pickle_yukleme(node):
+    ad = _nitelikli_ad(node.func)
+    if ad in ("pickle.loads", "pickle.load", "cPickle.loads", "cPickle.load"):
+        yield f"Güvenilmeyen veriyle {ad} kullanımı, keyfi kod çalıştırma riski."
+# Ad, alt çizgiyle ayrılmış parçalarına göre eşleşir: db_password evet, passenger/tokenizer hayır
+_GIZLI_AD = re.compile(r"(^|_)(password|passwd|pass|secret|token|api_?key|private_?key|sifre|parola)($|_)", re.IGNORECASE)
+@kural("G008", ast.Assign, ast.AnnAssign, ast.keyword)
+def _gomulu_gizli_bilgi(node):
+    deger = node.value
+    if not (isinstance(deger, ast.Constant) and isinstance(deger.value, str) and deger.value):
+        return
+    if isinstance(node, ast.keyword):
+        adlar = [node.arg] if node.arg else []
+    else:
+        hedefler = node.targets if isinstance(node, ast.Assign) else [node.target]
+        adlar = [h.id if isinstance(h, ast.Name) else h.attr for h in hedefler if isinstance(h, (ast.Name, ast.Attribute))]
+    for ad in adlar:
+        if _GIZLI_AD.search(ad):
+            yield f"Koda gömülü gizli bilgi: {ad}"
+@kural("G009", ast.ImportFrom)
+def _yildizli_ice_aktarma(node):
+    if any(alias.name == "*" for alias in node.names):
+        yield f"Yıldızlı içe aktarma: from {'.' * node.level}{node.module or ''} import *"
+# Kod Kokusu Kuralları
+@kural("K001", ast.FunctionDef, kategori="koku")
+def _uzun_fonksiyon(node):
+    if len(node.body) > 30:
+        yield f"Fonksiyon {node.name} çok uzun ({len(node.body)} satır)"
+@kural("K002", ast.FunctionDef, kategori="koku")
+def _uzun_parametre_listesi(node):
+    if len(node.args.args) > 5:
+        yield f"Fonksiyon {node.name} çok fazla parametre alıyor ({len(node.args.args)} parametre)"
+def kullanilan_ad(node):
+    """Ad okuyan Name düğümünün adını ya da Attribute düğümünün nitelik adını döndürür (self.f, geri çağırma olarak f)."""
+    if isinstance(node, ast.Name):
+        return node.id if isinstance(node.ctx, ast.Load) else None
+    return node.attr if isinstance(node, ast.Attribute) else None
+class _OluKod(Kural):
+    """Modülde adına hiç başvurulmayan fonksiyonlar; proje geneli için proje_indeksi kullanılır."""
+    kimlik = "K003"
+    kategori = "koku"
+    dugum_turleri = (ast.FunctionDef, ast.Name, ast.Attribute)
+    def baslat(self):
+        return {"tanimlar": [], "cagrilar": set()}
+    def denetle(self, node, durum):
+        if isinstance(node, ast.FunctionDef):
+            durum["tanimlar"].append(node)
+        else:
+            durum["cagrilar"].add(kullanilan_ad(node))
+        return ()
+    def bitir(self, durum):
+        for node in durum["tanimlar"]:
+            if node.name not in durum["cagrilar"]:
+                yield f"Fonksiyon {node.name} kullanılmıyor (ölü kod)", node
+kural_kaydet(_OluKod())
+class _TekrarEdenKod(Kural):
+    """Modülde tanımlayıcılar ve sabitler dışında aynı olan deyim alt ağaçları (Tip-1/Tip-2 klonlar)."""
+    kimlik = "K004"
+    kategori = "koku"
+    dugum_turleri = (ast.Module,)
+    def baslat(self):
+        return {"kayitlar": []}
+    def denetle(self, node, durum):
+        durum["kayitlar"].extend(alt_agaclari_ozetle(node))
+        return ()
+    def bitir(self, durum):
+        return tekrar_eden_bloklar(durum["kayitlar"])
+kural_kaydet(_TekrarEdenKod())
+@kural("K005", ast.ClassDef, kategori="koku")
+def _buyuk_sinif(node):
+    if len(node.body) > 100:
+        yield f"Çok büyük sınıf: {node.name} ({len(node.body)} satır)"
+@kural("K006", ast.Import, ast.ImportFrom, kategori="koku")
+def _modul_bagimliligi(node):
+    yield f"Modül içe aktarıldı: {', '.join(ice_aktarilan_adlar(node))}"
+@kural("K007", ast.If, kategori="koku")
+def _derin_if_zinciri(node):
+    depth = 0
+    while isinstance(node, ast.If):
+        depth += 1
+        node = node.body[0] if node.body else None
+    if depth > 4:
+        yield f"Derin if-else zinciri tespit edildi ({depth} seviye)"
+@kural("K008", ast.FunctionDef, kategori="koku")
+def _hata_yonetimi_yok(node):
+    if not any(isinstance(n, ast.Try) for n in node.body):
+        yield f"Fonksiyon {node.name} hata yönetimi içermiyor"
+@kural("K009", ast.For, ast.While, kategori="koku")
+def _dongu(node):
+    yield "Döngü tespit edildi"
+@kural("K010", ast.Constant, kategori="koku")
+def _magic_number(node):
+    if isinstance(node.value, (int, float)) and node.value not in [0, 1, -1]:
+        yield f"Magic number kullanımı: {node.value}"
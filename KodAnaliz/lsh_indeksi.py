@@ -0,0 +1,107 @@
+import pickle
+import zlib
+import numpy as np
+from analiz import AyristirilmisKod, kod_benzerlik_hesapla
+# MinHash/LSH Yakın Kopya İndeksi
+_ASAL = (1 << 31) - 1
+_token_ayristirici = None
+def _tokenlar(kod: str) -> list:
+    # kod_benzerlik_hesapla'daki token benzerliğiyle aynı ayrıştırıcı; sklearn ilk kullanımda yüklenir
+    global _token_ayristirici
+    if _token_ayristirici is None:
+        from sklearn.feature_extraction.text import CountVectorizer
+        _token_ayristirici = CountVectorizer().build_analyzer()
+    return _token_ayristirici(kod)
+def _ngramlar(onek: str, ogeler: list, n: int) -> set:
+    return {onek + " ".join(ogeler[i:i + n]) for i in range(max(len(ogeler) - n + 1, 1)) if ogeler}
+def kod_parcalari(kod, token_n: int = 3, tur_n: int = 5) -> set:
+    """Kodun token ve AST düğüm türü n-gramlarını MinHash için parça kümesi olarak döndürür.
+
+    Tekil token ve düğüm türü kümeleri ilgisiz dosyalar arasında da büyük ölçüde ortak olduğundan,
+    ayırt ediciliği artırmak için ardışık token'lar ve gezinti sırasındaki ardışık türler kullanılır.
+    """
+    ayrisim = kod if isinstance(kod, AyristirilmisKod) else AyristirilmisKod(kod)
+    return _ngramlar("t:", _tokenlar(ayrisim.kod), token_n) | _ngramlar("a:", ayrisim.dugum_turleri, tur_n)
+class LSHIndeksi:
+    """Kod parçalarının MinHash imzalarını bantlara bölerek saklayan, artımlı eklenebilen kalıcı indeks.
+
+    Varsayılan 32 bant × 4 satır ile Jaccard benzerliği yaklaşık 0.42'nin üzerindeki çiftler yüksek
+    olasılıkla aday olarak döner; adaylar daha sonra tam benzerlik hesabıyla yeniden puanlanır.
+    """
+    def __init__(self, bant_sayisi: int = 32, satir_sayisi: int = 4, tohum: int = 1):
+        self.bant_sayisi = bant_sayisi
+        self.satir_sayisi = satir_sayisi
+        rastgele = np.random.default_rng(tohum)
+        permutasyon_sayisi = bant_sayisi * satir_sayisi
+        self._a = rastgele.integers(1, _ASAL, size=(permutasyon_sayisi, 1), dtype=np.uint64)
+        self._b = rastgele.integers(0, _ASAL, size=(permutasyon_sayisi, 1), dtype=np.uint64)
+        self.anahtarlar = []
+        # İmzalar kapasitesi ikiye katlanarak büyüyen bir tamponda tutulur; ekleme ve sorgu sırayla
+        # gelse de her satır bir kez kopyalanır
+        self._imzalar = np.empty((0, permutasyon_sayisi), dtype=np.uint32)
+        self.bantlar = [{} for _ in range(bant_sayisi)]
+    def __len__(self):
+        return len(self.anahtarlar)
+    @property
+    def imzalar(self) -> np.ndarray:
+        return self._imzalar[:len(self.anahtarlar)]
+    def imza(self, kod) -> np.ndarray:
+        """Kodun MinHash imzasını hesaplar."""
+        parcalar = kod_parcalari(kod)
+        if not parcalar:
+            return np.full(self._a.shape[0], _ASAL, dtype=np.uint32)
+        ozetler = np.fromiter((zlib.crc32(p.encode("utf-8")) for p in parcalar), dtype=np.uint64, count=len(parcalar))
+        return ((self._a * ozetler[None, :] + self._b) % _ASAL).min(axis=1).astype(np.uint32)
+    def _bant_anahtarlari(self, imza: np.ndarray):
+        for bant in range(self.bant_sayisi):
+            yield bant, imza[bant * self.satir_sayisi:(bant + 1) * self.satir_sayisi].tobytes()
+    def ekle(self, anahtar, kod) -> int:
+        """Kodu indekse ekler ve iç sıra numarasını döndürür."""
+        imza = self.imza(kod)
+        sira = len(self.anahtarlar)
+        if sira == len(self._imzalar):
+            tampon = np.empty((max(16, 2 * sira), self._imzalar.shape[1]), dtype=np.uint32)
+            tampon[:sira] = self._imzalar
+            self._imzalar = tampon
+        self._imzalar[sira] = imza
+        self.anahtarlar.append(anahtar)
+        for bant, bant_anahtari in self._bant_anahtarlari(imza):
+            self.bantlar[bant].setdefault(bant_anahtari, []).append(sira)
+        return sira
+    def sorgula(self, kod, en_az_benzerlik: float = 0.0) -> list:
+        """En az bir bantta çakışan adayları tahmini Jaccard benzerliğine göre azalan sırada döndürür."""
+        imza = self.imza(kod)
+        adaylar = set()
+        for bant, bant_anahtari in self._bant_anahtarlari(imza):
+            adaylar.update(self.bantlar[bant].get(bant_anahtari, ()))
+        if not adaylar:
+            return []
+        siralar = np.fromiter(adaylar, dtype=np.int64, count=len(adaylar))
+        tahminler = (self.imzalar[siralar] == imza).mean(axis=1)
+        sonuc = [(self.anahtarlar[s], float(t)) for s, t in zip(siralar, tahminler) if t >= en_az_benzerlik]
+        return sorted(sonuc, key=lambda aday: -aday[1])
+    def __getstate__(self):
+        durum = self.__dict__.copy()
+        durum["_imzalar"] = self.imzalar.copy()
+        return durum
+    def kaydet(self, yol: str):
+        with open(yol, "wb") as f:
+            pickle.dump(self, f, protocol=pickle.HIGHEST_PROTOCOL)
+    @classmethod
+    def yukle(cls, yol: str) -> "LSHIndeksi":
+        with open(yol, "rb") as f:
+            return pickle.load(f)
+def yakin_kopyalari_bul(indeks: LSHIndeksi, kod: str, kaynak_oku, en_az_benzerlik: float = 0.0, en_fazla: int = 20) -> list:
+    """LSH adaylarını on boyutlu kod_benzerlik_hesapla ile yeniden puanlar.
+
+    kaynak_oku, indeks anahtarından kaynak kodu döndüren fonksiyondur (örneğin dosya yolu okuyucu).
+    """
+    ayrisim = AyristirilmisKod(kod)
+    sonuclar = []
+    for anahtar, tahmin in indeks.sorgula(ayrisim, en_az_benzerlik)[:en_fazla]:
+        try:
+            benzerlik = kod_benzerlik_hesapla(ayrisim, kaynak_oku(anahtar))
+        except (SyntaxError, ValueError):
+            continue
+        sonuclar.append((anahtar, tahmin, benzerlik))
+    return sonuclar
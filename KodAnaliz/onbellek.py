@@ -0,0 +1,81 @@
+import hashlib
+import json
+import os
+import sqlite3
+import time
+from analiz import ANALIZ_SURUMU
+# İçerik Özetli Sonuç Önbelleği
+class SonucOnbellegi:
+    """Analiz sonuçlarını kod içeriği ve analiz sürümünün özetiyle anahtarlayan SQLite tabanlı disk önbelleği.
+
+    Aynı dosyayı birden fazla süreç aynı anda açabilir; SQLite WAL kipi ve kilit zaman aşımı eşzamanlı
+    yazıcıları sıraya koyar. Toplam boyut veya kayıt sayısı sınırı aşıldığında en uzun süredir erişilmeyen
+    kayıtlar silinir (LRU).
+    """
+    def __init__(self, yol: str, en_fazla_bayt: int = 256 * 1024 * 1024, en_fazla_kayit: int = None, surum: str = ANALIZ_SURUMU):
+        self.yol = yol
+        self.en_fazla_bayt = en_fazla_bayt
+        self.en_fazla_kayit = en_fazla_kayit
+        self.surum = surum
+        self.isabet = 0
+        self.iska = 0
+        self._yazma_sayaci = 0
+        if os.path.dirname(yol):
+            os.makedirs(os.path.dirname(yol), exist_ok=True)
+        self._baglanti = sqlite3.connect(yol, timeout=30, isolation_level=None)
+        self._baglanti.execute("PRAGMA journal_mode=WAL")
+        self._baglanti.execute("PRAGMA synchronous=NORMAL")
+        self._baglanti.execute(
+            "CREATE TABLE IF NOT EXISTS sonuclar (anahtar TEXT PRIMARY KEY, deger TEXT NOT NULL, boyut INTEGER NOT NULL, erisim REAL NOT NULL)"
+        )
+        self._baglanti.execute("CREATE INDEX IF NOT EXISTS sonuclar_erisim ON sonuclar (erisim)")
+    def anahtar(self, analiz_adi: str, kod: str) -> str:
+        ozet = hashlib.sha256()
+        for parca in (self.surum, analiz_adi, kod):
+            ozet.update(parca.encode("utf-8"))
+            ozet.update(b"\0")
+        return ozet.hexdigest()
+    def getir(self, analiz_adi: str, kod: str):
+        """Önbellekteki sonucu döndürür; yoksa None döner."""
+        anahtar = self.anahtar(analiz_adi, kod)
+        satir = self._baglanti.execute("SELECT deger FROM sonuclar WHERE anahtar = ?", (anahtar,)).fetchone()
+        if satir is None:
+            self.iska += 1
+            return None
+        self.isabet += 1
+        self._baglanti.execute("UPDATE sonuclar SET erisim = ? WHERE anahtar = ?", (time.time(), anahtar))
+        return json.loads(satir[0])
+    def kaydet(self, analiz_adi: str, kod: str, sonuc):
+        deger = json.dumps(sonuc, ensure_ascii=False)
+        self._baglanti.execute(
+            "INSERT OR REPLACE INTO sonuclar (anahtar, deger, boyut, erisim) VALUES (?, ?, ?, ?)",
+            (self.anahtar(analiz_adi, kod), deger, len(deger), time.time()),
+        )
+        self._yazma_sayaci += 1
+        # Sınır denetimi her yazmada değil, belirli aralıklarla yapılır
+        if self._yazma_sayaci % 64 == 0:
+            self.temizle()
+    def getir_veya_hesapla(self, analiz_adi: str, kod: str, hesapla):
+        sonuc = self.getir(analiz_adi, kod)
+        if sonuc is None:
+            sonuc = hesapla(kod)
+            self.kaydet(analiz_adi, kod, sonuc)
+        return sonuc
+    def temizle(self):
+        """Boyut ve kayıt sınırlarını aşan en eski erişimli kayıtları siler."""
+        if self.en_fazla_kayit is not None:
+            self._baglanti.execute(
+                "DELETE FROM sonuclar WHERE anahtar IN (SELECT anahtar FROM sonuclar ORDER BY erisim DESC LIMIT -1 OFFSET ?)",
+                (self.en_fazla_kayit,),
+            )
+        if self.en_fazla_bayt is not None:
+            self._baglanti.execute(
+                "DELETE FROM sonuclar WHERE anahtar IN (SELECT anahtar FROM "
+                "(SELECT anahtar, SUM(boyut) OVER (ORDER BY erisim DESC, anahtar) AS kumulatif FROM sonuclar) WHERE kumulatif > ?)",
+                (self.en_fazla_bayt,),
+            )
+    def istatistik(self) -> dict:
+        kayit, boyut = self._baglanti.execute("SELECT COUNT(*), COALESCE(SUM(boyut), 0) FROM sonuclar").fetchone()
+        return {"İsabet": self.isabet, "Iska": self.iska, "Kayıt": kayit, "Boyut": boyut}
+    def kapat(self):
+        self._baglanti.close()
@@ -0,0 +1,216 @@
+import json
+import os
+from array import array
+import numpy as np
+from analiz import AyristirilmisKod, metrik_uret
+# Dizi Tabanlı Özellik Deposu
+# Dosya başına özellikler dize listeleri yerine ortak sembol tablosundaki tam sayı kodlarıyla,
+# CSR düzeninde (indptr + indices) NumPy dizilerinde tutulur; depo bellek eşlemeli (mmap) açılır
+KUME_ALANLARI = ["yapi_ozetleri", "degiskenler", "fonksiyonlar", "siniflar", "moduller", "stringler", "yorumlar"]
+SAYI_SUTUNLARI = [
+    "dongu_sayisi", "kosul_sayisi",
+    "Karmaşıklık Seviyesi", "Toplam Satır", "Boş Satır", "Yorum Satırı", "Fonksiyon Sayısı",
+    "Değişken Sayısı", "Import Sayısı", "Yorum Oranı", "Kod Satırı Oranı", "Karmaşıklık Ortalama",
+]
+DEPO_SURUMU = 1
+class SembolTablosu:
+    """Dizeleri ardışık tam sayı kodlarına eşler (interning).
+
+    Diskte tek bir UTF-8 bayt dizisi ve başlangıç konumları olarak saklanır. Açılan tabloda dizeler
+    istendiğinde çözülür; dizeden koda sözlük yalnızca yeni sembol eklenirken kurulur.
+    """
+    __slots__ = ("_kodlar", "_dizeler", "_baytlar", "_ofsetler")
+    def __init__(self):
+        self._kodlar = {}
+        self._dizeler = []
+        self._baytlar = None
+        self._ofsetler = None
+    def __len__(self):
+        return len(self._dizeler) if self._ofsetler is None else len(self._ofsetler) - 1
+    def _sozluge_cevir(self):
+        self._dizeler = [self[i] for i in range(len(self))]
+        self._kodlar = {dize: i for i, dize in enumerate(self._dizeler)}
+        self._baytlar = self._ofsetler = None
+    def kodla(self, dize) -> int:
+        if self._ofsetler is not None:
+            self._sozluge_cevir()
+        kod = self._kodlar.get(dize)
+        if kod is None:
+            kod = self._kodlar[dize] = len(self._dizeler)
+            self._dizeler.append(dize)
+        return kod
+    def __getitem__(self, kod: int):
+        if self._ofsetler is None:
+            return self._dizeler[kod]
+        return bytes(self._baytlar[self._ofsetler[kod]:self._ofsetler[kod + 1]]).decode("utf-8", "surrogatepass")
+    def yaz(self, dizin: str, ad: str):
+        _dizeleri_yaz(dizin, ad, (self[i] for i in range(len(self))))
+    @classmethod
+    def ac(cls, dizin: str, ad: str) -> "SembolTablosu":
+        tablo = cls()
+        tablo._ofsetler = np.load(os.path.join(dizin, f"{ad}.ofset.npy"), mmap_mode="r")
+        yol = os.path.join(dizin, f"{ad}.bin")
+        tablo._baytlar = np.memmap(yol, dtype=np.uint8, mode="r") if os.path.getsize(yol) else np.empty(0, dtype=np.uint8)
+        return tablo
+def _dizeleri_yaz(dizin: str, ad: str, dizeler):
+    """Dizeleri tek bir UTF-8 bayt dizisi ve başlangıç konumları olarak yazar; SembolTablosu.ac ile açılır."""
+    kodlanmis = [str(dize).encode("utf-8", "surrogatepass") for dize in dizeler]
+    ofsetler = np.zeros(len(kodlanmis) + 1, dtype=np.int64)
+    np.cumsum([len(b) for b in kodlanmis], out=ofsetler[1:])
+    np.save(os.path.join(dizin, f"{ad}.ofset.npy"), ofsetler)
+    with open(os.path.join(dizin, f"{ad}.bin"), "wb") as f:
+        f.write(b"".join(kodlanmis))
+class _CsrYazici:
+    __slots__ = ("indptr", "indices", "data")
+    def __init__(self, sayimli: bool = False):
+        self.indptr = array("q", [0])
+        self.indices = array("i")
+        self.data = array("i") if sayimli else None
+    def satir_ekle(self, kodlar, sayilar=None):
+        self.indices.extend(kodlar)
+        if sayilar is not None:
+            self.data.extend(sayilar)
+        self.indptr.append(len(self.indices))
+    def yaz(self, dizin: str, ad: str):
+        np.save(os.path.join(dizin, f"{ad}.indptr.npy"), np.frombuffer(self.indptr, dtype=np.int64))
+        np.save(os.path.join(dizin, f"{ad}.indices.npy"), np.frombuffer(self.indices, dtype=np.int32))
+        if self.data is not None:
+            np.save(os.path.join(dizin, f"{ad}.data.npy"), np.frombuffer(self.data, dtype=np.int32))
+def dosya_ozellikleri(kod: str) -> dict:
+    """Kodu bir kez ayrıştırıp depoya yazılacak ham özellikleri döndürür (süreçler arası taşınabilir)."""
+    ayrisim = AyristirilmisKod(kod)
+    ozellikler = {alan: getattr(ayrisim, alan) for alan in KUME_ALANLARI}
+    ozellikler["dugum_turleri"] = ayrisim.dugum_turleri
+    metrikler = metrik_uret(ayrisim)
+    metrikler.update(dongu_sayisi=ayrisim.dongu_sayisi, kosul_sayisi=ayrisim.kosul_sayisi)
+    ozellikler["sayilar"] = [float(metrikler[ad]) for ad in SAYI_SUTUNLARI]
+    return ozellikler
+class OzellikDeposuYazici:
+    """Dosya özelliklerini sıkışık dizilerde (array) biriktirir ve kapat ile dizine yazar."""
+    def __init__(self, dizin: str):
+        self.dizin = dizin
+        self.semboller = SembolTablosu()
+        self.yapi_ozetleri = SembolTablosu()
+        # Anahtarlar kodlanmaz; aynı anahtarla eklenen dosyalar da kendi satırını ve anahtarını alır
+        self.anahtarlar = []
+        self._kumeler = {alan: _CsrYazici() for alan in KUME_ALANLARI}
+        self._dugum_turleri = _CsrYazici(sayimli=True)
+        self._sayilar = array("d")
+    def __len__(self):
+        return len(self._dugum_turleri.indptr) - 1
+    def ekle(self, anahtar, kod: str):
+        """Kodu analiz edip ekler; ayrıştırılamayan kod için SyntaxError yükselir ve depo değişmez."""
+        self.ozellikleri_ekle(anahtar, dosya_ozellikleri(kod))
+    def ozellikleri_ekle(self, anahtar, ozellikler: dict):
+        self.anahtarlar.append(str(anahtar))
+        for alan, yazici in self._kumeler.items():
+            tablo = self.yapi_ozetleri if alan == "yapi_ozetleri" else self.semboller
+            yazici.satir_ekle(sorted({tablo.kodla(deger) for deger in ozellikler[alan]}))
+        histogram = {}
+        for tur in ozellikler["dugum_turleri"]:
+            kod = self.semboller.kodla(tur)
+            histogram[kod] = histogram.get(kod, 0) + 1
+        kodlar = sorted(histogram)
+        self._dugum_turleri.satir_ekle(kodlar, [histogram[k] for k in kodlar])
+        self._sayilar.extend(ozellikler["sayilar"])
+    def kapat(self):
+        os.makedirs(self.dizin, exist_ok=True)
+        self.semboller.yaz(self.dizin, "semboller")
+        _dizeleri_yaz(self.dizin, "anahtarlar", self.anahtarlar)
+        np.save(os.path.join(self.dizin, "yapi_ozetleri.tablo.npy"), np.array([self.yapi_ozetleri[i] for i in range(len(self.yapi_ozetleri))], dtype=np.int64))
+        for alan, yazici in self._kumeler.items():
+            yazici.yaz(self.dizin, alan)
+        self._dugum_turleri.yaz(self.dizin, "dugum_turleri")
+        np.save(os.path.join(self.dizin, "sayilar.npy"), np.frombuffer(self._sayilar, dtype=np.float64).reshape(-1, len(SAYI_SUTUNLARI)))
+        with open(os.path.join(self.dizin, "meta.json"), "w", encoding="utf-8") as f:
+            json.dump({"Sürüm": DEPO_SURUMU, "Dosya Sayısı": len(self), "Sayı Sütunları": SAYI_SUTUNLARI, "Küme Alanları": KUME_ALANLARI}, f, ensure_ascii=False)
+    def __enter__(self):
+        return self
+    def __exit__(self, tur, *exc):
+        if tur is None:
+            self.kapat()
+class DosyaKaydi:
+    """Depodaki bir dosyanın görünümü; veriler kopyalanmaz, alanlar istendiğinde depodan okunur."""
+    __slots__ = ("depo", "sira")
+    def __init__(self, depo: "OzellikDeposu", sira: int):
+        self.depo = depo
+        self.sira = sira
+    @property
+    def anahtar(self) -> str:
+        return self.depo.anahtarlar[self.sira]
+    def kume(self, alan: str) -> list:
+        indptr, indices = self.depo.csr[alan][:2]
+        kodlar = indices[indptr[self.sira]:indptr[self.sira + 1]]
+        if alan == "yapi_ozetleri":
+            return self.depo.yapi_tablosu[kodlar].tolist()
+        return [self.depo.semboller[k] for k in kodlar]
+    @property
+    def metrikler(self) -> dict:
+        return dict(zip(SAYI_SUTUNLARI, self.depo.sayilar[self.sira].tolist()))
+    @property
+    def dugum_histogrami(self) -> dict:
+        indptr, indices, data = self.depo.csr["dugum_turleri"]
+        bas, bit = indptr[self.sira], indptr[self.sira + 1]
+        return {self.depo.semboller[k]: int(n) for k, n in zip(indices[bas:bit], data[bas:bit])}
+    def __repr__(self):
+        return f"DosyaKaydi({self.anahtar!r})"
+class OzellikDeposu:
+    """Yazılmış bir depoyu bellek eşlemeli açar; açılış maliyeti dosya sayısından bağımsızdır.
+
+    Diziler salt okunur mmap olduğundan aynı depoyu açan işçi süreçler işletim sisteminin sayfa
+    önbelleğini paylaşır, veri kopyalanmaz.
+    """
+    def __init__(self, dizin: str):
+        self.dizin = dizin
+        with open(os.path.join(dizin, "meta.json"), encoding="utf-8") as f:
+            self.meta = json.load(f)
+        if self.meta["Sürüm"] != DEPO_SURUMU:
+            raise ValueError(f"Desteklenmeyen depo sürümü: {self.meta['Sürüm']}")
+        self.semboller = SembolTablosu.ac(dizin, "semboller")
+        self.anahtarlar = SembolTablosu.ac(dizin, "anahtarlar")
+        self.yapi_tablosu = self._yukle("yapi_ozetleri.tablo")
+        self.sayilar = self._yukle("sayilar")
+        self.csr = {alan: (self._yukle(f"{alan}.indptr"), self._yukle(f"{alan}.indices")) for alan in KUME_ALANLARI}
+        self.csr["dugum_turleri"] = (self._yukle("dugum_turleri.indptr"), self._yukle("dugum_turleri.indices"), self._yukle("dugum_turleri.data"))
+    def _yukle(self, ad: str) -> np.ndarray:
+        return np.load(os.path.join(self.dizin, f"{ad}.npy"), mmap_mode="r")
+    def __len__(self):
+        return self.meta["Dosya Sayısı"]
+    def __getitem__(self, sira: int) -> DosyaKaydi:
+        if not 0 <= sira < len(self):
+            raise IndexError(sira)
+        return DosyaKaydi(self, sira)
+    def sayi_sutunu(self, ad: str) -> np.ndarray:
+        return self.sayilar[:, SAYI_SUTUNLARI.index(ad)]
+    def kume_matrisi(self, alan: str):
+        """Alanın dosya × sembol ikili CSR matrisi; indptr/indices mmap dizileridir."""
+        from scipy import sparse
+        indptr, indices = self.csr[alan][:2]
+        sutun_sayisi = len(self.yapi_tablosu) if alan == "yapi_ozetleri" else len(self.semboller)
+        return sparse.csr_matrix((np.ones(len(indices), dtype=np.int32), indices, indptr), shape=(len(self), max(sutun_sayisi, 1)))
+    def dugum_histogrami(self):
+        """Dosya × düğüm türü sayım matrisi (CSR)."""
+        from scipy import sparse
+        indptr, indices, data = self.csr["dugum_turleri"]
+        return sparse.csr_matrix((data, indices, indptr), shape=(len(self), max(len(self.semboller), 1)))
+def _dosya_ozellikleri_oku(yol: str):
+    try:
+        with open(yol, encoding="utf-8") as f:
+            return yol, dosya_ozellikleri(f.read())
+    except (OSError, UnicodeDecodeError, SyntaxError, ValueError):
+        return yol, None
+def depo_olustur(kok: str, dizin: str, is_sayisi: int = None) -> dict:
+    """Kök altındaki .py dosyalarının özelliklerini işçi süreçlerde çıkarır ve depoya yazar.
+
+    Sembol kodlaması sıralı kalsın diye yalnızca ana süreçte yapılır. Okunamayan dosyalar atlanır.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+    from toplu_analiz import python_dosyalarini_bul
+    atlanan = 0
+    with OzellikDeposuYazici(dizin) as yazici, ProcessPoolExecutor(max_workers=is_sayisi) as havuz:
+        for yol, ozellikler in havuz.map(_dosya_ozellikleri_oku, python_dosyalarini_bul(kok), chunksize=16):
+            if ozellikler is None:
+                atlanan += 1
+            else:
+                yazici.ozellikleri_ekle(yol, ozellikler)
+    return {"Dosya Sayısı": len(yazici), "Atlanan": atlanan}
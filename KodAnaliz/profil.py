@@ -0,0 +1,33 @@
+import os
+import time
+from collections import Counter
+from contextlib import contextmanager, nullcontext
+# İsteğe Bağlı Aşama Zamanlaması
+# KODANALIZ_PROFIL ortam değişkeni verilirse analiz fonksiyonları aşama sürelerini burada biriktirir;
+# kapalıyken asama() paylaşılan boş bir bağlam döndürdüğünden maliyeti ihmal edilebilir düzeydedir
+_acik = os.environ.get("KODANALIZ_PROFIL", "") not in ("", "0")
+ASAMA_SURELERI = Counter()
+ASAMA_SAYILARI = Counter()
+_BOS_BAGLAM = nullcontext()
+def profil_ac(acik: bool = True):
+    global _acik
+    _acik = acik
+def profil_acik_mi() -> bool:
+    return _acik
+@contextmanager
+def _olc(ad: str):
+    baslangic = time.perf_counter()
+    try:
+        yield
+    finally:
+        ASAMA_SURELERI[ad] += time.perf_counter() - baslangic
+        ASAMA_SAYILARI[ad] += 1
+def asama(ad: str):
+    """"fonksiyon.aşama" adıyla bir kod bölümünü zamanlayan bağlam yöneticisi döndürür."""
+    return _olc(ad) if _acik else _BOS_BAGLAM
+def sifirla():
+    ASAMA_SURELERI.clear()
+    ASAMA_SAYILARI.clear()
+def asama_raporu() -> dict:
+    """{aşama: {"Süre": toplam saniye, "Çağrı": adet}} biçiminde, süreye göre azalan sıralı rapor."""
+    return {ad: {"Süre": sure, "Çağrı": ASAMA_SAYILARI[ad]} for ad, sure in ASAMA_SURELERI.most_common()}
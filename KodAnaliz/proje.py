@@ -1,22 +1,21 @@
-from tkinter import Tk, Label, Button, Text, Frame, END
+from tkinter import Tk, Label, Button, Text, Frame, END, messagebox
 import unittest
 from io import StringIO
 import sys
 import os
 import ast
 import subprocess
-from sklearn.feature_extraction.text import CountVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
-from graphviz import Digraph
-from radon.metrics import mi_parameters
-from radon.complexity import cc_visit
-from radon.raw import analyze
-import coverage
-import matplotlib.pyplot as plt
-import seaborn as sns
-import numpy as np
-from tqdm import tqdm  # İlerleme çubuğu için
 import time
+from collections import Counter
+# Analiz ve görselleştirme fonksiyonları ayrı modüllerdedir; ağır bağımlılıklar kullanıldıkları anda yüklenir
+from analiz import (
+    ANALIZ_SURUMU, AyristirilmisKod, kod_benzerlik_hesapla, metrik_uret, kod_kokularini_tespit_et,
+    cover_orani_hesapla, kod_guvenligi_ve_hata_tahmini, tum_analizler,
+)
+from gorsel import (
+    kodu_graf_olustur, kalite_analiz_goster, kiviyat_grafigi, yazilim_kalite_verisi, grafik_ciz,
+    kod_koku_gorsellestir, cover_orani_gorsellestir,
+)
 # Test Sınıfı
 
 class WhiteBoxTest(unittest.TestCase):
@@ -99,9 +98,567 @@ import sys
         imports = [node.names[0].name for node in ast.walk(tree) if isinstance(node, ast.Import)]
         self.assertIn("os", imports, "os modülü içe aktarılmamış.")
         self.assertIn("sys", imports, "sys modülü içe aktarılmamış.")
-if _name_ == "__main__":
+
+    def test_gizli_bilgi_adlari(self):
+        """Gizli bilgi kuralının yalnızca ad parçalarıyla eşleştiğini kontrol eder."""
+        for ad in ["password", "db_password", "API_KEY", "access_token", "sifre"]:
+            self.assertTrue(kod_guvenligi_ve_hata_tahmini(f"{ad} = 'abc123'\n"), f"{ad} yakalanmadı.")
+        for ad in ["passenger", "compass_heading", "tokenizer", "bypass_cache"]:
+            self.assertEqual(kod_guvenligi_ve_hata_tahmini(f"{ad} = 'abc123'\n"), [], f"{ad} yanlışlıkla yakalandı.")
+
+    def test_uzun_ifade_zinciri(self):
+        """Kural denetimi çok uzun düz ifade zincirlerinde özyineleme sınırına takılmamalıdır."""
+        kod = "x = " + " + ".join(["a"] * 2000) + "\n"
+        self.assertIsInstance(kod_kokularini_tespit_et(kod), list)
+
+    def test_bulgu_sirasi(self):
+        """Bulgular ağaç gezinti sırasıyla değil, kaynak koddaki konumlarına göre sıralı dönmelidir."""
+        kod = """
+def f():
+    x = 5
+y = 7
+"""
+        self.assertEqual(kod_kokularini_tespit_et(kod), [
+            "Fonksiyon f hata yönetimi içermiyor",
+            "Fonksiyon f kullanılmıyor (ölü kod)",
+            "Magic number kullanımı: 5",
+            "Magic number kullanımı: 7",
+        ])
+        from kurallar import kurallari_uygula
+        konumlar = [(b.satir, b.sutun) for b in kurallari_uygula(kod)]
+        self.assertEqual(konumlar, sorted(konumlar))
+
+    def test_olu_kod_ve_import_kokulari(self):
+        """K003 ad ve nitelik başvurularını kullanım sayar; K006 importtaki tüm adları takma adlarıyla listeler."""
+        kod = """
+import os, sys
+from collections import Counter as C
+class A:
+    def f(self):
+        return self.g()
+    def g(self):
+        return 0
+def h():
+    return 0
+kaydet(h)
+"""
+        kokular = kod_kokularini_tespit_et(kod)
+        self.assertIn("Modül içe aktarıldı: os, sys", kokular)
+        self.assertIn("Modül içe aktarıldı: collections.Counter as C", kokular)
+        olu = [k for k in kokular if k.endswith("(ölü kod)")]
+        # self.g() ile çağrılan metod ve geri çağırma olarak verilen h ölü kod değildir
+        self.assertEqual(olu, ["Fonksiyon f kullanılmıyor (ölü kod)"])
+
+    def test_tek_gecis_analizi(self):
+        """tum_analizler sonuçları ayrı ayrı çağrılan analizlerle aynı olmalıdır."""
+        kod = """
+import os, sys
+password = "gizli"
+def f(a, b, c, d, e, f):
+    if a:
+        if b:
+            if c:
+                if d:
+                    if e:
+                        return eval(f)
+"""
+        self.assertEqual(tum_analizler(kod), {
+            "Metrikler": metrik_uret(kod),
+            "Kokular": kod_kokularini_tespit_et(kod),
+            "Güvenlik": kod_guvenligi_ve_hata_tahmini(kod),
+        })
+# Eşdeğerlik Testleri
+# Hızlandırılan analizlerin yeni yolları, eski yollarıyla örnek kodlar üzerinde karşılaştırılır
+def _eski_kod_kokulari(kod: str) -> list:
+    """Her fonksiyon ve atama için kodu yeniden ayrıştırıp gezen eski (karesel) kod kokusu tespiti; olduğu gibi korunur."""
+    kokular = []
+    agac = ast.parse(kod)
+    for node in ast.walk(agac):
+        if isinstance(node, ast.FunctionDef) and len(node.body) > 30:
+            kokular.append(f"Fonksiyon {node.name} çok uzun ({len(node.body)} satır)")
+        if isinstance(node, ast.FunctionDef) and len(node.args.args) > 5:
+            kokular.append(f"Fonksiyon {node.name} çok fazla parametre alıyor ({len(node.args.args)} parametre)")
+        if isinstance(node, ast.FunctionDef) and not any(
+            isinstance(n, ast.Call) and isinstance(n.func, ast.Name) and n.func.id == node.name for n in ast.walk(agac)
+        ):
+            kokular.append(f"Fonksiyon {node.name} kullanılmıyor (ölü kod)")
+        if isinstance(node, ast.Assign) and any(
+            n for n in ast.walk(ast.parse(kod)) if isinstance(n, ast.Assign) and n != node and ast.dump(n) == ast.dump(node)
+        ):
+            kokular.append("Tekrar eden kod bloğu tespit edildi")
+        if isinstance(node, ast.ClassDef) and len(node.body) > 100:
+            kokular.append(f"Çok büyük sınıf: {node.name} ({len(node.body)} satır)")
+        if isinstance(node, ast.Import) or isinstance(node, ast.ImportFrom):
+            kokular.append(f"Modül içe aktarıldı: {node.names[0].name}")
+        if isinstance(node, ast.If):
+            depth = 0
+            while isinstance(node, ast.If):
+                depth += 1
+                node = node.body[0] if node.body else None
+            if depth > 4:
+                kokular.append(f"Derin if-else zinciri tespit edildi ({depth} seviye)")
+        if isinstance(node, ast.FunctionDef) and not any(isinstance(n, ast.Try) for n in node.body):
+            kokular.append(f"Fonksiyon {node.name} hata yönetimi içermiyor")
+        if isinstance(node, (ast.For, ast.While)):
+            kokular.append("Döngü tespit edildi")
+        if isinstance(node, ast.Constant) and isinstance(node.value, (int, float)) and node.value not in [0, 1, -1]:
+            kokular.append(f"Magic number kullanımı: {node.value}")
+    return kokular
+def _eski_metrik_uret(kod: str) -> dict:
+    """radon'un her ölçümü ve her sayım için kodu yeniden ayrıştıran eski metrik üretimi."""
+    from radon.complexity import cc_visit
+    from radon.raw import analyze
+    karmasiklik = cc_visit(kod)
+    raw_metrics = analyze(kod)
+    return {
+        "Karmaşıklık Seviyesi": len(karmasiklik),
+        "Toplam Satır": raw_metrics.loc,
+        "Boş Satır": raw_metrics.lloc,
+        "Yorum Satırı": raw_metrics.comments,
+        "Fonksiyon Sayısı": len([n for n in ast.walk(ast.parse(kod)) if isinstance(n, ast.FunctionDef)]),
+        "Değişken Sayısı": len([n for n in ast.walk(ast.parse(kod)) if isinstance(n, ast.Name)]),
+        "Import Sayısı": len([n for n in ast.walk(ast.parse(kod)) if isinstance(n, ast.Import)]),
+        "Yorum Oranı": raw_metrics.comments / raw_metrics.loc * 100 if raw_metrics.loc else 0,
+        "Kod Satırı Oranı": raw_metrics.lloc / raw_metrics.loc * 100 if raw_metrics.loc else 0,
+        "Karmaşıklık Ortalama": sum(n.complexity for n in karmasiklik) / len(karmasiklik) if karmasiklik else 0,
+    }
+class EsdegerlikTest(unittest.TestCase):
+    ORNEKLER = [
+        """
+import os, sys
+import json
+class Hesap:
+    def topla(self, a, b, c, d, e, f):
+        toplam = a + b + c
+        for i in range(10):
+            toplam += i * 2.5
+        while toplam > 100:
+            toplam -= 7
+        return toplam
+def yardimci(deger):
+    try:
+        return carp(deger, 3)
+    except ValueError:
+        return 0
+""",
+        """
+# Yardımcı fonksiyonlar
+import os
+def carp(x, y):
+    return x * y
+def kullanilmayan(v):
+    if v:
+        if v > 1:
+            if v > 2:
+                if v > 3:
+                    if v > 4:
+                        return carp(v, 42)
+    return "bitti"
+""",
+        """
+import json
+class Ayar:
+    def oku(self, yol):
+        with open(yol) as dosya:
+            return json.load(dosya)
+    def yaz(self, yol, veri):
+        with open(yol, "w") as dosya:
+            json.dump(veri, dosya)
+def ana():
+    ayar = Ayar()
+    for yol in ["a.json", "b.json"]:
+        if yol:
+            ayar.yaz(yol, ayar.oku(yol))
+""",
+    ]
+
+    def test_kod_kokulari(self):
+        """Kod kokusu tespiti eski karesel tespitten yalnızca bilinçli değişikliklerde ayrışmalıdır.
+
+        Her örnekte eski tespitte olup yenide olmayan ve yenide olup eskide olmayan bulgular tam olarak
+        beklenen farklardır. Sıra farkı test_bulgu_sirasi, tekrar eden kod test_tekrar_eden_atama ve
+        test_tekrar_eden_kod_kurali, ölü kod ve import kokuları test_olu_kod_ve_import_kokulari ile
+        yeni çıktı üzerinden ayrıca sınanır.
+        """
+        uzun = "def uzun(a, b, c, d, e, f):\n" + "".join(f"    print(a, {i + 2})\n" for i in range(32)) + "    return uzun(b, c, d, e, f, a)\n"
+        klon = BilesenTest.KLON_ORNEGI + BilesenTest.KLON_ORNEGI.replace("hesapla", "topla").replace("toplam", "sonuc")
+        eski_tekrar = "Tekrar eden kod bloğu tespit edildi"
+        ornekler = [
+            # "import os, sys" artık tüm adlarıyla raporlanır; eski tespit her atamayı tekrar sayardı
+            (self.ORNEKLER[0], {"Modül içe aktarıldı: os": 1, eski_tekrar: 1}, {"Modül içe aktarıldı: os, sys": 1}),
+            (self.ORNEKLER[1], {}, {}),
+            # ayar.oku(...) ve ayar.yaz(...) nitelik çağrılarıdır; metodlar ölü kod sayılmaz
+            (self.ORNEKLER[2], {"Fonksiyon oku kullanılmıyor (ölü kod)": 1, "Fonksiyon yaz kullanılmıyor (ölü kod)": 1, eski_tekrar: 1}, {}),
+            (uzun, {}, {}),
+            # Tekrar eden kod artık atamalar yerine Tip-1/Tip-2 klon bloklarıdır
+            (klon, {eski_tekrar: 2}, {"Tekrar eden kod bloğu tespit edildi (Tip-2, satırlar 2, 9)": 2}),
+        ]
+        for kod, eksik, fazla in ornekler:
+            eski, yeni = Counter(_eski_kod_kokulari(kod)), Counter(kod_kokularini_tespit_et(kod))
+            self.assertEqual((dict(eski - yeni), dict(yeni - eski)), (eksik, fazla), kod)
+
+    def test_tekrar_eden_atama(self):
+        """Eski tespit yeniden ayrıştırılan ağaçtaki düğümleri karşılaştırdığından her atamayı tekrar sayardı."""
+        kod = "x = 1\ny = 2\n"
+        self.assertEqual(_eski_kod_kokulari(kod).count("Tekrar eden kod bloğu tespit edildi"), 2)
+        self.assertFalse([k for k in kod_kokularini_tespit_et(kod) if k.startswith("Tekrar eden")])
+
+    def test_metrikler(self):
+        """Tek ayrıştırmalı metrik_uret eski çok ayrıştırmalı sürümle aynı sözlüğü döndürmelidir."""
+        for kod in self.ORNEKLER + [""]:
+            eski = _eski_metrik_uret(kod)
+            for yeni in (metrik_uret(kod), metrik_uret(AyristirilmisKod(kod))):
+                self.assertEqual(list(yeni), list(eski))
+                for ad, deger in eski.items():
+                    self.assertAlmostEqual(float(yeni[ad]), float(deger), places=9, msg=ad)
+
+    def test_artimli_analiz(self):
+        """Düzenlemelerden sonra artımlı analiz, kodun tamamının yeniden analiziyle aynı sonucu vermelidir."""
+        from artimli import ArtimliAnalizci
+        analizci = ArtimliAnalizci()
+        kod = "\n".join(self.ORNEKLER)
+        duzenlemeler = [
+            kod,
+            kod.replace("return 0", "return -1"),
+            kod.replace("def ana():", "def ana():\n    eval(input())"),
+            kod.replace("import json\nclass Ayar", "import json\nsifre = 'gizli'\nclass Ayar"),
+        ]
+        for i, surum in enumerate(duzenlemeler):
+            sonuc = analizci.analiz_et(surum)
+            tam = tum_analizler(surum)
+            self.assertEqual(sonuc["Kokular"], tam["Kokular"])
+            self.assertEqual(sonuc["Güvenlik"], tam["Güvenlik"])
+            for ad, deger in tam["Metrikler"].items():
+                self.assertAlmostEqual(float(sonuc["Metrikler"][ad]), float(deger), places=9, msg=ad)
+            if i:
+                # Yalnızca düzenlenen üst düzey blok yeniden analiz edilir
+                self.assertEqual(sonuc["Yeniden Analiz"], 1)
+
+    def test_korpus_benzerligi(self):
+        """Korpus matrisleri her çift için kod_benzerlik_hesapla sonucuyla aynı olmalıdır."""
+        from korpus import KorpusOzellikleri, korpus_benzerlik_hesapla
+        matrisler = korpus_benzerlik_hesapla(KorpusOzellikleri(self.ORNEKLER), blok_boyutu=2)
+        for i, kod1 in enumerate(self.ORNEKLER):
+            for j, kod2 in enumerate(self.ORNEKLER):
+                for ad, deger in kod_benzerlik_hesapla(kod1, kod2).items():
+                    self.assertAlmostEqual(matrisler[ad][i, j], deger, places=6, msg=f"{ad} ({i}, {j})")
+# Bileşen Testleri
+class BilesenTest(unittest.TestCase):
+    KLON_ORNEGI = """
+def hesapla(liste):
+    toplam = 0
+    for x in liste:
+        if x > 0:
+            toplam += x * 2
+    return toplam
+"""
+
+    def test_klon_tipleri(self):
+        """Birebir kopya Tip-1, adları ve sabitleri değişmiş kopya Tip-2 olarak gruplanmalı; farklı blok gruplanmamalıdır."""
+        from klon import KlonIndeksi
+        yeniden_adlandirilmis = (self.KLON_ORNEGI.replace("hesapla", "topla").replace("liste", "sayilar")
+                                 .replace("toplam", "sonuc").replace("x", "s").replace("2", "3"))
+        farkli = """
+def yaz(yol, veri):
+    with open(yol, "w") as dosya:
+        dosya.write(str(veri))
+    return len(veri)
+"""
+        for kopya, tip in ((self.KLON_ORNEGI, 1), (yeniden_adlandirilmis, 2)):
+            indeks = KlonIndeksi()
+            for anahtar, kod in (("asil", self.KLON_ORNEGI), ("kopya", kopya), ("farkli", farkli)):
+                indeks.ekle(anahtar, kod)
+            klonlar = indeks.klonlar()
+            self.assertEqual(len(klonlar), 1, klonlar)
+            self.assertEqual(klonlar[0]["Tip"], tip)
+            self.assertEqual([anahtar for anahtar, _, _ in klonlar[0]["Konumlar"]], ["asil", "kopya"])
+
+    def test_klon_en_az_dugum(self):
+        """EN_AZ_DUGUM'dan küçük tekrar eden deyimler klon sayılmamalıdır."""
+        from klon import EN_AZ_DUGUM, alt_agaclari_ozetle, klon_gruplari
+        kayitlar = [(None, k) for k in alt_agaclari_ozetle(ast.parse("a = 1\nb = 2\n"))]
+        self.assertTrue(all(k.boyut < EN_AZ_DUGUM for _, k in kayitlar))
+        self.assertEqual(klon_gruplari(kayitlar), [])
+        self.assertEqual(len(klon_gruplari(kayitlar, en_az_dugum=1)), 1)
+
+    def test_proje_indeksi(self):
+        """Mutlak, göreli ve takma adlı importların çözümü, ulaşılabilirlik, ölü kod ve fan-in/fan-out."""
+        import tempfile
+        from proje_indeksi import ProjeIndeksi
+        dosyalar = {
+            "main.py": "import uyg\nimport uyg.araclar.metin as metin\n\nif __name__ == '__main__':\n    print(uyg.hesapla(1), metin.bicimle(2))\n",
+            "uyg/__init__.py": "from .cekirdek import hesapla\n",
+            "uyg/cekirdek.py": "import json\n\ndef hesapla(x):\n    return yardim(x)\n\ndef yardim(x):\n    return json.dumps(x)\n\ndef kullanilmayan():\n    return 0\n",
+            "uyg/araclar/__init__.py": "",
+            "uyg/araclar/metin.py": "from ..cekirdek import yardim as y\n\ndef bicimle(x):\n    return y(x)\n",
+            "uyg/artik.py": "def yetim():\n    return 1\n",
+        }
+        with tempfile.TemporaryDirectory() as kok:
+            for yol, icerik in dosyalar.items():
+                os.makedirs(os.path.dirname(os.path.join(kok, yol)), exist_ok=True)
+                with open(os.path.join(kok, yol), "w", encoding="utf-8") as f:
+                    f.write(icerik)
+            indeks = ProjeIndeksi.olustur(kok, is_sayisi=1)
+        self.assertEqual(indeks.giris_noktalari, ["main"])
+        self.assertEqual(indeks.coz("main", "metin"), ("modul", "uyg.araclar.metin"))
+        self.assertEqual(indeks.coz("uyg.araclar.metin", "y"), ("sembol", "uyg.cekirdek", "yardim"))
+        self.assertEqual(indeks.coz("uyg", "hesapla"), ("sembol", "uyg.cekirdek", "hesapla"))
+        self.assertEqual(indeks.ulasilabilir, {"main", "uyg", "uyg.araclar", "uyg.araclar.metin", "uyg.cekirdek"})
+        self.assertEqual([(o["Modül"], o["Ad"], o["Tür"]) for o in indeks.olu_kod()],
+                         [("uyg.artik", None, "modül"), ("uyg.cekirdek", "kullanilmayan", "fonksiyon")])
+        baglasim = {b["Modül"]: b for b in indeks.baglasim()}
+        self.assertEqual((baglasim["main"]["Fan-In"], baglasim["main"]["Fan-Out"]), (0, 3))
+        self.assertEqual((baglasim["uyg.cekirdek"]["Fan-In"], baglasim["uyg.cekirdek"]["Fan-Out"]), (2, 0))
+        self.assertEqual(baglasim["uyg.cekirdek"]["Dış Bağımlılık"], 1)
+        self.assertFalse(baglasim["uyg.artik"]["Ulaşılabilir"])
+
+    def test_import_sayisi(self):
+        """Import Sayısı import deyimlerini sayar; moduller deyimdeki her adı tutar."""
+        kod = "import os, sys\nimport json\n"
+        self.assertEqual(metrik_uret(kod)["Import Sayısı"], 2)
+        self.assertEqual(AyristirilmisKod(kod).moduller, ["os", "sys", "json"])
+
+    def test_ozellik_deposu(self):
+        """Depo yazılıp yeniden açıldığında her anahtarın satırı, kümeleri ve metrikleri kaynakla aynı olmalıdır.
+
+        Aynı anahtarla eklenen dosya kendi satırını alır; depodan kurulan korpus ayrıştırılan korpusla
+        aynı benzerlikleri verir.
+        """
+        import tempfile
+        import numpy as np
+        from korpus import KorpusOzellikleri, korpus_benzerlik_hesapla
+        from ozellik_deposu import OzellikDeposu, OzellikDeposuYazici
+        kayitlar = [(f"m{i}.py", kod) for i, kod in enumerate(EsdegerlikTest.ORNEKLER)] + [("m0.py", EsdegerlikTest.ORNEKLER[1])]
+        kodlar = [kod for _, kod in kayitlar]
+        with tempfile.TemporaryDirectory() as dizin:
+            with OzellikDeposuYazici(dizin) as yazici:
+                for anahtar, kod in kayitlar:
+                    yazici.ekle(anahtar, kod)
+                self.assertEqual(len(yazici), len(kayitlar))
+            depo = OzellikDeposu(dizin)
+            self.assertEqual(len(depo), len(kayitlar))
+            self.assertEqual([depo[i].anahtar for i in range(len(depo))], [anahtar for anahtar, _ in kayitlar])
+            degiskenler = depo.kume_matrisi("degiskenler")
+            for sira, kod in enumerate(kodlar):
+                ayrisim = AyristirilmisKod(kod)
+                self.assertEqual({depo.semboller[k] for k in degiskenler[sira].indices}, set(ayrisim.degiskenler))
+                self.assertEqual(sorted(depo[sira].kume("yapi_ozetleri")), sorted(set(ayrisim.yapi_ozetleri)))
+                for ad, deger in metrik_uret(ayrisim).items():
+                    self.assertAlmostEqual(depo[sira].metrikler[ad], float(deger), places=9, msg=ad)
+            ayristirilan = KorpusOzellikleri(kodlar)
+            depodan = korpus_benzerlik_hesapla(KorpusOzellikleri.depodan(depo, ayristirilan.token))
+            for ad, matris in korpus_benzerlik_hesapla(ayristirilan).items():
+                np.testing.assert_allclose(depodan[ad], matris, err_msg=ad)
+            # Bellek eşlemeli diziler geçici dizin silinmeden bırakılır
+            del depo, degiskenler
+
+    def test_kod_grafi_derin_ifade(self):
+        from kod_grafi import KodGrafi
+        # Özyinelemeli gezinti bu uzunlukta bir toplama zincirinde RecursionError veriyordu
+        graf = KodGrafi("x = " + " + ".join(["a"] * 2000))
+        self.assertEqual(list(graf.tanimlar), ["<modül>"])
+        kod = "class A:\n    def f(self):\n        return self.g() + " + " + ".join(["h()"] * 2000) + "\n    def g(self):\n        return 1\n\ndef h():\n    return 2\n"
+        graf = KodGrafi(kod)
+        self.assertEqual(list(graf.tanimlar), ["<modül>", "A", "A.f", "A.g", "h"])
+        self.assertEqual(graf.cagrilar, Counter({("A.f", "A.g"): 1, ("A.f", "h"): 2000}))
+
+    def test_kapsama_calistirici(self):
+        from kapsama import KapsamaCalistirici
+        proje = "def f(x):\n    if x:\n        return 1\n    return 2\n"
+        ciftler = [
+            (proje, "from proje_kod import f\nf(1)\n"),
+            # Ayrıştırılamayan proje kodu işçide hata verir
+            ("def f(:\n", ""),
+            # Zaman aşımı "except Exception" ile yutulamaz
+            (proje, "while True:\n    try:\n        pass\n    except Exception:\n        pass\n"),
+            # İşçi süreci ölür; havuz yeniden kurulur ve kalan çiftler yeniden gönderilir
+            (proje, "import os\nos._exit(1)\n"),
+            (proje, "from proje_kod import f\nf(0)\n"),
+        ]
+        with KapsamaCalistirici(is_sayisi=1, zaman_asimi=0.5) as calistirici:
+            normal, bozuk, sonsuz, olen, sonraki = calistirici.toplu_hesapla(ciftler)
+        self.assertIsNone(normal["Hata"])
+        self.assertEqual(normal["Cover Oranı"], 75)
+        self.assertEqual(normal["Satırlar"].tolist(), [1, 1, 1, 0])
+        self.assertEqual(normal["Dallar"], [(2, 3)])
+        self.assertIn("NotPython", bozuk["Hata"])
+        self.assertEqual(bozuk["Cover Oranı"], 0)
+        self.assertEqual(sonsuz["Hata"], "Test kodu 0.5 sn içinde tamamlanmadı")
+        self.assertIn("yanıt vermedi", olen["Hata"])
+        self.assertIsNone(sonraki["Hata"])
+        self.assertEqual(sonraki["Satırlar"].tolist(), [1, 1, 0, 1])
+
+    def test_analiz_servisi(self):
+        import asyncio
+        import json
+        from servis import AnalizServisi
+
+        async def istek(port, govde):
+            okuyucu, yazici = await asyncio.open_connection("127.0.0.1", port)
+            yazici.write(f"POST /benzerlik HTTP/1.1\r\nContent-Length: {len(govde)}\r\nConnection: close\r\n\r\n".encode("latin-1") + govde)
+            await yazici.drain()
+            yanit = await okuyucu.read()
+            yazici.close()
+            baslik, _, veri = yanit.partition(b"\r\n\r\n")
+            return int(baslik.split()[1]), json.loads(veri)
+
+        async def senaryo():
+            servis = AnalizServisi(is_sayisi=1, kuyruk_boyutu=2, parti_boyutu=2, parti_bekleme=0.2)
+            sunucu = await servis.baslat(port=0)
+            port = sunucu.sockets[0].getsockname()[1]
+            try:
+                self.assertEqual((await istek(port, b"{bozuk"))[0], 400)
+                self.assertEqual((await istek(port, json.dumps({"kod1": 1, "kod2": "x = 1"}).encode()))[0], 400)
+                # Parti beklemesi içinde gelen iki istek tek partide işlenir
+                govde = json.dumps({"kod1": self.KLON_ORNEGI, "kod2": self.KLON_ORNEGI}).encode()
+                sonuclar = await asyncio.gather(istek(port, govde), istek(port, govde))
+                self.assertEqual([durum for durum, _ in sonuclar], [200, 200])
+                self.assertAlmostEqual(sonuclar[0][1]["Benzerlik"]["Token Benzerliği"], 100)
+                self.assertEqual((servis.olcumler.parti_sayisi, servis.olcumler.partideki_istek), (1, 2))
+                # Tek işçi meşgulken ilk istek partide bekler, sonraki ikisi kuyruğu doldurur, dördüncüsü reddedilir
+                await servis._parti_izni.acquire()
+                bekleyenler = [asyncio.create_task(istek(port, govde))]
+                await asyncio.sleep(0.3)
+                bekleyenler += [asyncio.create_task(istek(port, govde)) for _ in range(2)]
+                while not servis._kuyruk.full():
+                    await asyncio.sleep(0.01)
+                durum, yanit = await istek(port, govde)
+                self.assertEqual((durum, yanit), (503, {"Hata": "Benzerlik kuyruğu dolu"}))
+                servis._parti_izni.release()
+                self.assertEqual([durum for durum, _ in await asyncio.gather(*bekleyenler)], [200, 200, 200])
+                self.assertEqual(servis.olcumler.reddedilen["/benzerlik"], 1)
+            finally:
+                await servis.kapat()
+
+        asyncio.run(senaryo())
+
+    def test_lsh_indeksi(self):
+        import tempfile
+        from benchmark import sentetik_modul_uret
+        from lsh_indeksi import LSHIndeksi
+        kodlar = [sentetik_modul_uret(60, tohum=i, rastgele_adlar=True) for i in range(30)]
+        indeks = LSHIndeksi()
+        for i, kod in enumerate(kodlar):
+            indeks.ekle(f"m{i}.py", kod)
+        # Her modülün bir fonksiyon eklenmiş ve bir adı değiştirilmiş kopyası kendi aslını ilk sırada bulmalı
+        for i, kod in enumerate(kodlar):
+            ad = kod.split("def ", 1)[1].split("(", 1)[0]
+            kopya = kod.replace(ad, "yeni_ad") + "\n\ndef ek(a):\n    return a + 1\n"
+            adaylar = indeks.sorgula(kopya)
+            self.assertEqual(adaylar[0][0], f"m{i}.py")
+            self.assertGreater(adaylar[0][1], 0.5)
+        with tempfile.TemporaryDirectory() as dizin:
+            yol = os.path.join(dizin, "indeks.pkl")
+            indeks.kaydet(yol)
+            yuklenen = LSHIndeksi.yukle(yol)
+        self.assertEqual(len(yuklenen), len(kodlar))
+        self.assertTrue((yuklenen.imzalar == indeks.imzalar).all())
+        self.assertEqual(yuklenen.sorgula(kodlar[3]), indeks.sorgula(kodlar[3]))
+        # Yüklenen indekse ekleme yapılabilir
+        yuklenen.ekle("yeni.py", kodlar[3])
+        self.assertEqual(sorted(anahtar for anahtar, _ in yuklenen.sorgula(kodlar[3], 1.0)), ["m3.py", "yeni.py"])
+
+    def test_token_modeli(self):
+        import tempfile
+        from benchmark import sentetik_modul_uret
+        from token_modeli import TokenModeli
+        kodlar = [sentetik_modul_uret(40, tohum=i, rastgele_adlar=True) for i in range(8)]
+        anahtarlar = [f"m{i}.py" for i in range(8)]
+        with self.assertRaisesRegex(ValueError, "eğitilmemiş"):
+            TokenModeli(ozellik_sayisi=2 ** 12).ekle(anahtarlar, kodlar)
+        model = TokenModeli(ozellik_sayisi=2 ** 12, parti_boyutu=3).egit(anahtarlar[:6], iter(kodlar[:6]))
+        satirlar = model.donustur(kodlar)
+        self.assertEqual(satirlar.shape, (8, 2 ** 12))
+        self.assertAlmostEqual(float(satirlar.multiply(satirlar).sum(axis=1).min()), 1)
+        model.ekle(anahtarlar[6:], kodlar[6:])
+        self.assertEqual(len(model), 8)
+        enler = model.en_benzerler(kodlar[7], k=3)
+        self.assertEqual(enler[0][0], "m7.py")
+        self.assertAlmostEqual(enler[0][1], 100)
+        self.assertEqual(len(enler), 3)
+        self.assertGreaterEqual(enler[1][1], enler[2][1])
+        self.assertAlmostEqual(model.cift_benzerligi(kodlar[0], kodlar[0]), 100)
+        self.assertAlmostEqual(model.cift_benzerligi(kodlar[0], kodlar[1]), model.cift_benzerligi(kodlar[1], kodlar[0]))
+        with tempfile.TemporaryDirectory() as dizin:
+            yol = os.path.join(dizin, "model.pkl")
+            model.kaydet(yol)
+            yuklenen = TokenModeli.yukle(yol)
+        self.assertEqual(yuklenen.anahtarlar, model.anahtarlar)
+        self.assertEqual(yuklenen.en_benzerler(kodlar[2], k=3), model.en_benzerler(kodlar[2], k=3))
+        benzerlik = kod_benzerlik_hesapla(kodlar[0], kodlar[1], token_modeli=yuklenen)
+        self.assertAlmostEqual(benzerlik["Token Benzerliği"], model.cift_benzerligi(kodlar[0], kodlar[1]))
+
+    def test_rapor_dosya_adlari(self):
+        import tempfile
+        from rapor import _dosya_adi
+        with tempfile.TemporaryDirectory() as kok:
+            yollar = [os.path.join(kok, "a", "util.py"), os.path.join(kok, "b", "util.py"), os.path.join(kok, "a__util.py")]
+            adlar = [_dosya_adi(yol, kok) for yol in yollar]
+            self.assertEqual(len(set(adlar)), 3)
+            self.assertTrue(adlar[0].startswith("a__util_") and adlar[1].startswith("b__util_"))
+            # Kök bir dosyaysa yalnızca temel ad kalır; ayrımı tam yolun özeti sağlar
+            tekil = [_dosya_adi(yol, yol) for yol in yollar[:2]]
+            self.assertNotEqual(tekil[0], tekil[1])
+            self.assertTrue(all(ad.startswith("util_") for ad in tekil))
+            self.assertEqual(_dosya_adi(yollar[0], kok), adlar[0])
+
+    def test_proje_ozeti_karmasiklik(self):
+        from toplu_analiz import proje_ozeti
+        # Tek fonksiyonlu basit dosya ile dört bloklu dosyanın ortalaması dosya başına değil blok başına alınır
+        kod1 = "def f(x):\n    return x\n"
+        kod2 = "".join(f"def g{i}(x):\n    if x:\n        return 1\n    elif x > {i}:\n        return 2\n    return 3\n" for i in range(4))
+        sonuclar = [dict(tum_analizler(kod), Dosya=f"{i}.py") for i, kod in enumerate((kod1, kod2))]
+        sonuclar.append({"Dosya": "hatali.py", "Hata": "Syntax hatası"})
+        ozet = proje_ozeti(sonuclar)
+        birlesik = metrik_uret(kod1 + kod2)
+        self.assertEqual(ozet["Metrikler"]["Karmaşıklık Seviyesi"], 5)
+        self.assertAlmostEqual(ozet["Metrikler"]["Karmaşıklık Ortalama"], birlesik["Karmaşıklık Ortalama"])
+        self.assertAlmostEqual(ozet["Metrikler"]["Karmaşıklık Ortalama"], (1 + 4 * 3) / 5)
+        self.assertEqual(ozet["Hatalı Dosya"], 1)
+
+    def test_sonuc_onbellegi(self):
+        import tempfile
+        from onbellek import SonucOnbellegi
+        with tempfile.TemporaryDirectory() as dizin:
+            yol = os.path.join(dizin, "alt", "onbellek.sqlite")
+            onbellek = SonucOnbellegi(yol, en_fazla_kayit=10)
+            self.assertIsNone(onbellek.getir("metrik", "x = 1"))
+            onbellek.kaydet("metrik", "x = 1", {"Toplam Satır": 1})
+            self.assertEqual(onbellek.getir("metrik", "x = 1"), {"Toplam Satır": 1})
+            self.assertIsNone(onbellek.getir("koku", "x = 1"))
+            self.assertEqual((onbellek.isabet, onbellek.iska), (1, 2))
+            onbellek.kapat()
+            # Aynı dosya aynı sürümle yeniden açıldığında kayıt bulunur, sürüm değişince bulunmaz
+            onbellek = SonucOnbellegi(yol, en_fazla_kayit=10)
+            self.assertEqual(onbellek.getir("metrik", "x = 1"), {"Toplam Satır": 1})
+            onbellek.kapat()
+            onbellek = SonucOnbellegi(yol, en_fazla_kayit=10, surum=ANALIZ_SURUMU + ".1")
+            self.assertIsNone(onbellek.getir("metrik", "x = 1"))
+            # Sınır 64 yazmada bir denetlenir; o ana kadar kayıtlar birikir, sonra en son erişilen 10 kayıt kalır
+            for i in range(63):
+                onbellek.kaydet("metrik", f"x = {i}", {"i": i})
+            self.assertEqual(onbellek.istatistik()["Kayıt"], 64)
+            self.assertEqual(onbellek.getir("metrik", "x = 0"), {"i": 0})
+            onbellek.kaydet("metrik", "y = 0", {"i": 63})
+            istatistik = onbellek.istatistik()
+            self.assertEqual(istatistik["Kayıt"], 10)
+            self.assertEqual(onbellek.getir("metrik", "x = 0"), {"i": 0})
+            self.assertEqual(onbellek.getir("metrik", "y = 0"), {"i": 63})
+            self.assertEqual(onbellek.getir("metrik", "x = 62"), {"i": 62})
+            self.assertIsNone(onbellek.getir("metrik", "x = 1"))
+            onbellek.kapat()
+
+    def test_tekrar_eden_kod_kurali(self):
+        """K004 tek satırlık tekrar eden atamaları değil, yeterince büyük Tip-1/Tip-2 klonları raporlar."""
+        ikinci = self.KLON_ORNEGI.replace("hesapla", "topla").replace("toplam", "sonuc")
+        kokular = kod_kokularini_tespit_et(self.KLON_ORNEGI + ikinci)
+        self.assertEqual([k for k in kokular if k.startswith("Tekrar eden")],
+                         ["Tekrar eden kod bloğu tespit edildi (Tip-2, satırlar 2, 9)"] * 2)
+        self.assertNotIn("Tekrar eden kod bloğu tespit edildi", kod_kokularini_tespit_et("x = 1\nx = 1\n"))
+if __name__ == "__main__":
+    from tqdm import tqdm  # İlerleme çubuğu için
     print("White-Box Testleri Başlatılıyor...")
-    test_suite = unittest.TestLoader().loadTestsFromTestCase(WhiteBoxTest)
+    test_suite = unittest.TestSuite(unittest.TestLoader().loadTestsFromTestCase(test) for test in (WhiteBoxTest, EsdegerlikTest, BilesenTest))
     toplam_test_sayisi = test_suite.countTestCases()
     ilerleme_cubugu = tqdm(total=toplam_test_sayisi, desc="Test İlerlemesi", unit="test")
 
@@ -163,187 +720,8 @@ Anlaşmazlık durumunda İzmir Mahkemeleri yetkilidir.
     Button(sartname_penceresi, text="Reddet", command=reddet, font=("Arial", 12), bg="#d9534f", fg="white").pack(side="right", padx=20, pady=20)
     sartname_penceresi.mainloop()
 # Program Giriş Noktası
-if _name_ == "__main__":
+if __name__ == "__main__":
     sartname_ekrani()
-# 1. Kod Benzerlik Analizi
-def kod_benzerlik_hesapla(kod1: str, kod2: str) -> dict:
-    if not kod1 or not kod2:
-        raise ValueError("Kodlar boş olamaz.")
-    # 1. Token Benzerliği
-    vectorizer = CountVectorizer().fit_transform([kod1, kod2])
-    token_benzerlik = cosine_similarity(vectorizer)[0][1]
-    # Yardımcı Fonksiyonlar
-    def agac_vektor(agac):
-        return [type(node).__name__ for node in ast.walk(ast.parse(agac))]
-    def metinleri_ayristir(kod, tip):
-        if tip == ast.Name:
-            return [n.id for n in ast.walk(ast.parse(kod)) if isinstance(n, ast.Name)]
-        elif tip == ast.FunctionDef:
-            return [n.name for n in ast.walk(ast.parse(kod)) if isinstance(n, ast.FunctionDef)]
-        elif tip == ast.ClassDef:
-            return [n.name for n in ast.walk(ast.parse(kod)) if isinstance(n, ast.ClassDef)]
-        else:
-            return []
-    # 2. Yapısal Benzerlik
-    agac_kod1 = agac_vektor(kod1)
-    agac_kod2 = agac_vektor(kod2)
-    yapisal_benzerlik = len(set(agac_kod1).intersection(agac_kod2)) / len(set(agac_kod1 + agac_kod2))
-    # 3. Değişken Adları Benzerliği
-    degisken_benzerlik = len(set(metinleri_ayristir(kod1, ast.Name)).intersection(metinleri_ayristir(kod2, ast.Name))) / max(len(set(metinleri_ayristir(kod1, ast.Name)) | set(metinleri_ayristir(kod2, ast.Name))), 1)
-    # 4. Fonksiyon Adları Benzerliği
-    fonksiyon_benzerlik = len(set(metinleri_ayristir(kod1, ast.FunctionDef)).intersection(metinleri_ayristir(kod2, ast.FunctionDef))) / max(len(set(metinleri_ayristir(kod1, ast.FunctionDef)) | set(metinleri_ayristir(kod2, ast.FunctionDef))), 1)
-    # 5. Sınıf Adları Benzerliği
-    sinif_benzerlik = len(set(metinleri_ayristir(kod1, ast.ClassDef)).intersection(metinleri_ayristir(kod2, ast.ClassDef))) / max(len(set(metinleri_ayristir(kod1, ast.ClassDef)) | set(metinleri_ayristir(kod2, ast.ClassDef))), 1)
-    # 6. Modül Benzerliği
-    moduller = lambda kod: [n.names[0].name for n in ast.walk(ast.parse(kod)) if isinstance(n, ast.Import)]
-    modul_benzerlik = len(set(moduller(kod1)).intersection(set(moduller(kod2)))) / max(len(set(moduller(kod1)) | set(moduller(kod2))), 1)
-    # 7. String Benzerliği
-    string_benzerlik = len(set([n.value for n in ast.walk(ast.parse(kod1)) if isinstance(n, ast.Constant) and isinstance(n.value, str)]).intersection(
-        [n.value for n in ast.walk(ast.parse(kod2)) if isinstance(n, ast.Constant) and isinstance(n.value, str)])) / max(len(set([n.value for n in ast.walk(ast.parse(kod1)) if isinstance(n, ast.Constant) and isinstance(n.value, str)]).union(
-        [n.value for n in ast.walk(ast.parse(kod2)) if isinstance(n, ast.Constant) and isinstance(n.value, str)])), 1)
-    # 8. Yorum Satırları Benzerliği
-    def yorumlari_ayristir(kod):
-        return [line.strip() for line in kod.split('\n') if line.strip().startswith('#')]
-    yorum_benzerlik = len(set(yorumlari_ayristir(kod1)).intersection(set(yorumlari_ayristir(kod2)))) / max(len(set(yorumlari_ayristir(kod1)).union(set(yorumlari_ayristir(kod2)))), 1)
-    # 9. Döngü Türleri Benzerliği
-    def dongu_sayisi(kod):
-        return len([node for node in ast.walk(ast.parse(kod)) if isinstance(node, (ast.For, ast.While))])
-    dongu_benzerlik = min(dongu_sayisi(kod1), dongu_sayisi(kod2)) / max(dongu_sayisi(kod1), dongu_sayisi(kod2)) if max(dongu_sayisi(kod1), dongu_sayisi(kod2)) > 0 else 0
-    # 10. Koşul Yapıları Benzerliği
-    def kosul_sayisi(kod):
-        return len([node for node in ast.walk(ast.parse(kod)) if isinstance(node, ast.If)])
-    kosul_benzerlik = min(kosul_sayisi(kod1), kosul_sayisi(kod2)) / max(kosul_sayisi(kod1), kosul_sayisi(kod2)) if max(kosul_sayisi(kod1), kosul_sayisi(kod2)) > 0 else 0
-    return {
-        "Token Benzerliği": token_benzerlik * 100,
-        "Yapısal Benzerlik": yapisal_benzerlik * 100,
-        "Değişken Adları Benzerliği": degisken_benzerlik * 100,
-        "Fonksiyon Adları Benzerliği": fonksiyon_benzerlik * 100,
-        "Sınıf Adları Benzerliği": sinif_benzerlik * 100,
-        "Modül Benzerliği": modul_benzerlik * 100,
-        "String Benzerliği": string_benzerlik * 100,
-        "Yorum Satırları Benzerliği": yorum_benzerlik * 100,
-        "Döngü Türleri Benzerliği": dongu_benzerlik * 100,
-        "Koşul Yapıları Benzerliği": kosul_benzerlik * 100
-    }
-# 2. Kodun Graph Gösterimi
-def kodu_graf_olustur(kod: str, baslik: str):
-    agac = ast.parse(kod)
-    graph = Digraph(comment=baslik)
-    for node in ast.walk(agac):
-        node_id = id(node)
-        graph.node(str(node_id), type(node).__name__)
-        for child in ast.iter_child_nodes(node):
-            graph.edge(str(node_id), str(id(child)))
-    try:
-        graph.render(f"{baslik}_graph", format="png", cleanup=True)
-        img = plt.imread(f"{baslik}_graph.png")
-        plt.figure(figsize=(12, 8))
-        plt.imshow(img)
-        plt.axis('off')
-        plt.title(f"{baslik} Graph Gösterimi", fontsize=20)
-        plt.show()
-    except FileNotFoundError:
-        print("Graphviz dot executable bulunamadı. Lütfen Graphviz'in kurulu ve PATH'e ekli olduğundan emin olun.")
-# 3. Metrik Analizi
-def metrik_uret(kod: str) -> dict:
-    karmaşıklık = cc_visit(kod)
-    raw_metrics = analyze(kod)
-    parametreler = mi_parameters(kod)
-    return {
-        "Karmaşıklık Seviyesi": len(karmaşıklık),
-        "Toplam Satır": raw_metrics.loc,
-        "Boş Satır": raw_metrics.lloc,
-        "Yorum Satırı": raw_metrics.comments,
-        "Fonksiyon Sayısı": len([n for n in ast.walk(ast.parse(kod)) if isinstance(n, ast.FunctionDef)]),
-        "Değişken Sayısı": len([n for n in ast.walk(ast.parse(kod)) if isinstance(n, ast.Name)]),
-        "Import Sayısı": len([n for n in ast.walk(ast.parse(kod)) if isinstance(n, ast.Import)]),
-        "Yorum Oranı": raw_metrics.comments / raw_metrics.loc * 100 if raw_metrics.loc else 0,
-        "Kod Satırı Oranı": raw_metrics.lloc / raw_metrics.loc * 100 if raw_metrics.loc else 0,
-        "Karmaşıklık Ortalama": np.mean([n.complexity for n in karmaşıklık]) if karmaşıklık else 0
-    }
-# 4. Kod Koku Analizi
-def kod_kokularini_tespit_et(kod: str) -> list:
-    kokular = []
-    for node in ast.walk(ast.parse(kod)):
-        # 1. Çok Uzun Fonksiyon
-        if isinstance(node, ast.FunctionDef) and len(node.body) > 30:
-            kokular.append(f"Fonksiyon {node.name} çok uzun ({len(node.body)} satır)")
-        # 2. Uzun Parametre Listesi
-        if isinstance(node, ast.FunctionDef) and len(node.args.args) > 5:
-            kokular.append(f"Fonksiyon {node.name} çok fazla parametre alıyor ({len(node.args.args)} parametre)")
-        # 3. Ölü Kod
-        if isinstance(node, ast.FunctionDef) and not any(
-            isinstance(n, ast.Call) and isinstance(n.func, ast.Name) and n.func.id == node.name
-            for n in ast.walk(ast.parse(kod))
-        ):
-            kokular.append(f"Fonksiyon {node.name} kullanılmıyor (ölü kod)")
-        # 4. Tekrar Eden Kod
-        if isinstance(node, ast.Assign) and any(
-            n for n in ast.walk(ast.parse(kod)) if isinstance(n, ast.Assign) and n != node and ast.dump(n) == ast.dump(node)
-        ):
-            kokular.append("Tekrar eden kod bloğu tespit edildi")
-        # 5. Büyük Sınıf
-        if isinstance(node, ast.ClassDef) and len(node.body) > 100:
-            kokular.append(f"Çok büyük sınıf: {node.name} ({len(node.body)} satır)")
-        # 6. Fazla Modül Bağımlılığı
-        if isinstance(node, ast.Import) or isinstance(node, ast.ImportFrom):
-            kokular.append(f"Modül içe aktarıldı: {node.names[0].name}")
-        # 7. Derin İf-Else Zinciri
-        if isinstance(node, ast.If):
-            depth = 0
-            while isinstance(node, ast.If):
-                depth += 1
-                node = node.body[0] if node.body else None
-            if depth > 4:
-                kokular.append(f"Derin if-else zinciri tespit edildi ({depth} seviye)")
-        # 8. Yetersiz Hata Yönetimi
-        if isinstance(node, ast.FunctionDef) and not any(isinstance(n, ast.Try) for n in node.body):
-            kokular.append(f"Fonksiyon {node.name} hata yönetimi içermiyor")
-        # 9. Çok Fazla Döngü
-        if isinstance(node, (ast.For, ast.While)):
-            kokular.append("Döngü tespit edildi")
-        # 10. Magic Numbers
-        if isinstance(node, ast.Constant) and isinstance(node.value, (int, float)) and node.value not in [0, 1, -1]:
-            kokular.append(f"Magic number kullanımı: {node.value}")
-    return kokular
-# 5. Cover Oranı Hesaplaması
-def cover_orani_hesapla(proje_kod: str, test_kod: str) -> dict:
-    with open("proje_kod.py", "w") as f:
-        f.write(proje_kod)
-    with open("test_kod.py", "w") as f:
-        f.write(test_kod)
-    cov = coverage.Coverage(source=["proje_kod"])
-    cov.start()
-    try:
-        exec(test_kod)
-    except Exception as e:
-        print(f"Test kodu çalıştırılırken hata oluştu: {e}")
-    cov.stop()
-    cov.save()
-    try:
-        report = cov.report()
-    except coverage.exceptions.NoDataError:
-        report = 0
-    cov.erase()
-    os.remove("proje_kod.py")
-    os.remove("test_kod.py")
-    return {"Cover Oranı": report}
-# Güvenlik ve Hata Analizi
-def kod_guvenligi_ve_hata_tahmini(kod: str) -> list:
-    issues = []
-    for node in ast.walk(ast.parse(kod)):
-        if isinstance(node, ast.Try):
-            issues.append("Try-Except Bloğu Kullanılmış")
-        elif isinstance(node, ast.Import):
-            issues.append(f"Modül İçe Aktarımı: {node.names[0].name}")
-        elif isinstance(node, ast.Call):
-            if isinstance(node.func, ast.Name) and node.func.id in ['eval', 'exec']:
-                issues.append(f"Tehlikeli Fonksiyon Kullanımı: {node.func.id}")
-        elif isinstance(node, ast.FunctionDef) and "password" in [arg.arg.lower() for arg in node.args.args]:
-            issues.append(f"Fonksiyon {node.name} şifre parametresi içeriyor.")
-        elif isinstance(node, ast.With):
-            issues.append("With bloğu kullanımı, kaynak yönetimi kontrol edilmeli.")
-    return issues
 def yazilim_kalite_analizi(kod: str):
     kalite_penceresi = Tk()
     kalite_penceresi.title("Yazılım Kalite Analizi")
@@ -363,79 +741,6 @@ def yazilim_kalite_analizi(kod: str):
     Label(kalite_penceresi, text="Yazılım Kalite Analizi", font=("Arial", 16, "bold"), bg="#f0f4f7").pack(pady=10)
     Label(kalite_penceresi, text=kalite_verileri, font=("Arial", 12), bg="#f0f4f7", justify="left").pack(anchor="w", padx=20, pady=10)
     kalite_penceresi.mainloop()
-# Görselleştirme Fonksiyonları
-# Kiviyat Grafiği Fonksiyonu
-# Kalite Analizini Gösteren İşlev
-def kalite_analiz_goster(kod: str):
-    # Dinamik analiz için metrikler hesaplanıyor
-    metrikler = metrik_uret(kod)
-    kategoriler = ["Karmaşıklık", "Toplam Satır", "Boş Satır", "Yorum Satırı", "Fonksiyon Sayısı"]
-    veriler = [
-        metrikler['Karmaşıklık Seviyesi'],
-        metrikler['Toplam Satır'],
-        metrikler['Boş Satır'],
-        metrikler['Yorum Satırı'],
-        metrikler['Fonksiyon Sayısı']
-    ]
-    # Kiviyat grafiği oluşturuluyor
-    kiviyat_grafigi(veriler, kategoriler, "SonarQube Kalite Analizi")
-# Kiviyat grafiği fonksiyonu (sabit kaldı, üst üste binme problemi burada yoktu)
-def kiviyat_grafigi(veriler, kategoriler, baslik="Yazılım Kalite Analizi"):
-    # Verilerin ve kategorilerin aynı uzunlukta olduğundan emin ol
-    if len(veriler) != len(kategoriler):
-        print("Hata: Veriler ve kategoriler aynı uzunlukta olmalıdır.")
-        return
-    veriler = np.concatenate((veriler, [veriler[0]]))  # Grafiği kapatmak için
-    açılar = np.linspace(0, 2 * np.pi, len(veriler))
-    fig, ax = plt.subplots(figsize=(8, 8), subplot_kw=dict(polar=True))
-    ax.fill(açılar, veriler, color='blue', alpha=0.25)
-    ax.plot(açılar, veriler, color='blue', linewidth=2)
-    ax.set_yticks([])
-    ax.set_xticks(np.linspace(0, 2 * np.pi, len(kategoriler) + 1))
-    ax.set_xticklabels(kategoriler + [kategoriler[0]])  # İlk kategoriyi ekleyerek döngüyü kapat
-    plt.title(baslik, size=16, weight="bold")
-    plt.show()
-def yazilim_kalite_verisi():
-    metrikler = [85, 75, 90, 65, 80]  # Örnek metrik verileri
-    kategoriler = ["Kod Kalitesi", "Güvenlik", "Performans", "Okunabilirlik", "Hata Oranı"]
-    return metrikler, kategoriler
-def grafik_ciz(labels, values, title, xlabel, ylabel, palette="Blues_d"):
-    plt.figure(figsize=(12, 8))
-    sns.barplot(x=labels, y=values, palette=palette)
-    plt.title(title, fontsize=20)
-    plt.xlabel(xlabel, fontsize=14)
-    plt.ylabel(ylabel, fontsize=14)
-    plt.xticks(rotation=45, fontsize=12)
-    plt.tight_layout()
-    plt.show()
-def kod_koku_gorsellestir(kokular: list):
-    # Kokuların kategorize edilmesi
-    kokular_kategorize = {}
-    for koku in kokular:
-        kategori = koku.split("(")[0].strip()
-        kokular_kategorize[kategori] = kokular_kategorize.get(kategori, 0) + 1
-    labels = list(kokular_kategorize.keys())
-    values = list(kokular_kategorize.values())
-    plt.figure(figsize=(16, 10))  # Grafik boyutu artırıldı
-    sns.barplot(x=labels, y=values, palette="coolwarm")
-    # Çubuklar üzerine değerler ekleniyor
-    for i, value in enumerate(values):
-        plt.text(i, value + 0.1, f"{value:.0f}", ha="center", fontsize=12)  # Çubuk üzeri etiket hizalandı
-    plt.title("Kod Koku Analizi", fontsize=24)  # Başlık boyutu artırıldı
-    plt.xlabel("Kod Koku Türleri", fontsize=18)  # X ekseni etiketi
-    plt.ylabel("Frekans", fontsize=18)  # Y ekseni etiketi
-    plt.xticks(rotation=45, fontsize=14)  # X ekseni değer boyutu
-    plt.yticks(fontsize=14)  # Y ekseni değer boyutu
-    plt.tight_layout()  # Çakışmaları engeller
-    plt.show()
-def cover_orani_gorsellestir(oran: float):
-    labels = ["Kaplanan Kısım", "Kaplanmayan Kısım"]
-    values = [oran, 100 - oran]
-    plt.figure(figsize=(8, 8))
-    plt.bar(labels, values, color=["green", "gray"])
-    plt.title("Kod Cover Oranı", fontsize=20)
-    plt.ylabel("Oran (%)", fontsize=14)
-    plt.show()
 # Kullanıcı Arayüzü
 def arayuz_baslat():
     arayuz = Tk()
@@ -453,6 +758,30 @@ def arayuz_baslat():
     frame.columnconfigure(0, weight=1)
     frame.rowconfigure(1, weight=1)
     frame.rowconfigure(3, weight=1)
+    # Kod-1 düzenlendikçe yalnızca değişen üst düzey bloklar arka planda yeniden analiz edilir
+    from artimli import ArkaPlanAnalizcisi, ArtimliAnalizci
+    analizci = ArtimliAnalizci()
+    durum_etiketi = Label(frame, text="", font=("Arial", 10), bg="#f0f4f7", anchor="w")
+    durum_etiketi.grid(row=10, column=0, sticky="ew")
+    def durumu_goster(sonuc):
+        if "Hata" in sonuc:
+            durum_etiketi.config(text=sonuc["Hata"])
+            return
+        durum_etiketi.config(text=f"{sonuc['Metrikler']['Toplam Satır']} satır, {len(sonuc['Kokular'])} koku, {len(sonuc['Güvenlik'])} güvenlik bulgusu ({sonuc['Yeniden Analiz']}/{sonuc['Blok Sayısı']} blok yeniden analiz edildi, {sonuc['Süre'] * 1000:.0f} ms)")
+    arka_plan = ArkaPlanAnalizcisi(arayuz, durumu_goster, analizci)
+    bekleyen_gonderim = [None]
+    def kod_degisti(event):
+        metin_alani1.edit_modified(False)
+        # Art arda tuş vuruşları tek bir analiz isteğinde birleştirilir
+        if bekleyen_gonderim[0] is not None:
+            arayuz.after_cancel(bekleyen_gonderim[0])
+        bekleyen_gonderim[0] = arayuz.after(300, gonder)
+    def gonder():
+        bekleyen_gonderim[0] = None
+        kod1 = metin_alani1.get("1.0", END).strip()
+        if kod1:
+            arka_plan.gonder(kod1)
+    metin_alani1.bind("<<Modified>>", kod_degisti)
     def benzerlik_analiz():
         kod1 = metin_alani1.get("1.0", END).strip()
         kod2 = metin_alani2.get("1.0", END).strip()
@@ -462,16 +791,16 @@ def arayuz_baslat():
     def graph_analiz():
         kod1 = metin_alani1.get("1.0", END).strip()
         if kod1:
-            kodu_graf_olustur(kod1, "Kod-1")
+            kodu_graf_olustur(kod1, "Kod-1", kip="cagri")
     def metrik_analiz():
         kod1 = metin_alani1.get("1.0", END).strip()
         if kod1:
-            metrikler1 = metrik_uret(kod1)
+            metrikler1 = analizci.analiz_et(kod1)["Metrikler"]
             grafik_ciz(list(metrikler1.keys()), list(metrikler1.values()), "Kod Metrikleri", "Metrikler", "Değerler")
     def kod_koku_analiz():
         kod1 = metin_alani1.get("1.0", END).strip()
         if kod1:
-            kokular1 = kod_kokularini_tespit_et(kod1)
+            kokular1 = analizci.analiz_et(kod1)["Kokular"]
             kod_koku_gorsellestir(kokular1)
     def cover_analiz():
         kod1 = metin_alani1.get("1.0", END).strip()
@@ -498,4 +827,7 @@ def arayuz_baslat():
     Button(frame, text="Cover Analizi", command=cover_analiz, font=("Arial", 12), bg="#0078d7", fg="#ffffff", activebackground="#005a9e", activeforeground="#ffffff").grid(row=8, column=0, pady=5, sticky="ew")
     Button(frame, text="Güvenlik Analizi", command=guvenlik_analiz, font=("Arial", 12), bg="#0078d7", fg="#ffffff", activebackground="#005a9e", activeforeground="#ffffff").grid(row=9, column=0, pady=5, sticky="ew")
     Button(frame, text="Kalite Analizi Göster", command=lambda: yazilim_kalite_analizi(metin_alani1.get("1.0", END).strip()), font=("Arial", 12), bg="#0078d7", fg="white").grid(row=11, column=0, pady=5, sticky="ew")
-    Button(frame, text="SonarQube Analizi", command=lambda: kalite_analiz_goster(metin_alani1.get("1.0"    
+    Button(frame, text="SonarQube Analizi", command=lambda: kalite_analiz_goster(metin_alani1.get("1.0", END).strip()), font=("Arial", 12), bg="#0078d7", fg="white").grid(row=12, column=0, pady=5, sticky="ew")
+    arayuz.mainloop()
+if __name__ == "__main__":
+    arayuz_baslat()
@@ -0,0 +1,305 @@
+import ast
+import os
+from collections import deque, namedtuple
+from profil import asama
+# Proje Sembol İndeksi
+# Her modül bir kez ayrıştırılıp küçük bir özete indirgenir (paralel); import çözümü, ulaşılabilirlik,
+# ölü kod ve bağlaşım metrikleri ağaçlara dönmeden bu özetler üzerinden hesaplanır
+Tanim = namedtuple("Tanim", ["modul", "ad", "tur", "satir"])
+# yerel_ad None ise "import a.b.c" biçimidir ve modülde yalnızca en üstteki "a" paketi bağlanır
+IceAktarim = namedtuple("IceAktarim", ["yerel_ad", "modul", "ad", "satir"])
+ModulOzeti = namedtuple("ModulOzeti", [
+    "ad", "yol", "tanimlar", "ice_aktarimlar", "adlar", "nitelikler", "zincirler", "korunanlar",
+    "disa_aktarilanlar", "giris_noktasi", "hata",
+])
+def _test_dosyasi_mi(yol: str) -> bool:
+    dosya = os.path.basename(yol)
+    return dosya.startswith("test_") or dosya.endswith("_test.py") or dosya == "conftest.py"
+def _main_korumasi_mi(node) -> bool:
+    test = node.test
+    return (isinstance(test, ast.Compare) and isinstance(test.left, ast.Name) and test.left.id == "__name__"
+            and len(test.comparators) == 1 and isinstance(test.comparators[0], ast.Constant) and test.comparators[0].value == "__main__")
+def _goreli_coz(modul: str, paket: bool, seviye: int, hedef) -> str:
+    """from ..x import y içindeki göreli kaynağı mutlak modül adına çevirir; paketin dışına çıkıyorsa None."""
+    parcalar = modul.split(".") if paket else modul.split(".")[:-1]
+    if seviye - 1 > len(parcalar):
+        return None
+    parcalar = parcalar[:len(parcalar) - (seviye - 1)]
+    return ".".join(parcalar + ([hedef] if hedef else []))
+def _zincir(node):
+    """a.b.c biçimindeki nitelik zincirini ("a", "b", "c") olarak döndürür; kökü ad değilse None."""
+    parcalar = []
+    while isinstance(node, ast.Attribute):
+        parcalar.append(node.attr)
+        node = node.value
+    if not isinstance(node, ast.Name):
+        return None
+    parcalar.append(node.id)
+    return tuple(reversed(parcalar))
+def modulu_ozetle(yol: str, ad: str, paket: bool = False) -> ModulOzeti:
+    """Dosyayı ayrıştırıp indeksin ihtiyaç duyduğu tanım, içe aktarım ve ad kullanımlarını çıkarır.
+
+    Okunamayan ya da ayrıştırılamayan dosyalar için hata alanı doldurulmuş boş bir özet döner.
+    """
+    tanimlar, ice_aktarimlar, korunanlar = [], [], set()
+    adlar, nitelikler, zincirler = set(), set(), set()
+    disa_aktarilanlar = None
+    test_dosyasi = _test_dosyasi_mi(yol)
+    giris_noktasi = test_dosyasi or ad.rsplit(".", 1)[-1] == "__main__"
+    try:
+        with open(yol, encoding="utf-8") as f:
+            agac = ast.parse(f.read(), yol)
+    except (OSError, UnicodeDecodeError, SyntaxError, ValueError) as e:
+        return ModulOzeti(ad, yol, [], [], set(), set(), set(), set(), None, False, f"{type(e).__name__}: {e}")
+    # Modül düzeyindeki tanımlar; if/try blokları içindekiler de (TYPE_CHECKING, isteğe bağlı import) sayılır
+    bekleyen = list(agac.body)
+    while bekleyen:
+        node = bekleyen.pop()
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            sinif = isinstance(node, ast.ClassDef)
+            tanimlar.append(Tanim(ad, node.name, "sınıf" if sinif else "fonksiyon", node.lineno))
+            # Dekoratörle kaydedilen tanımlar (rota, komut, fixture) çerçeve tarafından çağrılır
+            if node.decorator_list or (test_dosyasi and node.name.lower().startswith("test")):
+                korunanlar.add(node.name)
+            if sinif:
+                # unittest metodları ve NodeVisitor'ın visit_* metodları adla dinamik olarak çağrılır
+                test_sinifi = test_dosyasi or any("TestCase" in ast.unparse(b) for b in node.bases)
+                for uye in node.body:
+                    if isinstance(uye, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                        tanimlar.append(Tanim(ad, f"{node.name}.{uye.name}", "metod", uye.lineno))
+                        dinamik = (test_sinifi and uye.name.startswith("test")) or (node.bases and uye.name.startswith("visit_"))
+                        if dinamik or (uye.decorator_list and not any(isinstance(d, ast.Name) and d.id in ("staticmethod", "classmethod") for d in uye.decorator_list)):
+                            korunanlar.add(f"{node.name}.{uye.name}")
+        elif isinstance(node, ast.If):
+            giris_noktasi = giris_noktasi or _main_korumasi_mi(node)
+            bekleyen.extend(node.body + node.orelse)
+        elif isinstance(node, ast.Try):
+            bekleyen.extend(node.body + node.orelse + node.finalbody + [d for h in node.handlers for d in h.body])
+        elif isinstance(node, ast.Assign) and any(isinstance(h, ast.Name) and h.id == "__all__" for h in node.targets):
+            if isinstance(node.value, (ast.List, ast.Tuple)):
+                disa_aktarilanlar = [e.value for e in node.value.elts if isinstance(e, ast.Constant) and isinstance(e.value, str)]
+    for node in ast.walk(agac):
+        tur = type(node)
+        if tur is ast.Name:
+            if isinstance(node.ctx, ast.Load):
+                adlar.add(node.id)
+        elif tur is ast.Attribute:
+            nitelikler.add(node.attr)
+            zincir = _zincir(node)
+            if zincir is not None:
+                zincirler.add(zincir)
+        elif tur is ast.Import:
+            for a in node.names:
+                ice_aktarimlar.append(IceAktarim(a.asname, a.name, None, node.lineno))
+        elif tur is ast.ImportFrom:
+            kaynak = _goreli_coz(ad, paket, node.level, node.module) if node.level else node.module
+            if kaynak is not None:
+                for a in node.names:
+                    ice_aktarimlar.append(IceAktarim(a.asname or a.name, kaynak, a.name, node.lineno))
+    if disa_aktarilanlar:
+        korunanlar.update(disa_aktarilanlar)
+    return ModulOzeti(ad, yol, tanimlar, ice_aktarimlar, adlar, nitelikler, zincirler, korunanlar, disa_aktarilanlar, giris_noktasi, None)
+def _modulu_ozetle(is_):
+    return modulu_ozetle(*is_)
+def modul_adlari(kok: str) -> list:
+    """Kök altındaki .py dosyalarını (yol, modül adı, paket mi) olarak döndürür.
+
+    Modül adı, __init__.py içermeyen en yakın üst dizine göre hesaplanır (src/ düzeni ve düz betik
+    dizinleri). Aynı adı alan ikinci dosya kökten itibaren tam yoluyla adlandırılır.
+    """
+    from toplu_analiz import python_dosyalarini_bul
+    yollar = list(python_dosyalarini_bul(kok))
+    paket_dizinleri = {os.path.dirname(os.path.abspath(y)) for y in yollar if os.path.basename(y) == "__init__.py"}
+    isler, kullanilan = [], set()
+    for yol in yollar:
+        dizin, dosya = os.path.split(os.path.abspath(yol))
+        paket = dosya == "__init__.py"
+        parcalar = [] if paket else [dosya[:-3]]
+        while dizin in paket_dizinleri:
+            dizin, parca = os.path.split(dizin)
+            parcalar.append(parca)
+        ad = ".".join(reversed(parcalar))
+        if ad in kullanilan:
+            ad = os.path.relpath(yol, kok)[:-3].replace(os.sep, ".")
+        kullanilan.add(ad)
+        isler.append((yol, ad, paket))
+    return isler
+class ProjeIndeksi:
+    """Projenin modül grafı, tanımları ve çözülmüş içe aktarımları.
+
+    Ulaşılabilirlik ve kullanılan tanımlar kurulumda bir kez hesaplanır; olu_kod ve baglasim bu
+    sonuçları paylaşır. Giriş noktası verilmezse __main__ korumalı modüller, __main__.py ve test
+    dosyaları kullanılır; hiçbiri yoksa proje kütüphane sayılır ve tüm modüllerin genel adları kök olur.
+    """
+    def __init__(self, ozetler, giris_noktalari=None):
+        self.moduller = {o.ad: o for o in ozetler}
+        self.tanimlar = {(t.modul, t.ad): t for o in ozetler for t in o.tanimlar}
+        self.bagimliliklar = {ad: set() for ad in self.moduller}
+        self.dis_bagimliliklar = {ad: set() for ad in self.moduller}
+        self._baglamlar = {ad: {} for ad in self.moduller}
+        self._yildizlar = {ad: [] for ad in self.moduller}
+        self._cozumler = {}
+        with asama("ProjeIndeksi.ice_aktarimlar"):
+            for o in ozetler:
+                self._ice_aktarimlari_coz(o)
+        self.bagimlilar = {ad: set() for ad in self.moduller}
+        for ad, hedefler in self.bagimliliklar.items():
+            for hedef in hedefler:
+                self.bagimlilar[hedef].add(ad)
+        if giris_noktalari is None:
+            giris_noktalari = [ad for ad, o in self.moduller.items() if o.giris_noktasi]
+        self.giris_noktalari = sorted(giris_noktalari)
+        self.kutuphane = not self.giris_noktalari
+        with asama("ProjeIndeksi.ulasilabilirlik"):
+            self.ulasilabilir = self._ulasilabilirlik(self.giris_noktalari or self.moduller)
+        with asama("ProjeIndeksi.kullanimlar"):
+            self.kullanilanlar = self._kullanilanlar()
+    @classmethod
+    def olustur(cls, kok: str, is_sayisi: int = None, giris_noktalari=None) -> "ProjeIndeksi":
+        """Kök altındaki modülleri süreç havuzunda özetleyip indeksi kurar (is_sayisi=1: tek süreç)."""
+        isler = modul_adlari(kok)
+        with asama("ProjeIndeksi.ozetle"):
+            if is_sayisi == 1 or len(isler) < 64:
+                ozetler = [modulu_ozetle(*is_) for is_ in isler]
+            else:
+                from concurrent.futures import ProcessPoolExecutor
+                is_sayisi = is_sayisi or os.cpu_count() or 1
+                with ProcessPoolExecutor(max_workers=is_sayisi) as havuz:
+                    ozetler = list(havuz.map(_modulu_ozetle, isler, chunksize=max(1, len(isler) // (is_sayisi * 8))))
+        return cls(ozetler, giris_noktalari)
+    def _bagimlilik_ekle(self, modul: str, hedef: str) -> bool:
+        # Alt modülü içe aktarmak üst paketlerin __init__ modüllerini de çalıştırır
+        parcalar = hedef.split(".")
+        bulundu = False
+        for i in range(1, len(parcalar) + 1):
+            ata = ".".join(parcalar[:i])
+            if ata in self.moduller:
+                bulundu = True
+                if ata != modul:
+                    self.bagimliliklar[modul].add(ata)
+        if not bulundu:
+            self.dis_bagimliliklar[modul].add(parcalar[0])
+        return bulundu
+    def _ice_aktarimlari_coz(self, o: ModulOzeti):
+        baglamlar = self._baglamlar[o.ad]
+        for ice in o.ice_aktarimlar:
+            if ice.ad is None:
+                if self._bagimlilik_ekle(o.ad, ice.modul):
+                    baglanan = ice.modul if ice.yerel_ad else ice.modul.split(".")[0]
+                    if baglanan in self.moduller:
+                        baglamlar[ice.yerel_ad or baglanan] = ("modul", baglanan)
+            elif ice.ad == "*":
+                if self._bagimlilik_ekle(o.ad, ice.modul):
+                    self._yildizlar[o.ad].append(ice.modul)
+            elif f"{ice.modul}.{ice.ad}" in self.moduller:
+                self._bagimlilik_ekle(o.ad, f"{ice.modul}.{ice.ad}")
+                baglamlar[ice.yerel_ad] = ("modul", f"{ice.modul}.{ice.ad}")
+            elif self._bagimlilik_ekle(o.ad, ice.modul) and ice.modul in self.moduller:
+                baglamlar[ice.yerel_ad] = ("sembol", ice.modul, ice.ad)
+    def coz(self, modul: str, ad: str):
+        """Modülde görünen adın gerçek tanımını bulur: ("sembol", modül, ad), ("modul", modül) ya da None.
+
+        Yeniden dışa aktarımlar (from .x import f; __init__ üzerinden import) ve yıldızlı importlar izlenir.
+        """
+        anahtar = (modul, ad)
+        if anahtar in self._cozumler:
+            return self._cozumler[anahtar]
+        # Döngüsel yeniden dışa aktarımlarda sonsuz özyinelemeyi önler
+        self._cozumler[anahtar] = None
+        sonuc = None
+        if anahtar in self.tanimlar:
+            sonuc = ("sembol", modul, ad)
+        elif ad in self._baglamlar.get(modul, ()):
+            baglam = self._baglamlar[modul][ad]
+            sonuc = baglam if baglam[0] == "modul" else self.coz(baglam[1], baglam[2]) or baglam
+        else:
+            for kaynak in self._yildizlar.get(modul, ()):
+                sonuc = self.coz(kaynak, ad)
+                if sonuc is not None:
+                    break
+            else:
+                if f"{modul}.{ad}" in self.moduller:
+                    sonuc = ("modul", f"{modul}.{ad}")
+        self._cozumler[anahtar] = sonuc
+        return sonuc
+    def _ulasilabilirlik(self, kokler) -> set:
+        ulasilabilir = set(kokler)
+        kuyruk = deque(ulasilabilir)
+        while kuyruk:
+            for hedef in self.bagimliliklar[kuyruk.popleft()]:
+                if hedef not in ulasilabilir:
+                    ulasilabilir.add(hedef)
+                    kuyruk.append(hedef)
+        return ulasilabilir
+    def _kullanilanlar(self) -> set:
+        """Ulaşılabilir modüllerden başvurulan tanımların (modül, ad) kümesi."""
+        kullanilanlar = set()
+        nitelikler = set()
+        for modul in self.ulasilabilir:
+            o = self.moduller[modul]
+            nitelikler |= o.nitelikler
+            kullanilanlar.update((modul, ad) for ad in o.korunanlar)
+            for ad in o.adlar:
+                sonuc = self.coz(modul, ad)
+                if sonuc is not None and sonuc[0] == "sembol":
+                    kullanilanlar.add(sonuc[1:])
+            for zincir in o.zincirler:
+                sonuc = self.coz(modul, zincir[0])
+                for parca in zincir[1:]:
+                    if sonuc is None:
+                        break
+                    if sonuc[0] == "modul":
+                        sonuc = self.coz(sonuc[1], parca)
+                    else:
+                        # Sınıf.metod ya da sınıf niteliği; daha derin zincir çözülmez
+                        sonuc = ("sembol", sonuc[1], f"{sonuc[2]}.{parca}")
+                        kullanilanlar.add(sonuc[1:])
+                        break
+                    if sonuc is not None and sonuc[0] == "sembol":
+                        kullanilanlar.add(sonuc[1:])
+        # Metodlar dinamik olarak çağrıldığından adı herhangi bir nitelik erişiminde geçen metod kullanılmış sayılır
+        for (modul, ad), tanim in self.tanimlar.items():
+            if tanim.tur == "metod":
+                metod = ad.rsplit(".", 1)[1]
+                if metod in nitelikler or (metod.startswith("__") and metod.endswith("__")) or (self.kutuphane and not metod.startswith("_")):
+                    kullanilanlar.add((modul, ad))
+            elif self.kutuphane and not ad.startswith("_"):
+                kullanilanlar.add((modul, ad))
+        return kullanilanlar
+    def olu_kod(self) -> list:
+        """Giriş noktalarından ulaşılamayan modüller ile ulaşılabilir modüllerde hiç başvurulmayan tanımlar.
+
+        Kullanılmayan bir sınıfın metodları ayrıca raporlanmaz.
+        """
+        sonuc = []
+        for modul in sorted(self.moduller):
+            o = self.moduller[modul]
+            if modul not in self.ulasilabilir:
+                sonuc.append({"Modül": modul, "Yol": o.yol, "Ad": None, "Tür": "modül", "Satır": 1, "Neden": "Hiçbir giriş noktasından ulaşılamıyor"})
+                continue
+            olu_siniflar = set()
+            for tanim in sorted(o.tanimlar, key=lambda t: t.satir):
+                if (modul, tanim.ad) in self.kullanilanlar:
+                    continue
+                if tanim.tur == "sınıf":
+                    olu_siniflar.add(tanim.ad)
+                elif tanim.tur == "metod" and tanim.ad.split(".", 1)[0] in olu_siniflar:
+                    continue
+                sonuc.append({"Modül": modul, "Yol": o.yol, "Ad": tanim.ad, "Tür": tanim.tur, "Satır": tanim.satir, "Neden": "Projede hiç başvurulmuyor"})
+        return sonuc
+    def baglasim(self) -> list:
+        """Modül başına fan-in (içe aktaran proje modülü), fan-out (içe aktarılan proje modülü) ve kararsızlık."""
+        sonuc = []
+        for modul in sorted(self.moduller):
+            fan_in, fan_out = len(self.bagimlilar[modul]), len(self.bagimliliklar[modul])
+            sonuc.append({
+                "Modül": modul,
+                "Fan-In": fan_in,
+                "Fan-Out": fan_out,
+                "Dış Bağımlılık": len(self.dis_bagimliliklar[modul]),
+                "Kararsızlık": fan_out / (fan_in + fan_out) if fan_in + fan_out else 0.0,
+                "Ulaşılabilir": modul in self.ulasilabilir,
+            })
+        return sonuc
+    def hatalar(self) -> list:
+        return [{"Modül": o.ad, "Yol": o.yol, "Hata": o.hata} for o in self.moduller.values() if o.hata]
@@ -0,0 +1,149 @@
+import argparse
+import hashlib
+import html
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+# Toplu Grafik Raporu
+# Grafikler ekrana değil dosyaya çizilir (Agg); her işçi süreç figür ve eksenlerini bir kez kurup tüm
+# grafiklerde yeniden kullanır. Sonuç tek bir HTML dosyasında toplanır
+GRAFIKLER = ["metrik", "kiviyat", "koku"]
+_BOYUTLAR = {"metrik": (12, 8), "kiviyat": (8, 8), "koku": (16, 10), "cover": (8, 8)}
+class GrafikCizici:
+    """Grafikleri yeniden kullanılan iki figüre (kartezyen ve kutupsal) çizip dosyaya yazar.
+
+    Her çizimden önce eksen temizlenir; figür açma/kapama ve pyplot durum yönetimi tekrarlanmaz.
+    """
+    def __init__(self, dpi: int = 80):
+        import matplotlib
+        matplotlib.use("Agg")
+        import matplotlib.pyplot as plt
+        self.dpi = dpi
+        self._kartezyen = plt.figure()
+        self._kartezyen.add_subplot()
+        self._kutupsal = plt.figure()
+        self._kutupsal.add_subplot(polar=True)
+    def ciz(self, tur: str, veri, yol: str) -> str:
+        import gorsel
+        figur = self._kutupsal if tur == "kiviyat" else self._kartezyen
+        ax = figur.axes[0]
+        ax.clear()
+        figur.set_size_inches(*_BOYUTLAR[tur])
+        if tur == "metrik":
+            gorsel.grafik_ciz(list(veri.keys()), list(veri.values()), "Kod Metrikleri", "Metrikler", "Değerler", ax=ax)
+        elif tur == "kiviyat":
+            gorsel.kiviyat_grafigi(*veri, "Kalite Analizi", ax=ax)
+        elif tur == "koku":
+            gorsel.kod_koku_gorsellestir(veri, ax=ax)
+        elif tur == "cover":
+            gorsel.cover_orani_gorsellestir(veri, ax=ax)
+        else:
+            raise ValueError(f"Bilinmeyen grafik türü: {tur}")
+        figur.savefig(yol, dpi=self.dpi)
+        return yol
+# Her işçi süreç kendi çizicisini kurar
+_cizici = None
+def _isci_baslat(dpi: int):
+    global _cizici
+    _cizici = GrafikCizici(dpi)
+def _dosya_adi(yol: str, kok: str) -> str:
+    goreli = os.path.relpath(yol, kok) if os.path.isdir(kok) else os.path.basename(yol)
+    # Düzleştirilmiş ad okunur kalır; a/b.py ile a__b.py çakışmasın diye tam yolun kısa özeti eklenir
+    ozet = hashlib.blake2b(os.path.abspath(yol).encode("utf-8", "surrogatepass"), digest_size=4).hexdigest()
+    return goreli[:-3].replace(os.sep, "__").replace(".", "_") + "_" + ozet
+def dosya_raporu(yol: str, kok: str, cikti_dizini: str, bicim: str = "png") -> dict:
+    """Dosyayı analiz edip grafiklerini cikti_dizini'ne yazar; hatalı dosyalar için 'Hata' doldurulur."""
+    from analiz import tum_analizler
+    sonuc = {"Dosya": yol, "Grafikler": {}, "Çizim Süresi": 0.0}
+    try:
+        with open(yol, encoding="utf-8") as f:
+            kod = f.read()
+        analizler = tum_analizler(kod)
+        metrikler = {ad: float(deger) for ad, deger in analizler["Metrikler"].items()}
+        kokular = analizler["Kokular"]
+    except Exception as e:
+        sonuc["Hata"] = f"{type(e).__name__}: {e}"
+        return sonuc
+    sonuc["Metrikler"] = metrikler
+    sonuc["Koku Sayısı"] = len(kokular)
+    veriler = {
+        "metrik": metrikler,
+        "kiviyat": ([metrikler[ad] for ad in ("Karmaşıklık Seviyesi", "Toplam Satır", "Boş Satır", "Yorum Satırı", "Fonksiyon Sayısı")],
+                    ["Karmaşıklık", "Toplam Satır", "Boş Satır", "Yorum Satırı", "Fonksiyon Sayısı"]),
+        "koku": kokular,
+    }
+    ad = _dosya_adi(yol, kok)
+    baslangic = time.perf_counter()
+    for tur in GRAFIKLER:
+        dosya = f"{ad}.{tur}.{bicim}"
+        _cizici.ciz(tur, veriler[tur], os.path.join(cikti_dizini, dosya))
+        sonuc["Grafikler"][tur] = dosya
+    sonuc["Çizim Süresi"] = time.perf_counter() - baslangic
+    return sonuc
+def _dosya_raporu(is_):
+    return dosya_raporu(*is_)
+def html_raporu_yaz(sonuclar: list, yol: str, ozet: dict = None):
+    """Tüm dosyaların metrik tablosu ve grafiklerini içeren tek bir HTML dosyası yazar (grafikler göreli bağlantıdır)."""
+    satirlar = [
+        "<!DOCTYPE html>", '<html lang="tr"><head><meta charset="utf-8"><title>Kod Analiz Raporu</title>',
+        "<style>body{font-family:sans-serif;margin:2em}section{border-top:1px solid #ccc;padding:1em 0}"
+        "img{max-width:32%;vertical-align:top}table{border-collapse:collapse}td,th{padding:2px 8px;text-align:left}</style>",
+        "</head><body>", "<h1>Kod Analiz Raporu</h1>",
+    ]
+    if ozet:
+        satirlar.append("<table>" + "".join(f"<tr><th>{html.escape(str(k))}</th><td>{html.escape(str(v))}</td></tr>" for k, v in ozet.items()) + "</table>")
+    for sonuc in sonuclar:
+        satirlar.append(f"<section><h2>{html.escape(sonuc['Dosya'])}</h2>")
+        if "Hata" in sonuc:
+            satirlar.append(f"<p>Hata: {html.escape(sonuc['Hata'])}</p></section>")
+            continue
+        satirlar.append("<table>" + "".join(f"<tr><th>{html.escape(ad)}</th><td>{deger:.2f}</td></tr>" for ad, deger in sonuc["Metrikler"].items()) + "</table>")
+        satirlar.extend(f'<img src="{html.escape(dosya)}" alt="{tur}" loading="lazy">' for tur, dosya in sonuc["Grafikler"].items())
+        satirlar.append("</section>")
+    satirlar.append("</body></html>")
+    with open(yol, "w", encoding="utf-8") as f:
+        f.write("\n".join(satirlar))
+def rapor_olustur(kok: str, cikti_dizini: str, bicim: str = "png", is_sayisi: int = None, dpi: int = 80) -> dict:
+    """Kök altındaki her .py dosyası için grafikleri paralel çizer ve cikti_dizini/index.html raporunu yazar.
+
+    Dönen özet toplam süreyi ve saniyede yazılan grafik sayısını içerir.
+    """
+    from toplu_analiz import python_dosyalarini_bul
+    if bicim not in ("png", "svg"):
+        raise ValueError(f"Desteklenmeyen grafik biçimi: {bicim}")
+    os.makedirs(cikti_dizini, exist_ok=True)
+    is_sayisi = is_sayisi or os.cpu_count() or 1
+    isler = [(yol, kok, cikti_dizini, bicim) for yol in python_dosyalarini_bul(kok)]
+    baslangic = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=is_sayisi, initializer=_isci_baslat, initargs=(dpi,)) as havuz:
+        sonuclar = list(havuz.map(_dosya_raporu, isler, chunksize=max(1, len(isler) // (is_sayisi * 8))))
+    sure = time.perf_counter() - baslangic
+    grafik_sayisi = sum(len(s["Grafikler"]) for s in sonuclar)
+    cizim_suresi = sum(s["Çizim Süresi"] for s in sonuclar)
+    ozet = {
+        "Dosya Sayısı": len(sonuclar),
+        "Hatalı Dosya": sum("Hata" in s for s in sonuclar),
+        "Grafik Sayısı": grafik_sayisi,
+        "İş Sayısı": is_sayisi,
+        "Süre": round(sure, 3),
+        "Grafik/sn": round(grafik_sayisi / sure, 2) if sure else 0.0,
+        # İşçi başına yalnızca çizim ve dosyaya yazma; analiz süresi hariç
+        "Çizim Grafik/sn": round(grafik_sayisi / cizim_suresi, 2) if cizim_suresi else 0.0,
+    }
+    ozet["Rapor"] = os.path.join(cikti_dizini, "index.html")
+    html_raporu_yaz(sonuclar, ozet["Rapor"], ozet)
+    return ozet
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Dizindeki .py dosyaları için grafikleri dosyaya çizer ve tek bir HTML raporu üretir.")
+    parser.add_argument("kok", help="Analiz edilecek dizin veya dosya")
+    parser.add_argument("-o", "--cikti", default="rapor", help="Grafiklerin ve index.html'in yazılacağı dizin")
+    parser.add_argument("--bicim", choices=["png", "svg"], default="png")
+    parser.add_argument("-j", "--is-sayisi", type=int, default=None)
+    parser.add_argument("--dpi", type=int, default=80)
+    args = parser.parse_args(argv)
+    ozet = rapor_olustur(args.kok, args.cikti, args.bicim, args.is_sayisi, args.dpi)
+    for ad, deger in ozet.items():
+        print(f"{ad}: {deger}", file=sys.stderr)
+if __name__ == "__main__":
+    main()
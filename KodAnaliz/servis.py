@@ -0,0 +1,373 @@
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import time
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor
+from analiz import metrik_uret, kod_kokularini_tespit_et, kod_guvenligi_ve_hata_tahmini, tum_analizler
+# Asenkron Yerel Analiz Servisi
+# Yalnızca standart kütüphane kullanılır: HTTP/1.1 asyncio akışları üzerinde, analizler süreç havuzunda çalışır
+TEKIL_ANALIZLER = {
+    "/metrik": ("Metrikler", metrik_uret),
+    "/koku": ("Kokular", kod_kokularini_tespit_et),
+    "/guvenlik": ("Güvenlik", kod_guvenligi_ve_hata_tahmini),
+    # Üç analiz tek ayrıştırma ve tek kural geçişiyle
+    "/analiz": (None, tum_analizler),
+}
+_DURUM_METINLERI = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed", 413: "Payload Too Large", 422: "Unprocessable Entity", 500: "Internal Server Error", 503: "Service Unavailable"}
+class ServisHatasi(Exception):
+    def __init__(self, durum: int, mesaj: str):
+        super().__init__(mesaj)
+        self.durum = durum
+# İşçi Süreç Fonksiyonları
+def _isci_baslat():
+    # Ağır bağımlılıklar ilk istekte değil, işçi açılırken küçük bir ısınma çağrısıyla yüklenir
+    ornek = "def f(a):\n    return a + 1\n"
+    _tekil_analiz("/analiz", ornek)
+    benzerlik_partisi([(ornek, ornek)])
+def _tekil_analiz(yol: str, kod: str) -> dict:
+    alan, fonksiyon = TEKIL_ANALIZLER[yol]
+    try:
+        sonuc = fonksiyon(kod)
+    except SyntaxError as e:
+        return {"Hata": f"Syntax hatası (satır {e.lineno}): {e.msg}"}
+    except Exception as e:
+        return {"Hata": f"{type(e).__name__}: {e}"}
+    if alan is None:
+        return dict(sonuc, Metrikler={ad: float(deger) for ad, deger in sonuc["Metrikler"].items()})
+    if alan == "Metrikler":
+        sonuc = {ad: float(deger) for ad, deger in sonuc.items()}
+    return {alan: sonuc}
+def benzerlik_partisi(ciftler) -> list:
+    """Kod çiftlerinin benzerliklerini tek seferde hesaplar.
+
+    Partideki her farklı kod bir kez ayrıştırılır ve token sözlüğü tüm parti için bir kez kurulur;
+    sayım vektörlerinin kosinüsü sözlüğe eklenen başka token'lardan etkilenmediğinden sonuçlar
+    kod_benzerlik_hesapla ile aynıdır. Hatalar çift başına döner; bir çiftin hatası partideki diğer
+    çiftleri etkilemez.
+    """
+    from analiz import AyristirilmisKod
+    from korpus import BOYUTLAR, KorpusOzellikleri, korpus_benzerlik_hesapla
+    sira, ayrisimlar, hatalar = {}, [], {}
+    for kod in {kod for cift in ciftler for kod in cift}:
+        if not kod:
+            hatalar[kod] = "Kodlar boş olamaz."
+            continue
+        try:
+            ayrisim = AyristirilmisKod(kod)
+        except SyntaxError as e:
+            hatalar[kod] = f"Syntax hatası (satır {e.lineno}): {e.msg}"
+            continue
+        except Exception as e:
+            hatalar[kod] = f"{type(e).__name__}: {e}"
+            continue
+        sira[kod] = len(ayrisimlar)
+        ayrisimlar.append(ayrisim)
+    try:
+        matrisler = korpus_benzerlik_hesapla(KorpusOzellikleri(ayrisimlar)) if ayrisimlar else {}
+    except Exception:
+        # Toplu hesap başarısızsa her çift kendi başına hesaplanır; hata yalnızca ilgili çifte yazılır
+        matrisler = None
+    sonuclar = []
+    for kod1, kod2 in ciftler:
+        hata = hatalar.get(kod1) or hatalar.get(kod2)
+        if hata:
+            sonuclar.append({"Hata": hata})
+            continue
+        i, j = sira[kod1], sira[kod2]
+        try:
+            if matrisler is None:
+                matris, i, j = korpus_benzerlik_hesapla(KorpusOzellikleri([ayrisimlar[i], ayrisimlar[j]])), 0, 1
+            else:
+                matris = matrisler
+            sonuclar.append({"Benzerlik": {ad: float(matris[ad][i, j]) for ad in BOYUTLAR}})
+        except Exception as e:
+            sonuclar.append({"Hata": f"{type(e).__name__}: {e}"})
+    return sonuclar
+# Gecikme ve Verim Ölçümleri
+class ServisOlcumleri:
+    """Uç nokta başına son gecikmeleri sınırlı bir pencerede tutar ve p50/p99 ile verimi raporlar."""
+    def __init__(self, pencere: int = 10000):
+        self.baslangic = time.perf_counter()
+        self.gecikmeler = {}
+        self.tamamlanan = Counter()
+        self.reddedilen = Counter()
+        self.parti_sayisi = 0
+        self.partideki_istek = 0
+        self.pencere = pencere
+    def kaydet(self, uc: str, sure: float):
+        self.gecikmeler.setdefault(uc, deque(maxlen=self.pencere)).append(sure)
+        self.tamamlanan[uc] += 1
+    def rapor(self, kuyruk_doluluklari: dict) -> dict:
+        gecen = time.perf_counter() - self.baslangic
+        uclar = {}
+        for uc, gecikmeler in self.gecikmeler.items():
+            sirali = sorted(gecikmeler)
+            uclar[uc] = {
+                "Tamamlanan": self.tamamlanan[uc],
+                "Reddedilen": self.reddedilen[uc],
+                "p50 (ms)": sirali[len(sirali) // 2] * 1000,
+                "p99 (ms)": sirali[min(len(sirali) - 1, int(len(sirali) * 0.99))] * 1000,
+                "Verim (istek/sn)": self.tamamlanan[uc] / gecen if gecen else 0,
+            }
+        return {
+            "Çalışma Süresi (sn)": gecen,
+            "Uç Noktalar": uclar,
+            "Ortalama Parti Boyutu": self.partideki_istek / self.parti_sayisi if self.parti_sayisi else 0,
+            "Kuyruklar": kuyruk_doluluklari,
+        }
+# Servis
+class AnalizServisi:
+    """Analizleri HTTP üzerinden sunar.
+
+    Eşzamanlı benzerlik istekleri sınırlı bir kuyrukta toplanır ve partiler halinde işçilere gönderilir.
+    Kuyruk doluysa ya da bekleyen tekil analiz sayısı sınırı aştıysa istek beklemeye alınmadan 503 ile
+    reddedilir; böylece yük altında bellek ve gecikme sınırlı kalır.
+    """
+    def __init__(self, is_sayisi: int = None, kuyruk_boyutu: int = 256, parti_boyutu: int = 32, parti_bekleme: float = 0.005, en_fazla_govde: int = 2 * 1024 * 1024):
+        self.is_sayisi = is_sayisi or os.cpu_count() or 1
+        self.kuyruk_boyutu = kuyruk_boyutu
+        self.parti_boyutu = parti_boyutu
+        self.parti_bekleme = parti_bekleme
+        self.en_fazla_govde = en_fazla_govde
+        self.olcumler = ServisOlcumleri()
+        self._havuz = None
+        self._kuyruk = None
+        self._bekleyen_tekil = 0
+        self._gorevler = []
+        self._baglantilar = set()
+    async def baslat(self, adres: str = "127.0.0.1", port: int = 8765):
+        # İşçiler çatallanmak yerine sıfırdan başlatılır; çatallanan işçi o an açık istemci soketlerini
+        # miras alır ve "Connection: close" yanıtından sonra bağlantı istemci tarafında kapanmazdı
+        self._havuz = ProcessPoolExecutor(max_workers=self.is_sayisi, initializer=_isci_baslat, mp_context=multiprocessing.get_context("spawn"))
+        self._kuyruk = asyncio.Queue(self.kuyruk_boyutu)
+        # Havuzdaki işçi sayısı kadar parti aynı anda işlenebilir
+        self._parti_izni = asyncio.Semaphore(self.is_sayisi)
+        self._gorevler.append(asyncio.create_task(self._partileri_dagit()))
+        self.sunucu = await asyncio.start_server(self._baglanti, adres, port)
+        return self.sunucu
+    async def kapat(self):
+        self.sunucu.close()
+        await self.sunucu.wait_closed()
+        # Açık kalıcı bağlantılar kapatılır; işleyiciler dosya sonunu görüp kendiliğinden biter
+        for yazici in list(self._baglantilar):
+            yazici.close()
+        await asyncio.sleep(0)
+        for gorev in self._gorevler:
+            gorev.cancel()
+        self._havuz.shutdown(cancel_futures=True)
+    async def _havuzda(self, fonksiyon, *args):
+        return await asyncio.get_running_loop().run_in_executor(self._havuz, fonksiyon, *args)
+    # Benzerlik partileri
+    async def _partileri_dagit(self):
+        while True:
+            parti = [await self._kuyruk.get()]
+            if self._kuyruk.empty() and self.parti_bekleme:
+                # Tek başına gelen isteğe kısa bir süre eş beklenir
+                await asyncio.sleep(self.parti_bekleme)
+            while len(parti) < self.parti_boyutu and not self._kuyruk.empty():
+                parti.append(self._kuyruk.get_nowait())
+            await self._parti_izni.acquire()
+            self._gorevler.append(asyncio.create_task(self._partiyi_isle(parti)))
+            self._gorevler = [g for g in self._gorevler if not g.done()]
+    async def _partiyi_isle(self, parti):
+        try:
+            self.olcumler.parti_sayisi += 1
+            self.olcumler.partideki_istek += len(parti)
+            try:
+                sonuclar = await self._havuzda(benzerlik_partisi, [(kod1, kod2) for kod1, kod2, _ in parti])
+            except Exception as e:
+                for _, _, gelecek in parti:
+                    if not gelecek.done():
+                        gelecek.set_exception(e)
+                return
+            for (_, _, gelecek), sonuc in zip(parti, sonuclar):
+                if not gelecek.done():
+                    gelecek.set_result(sonuc)
+        finally:
+            self._parti_izni.release()
+    async def benzerlik(self, kod1: str, kod2: str) -> dict:
+        gelecek = asyncio.get_running_loop().create_future()
+        try:
+            self._kuyruk.put_nowait((kod1, kod2, gelecek))
+        except asyncio.QueueFull:
+            raise ServisHatasi(503, "Benzerlik kuyruğu dolu")
+        return await gelecek
+    async def tekil(self, yol: str, kod: str) -> dict:
+        if self._bekleyen_tekil >= self.kuyruk_boyutu:
+            raise ServisHatasi(503, "Bekleyen analiz sınırı aşıldı")
+        self._bekleyen_tekil += 1
+        try:
+            return await self._havuzda(_tekil_analiz, yol, kod)
+        finally:
+            self._bekleyen_tekil -= 1
+    # HTTP
+    async def _isle(self, yontem: str, yol: str, govde: bytes):
+        if yol == "/olcumler":
+            return 200, self.olcumler.rapor({"Benzerlik": self._kuyruk.qsize(), "Tekil": self._bekleyen_tekil, "Sınır": self.kuyruk_boyutu})
+        if yol == "/saglik":
+            return 200, {"Durum": "hazır"}
+        if yol != "/benzerlik" and yol not in TEKIL_ANALIZLER:
+            raise ServisHatasi(404, f"Bilinmeyen uç nokta: {yol}")
+        if yontem != "POST":
+            raise ServisHatasi(405, "Yalnızca POST desteklenir")
+        try:
+            istek = json.loads(govde)
+        except ValueError:
+            raise ServisHatasi(400, "Gövde geçerli JSON değil")
+        if not isinstance(istek, dict):
+            raise ServisHatasi(400, "Gövde bir JSON nesnesi olmalı")
+        # Türler kuyruğa alınmadan denetlenir; hatalı bir istek birlikte işlenen partiye ulaşmaz
+        alanlar = ("kod1", "kod2") if yol == "/benzerlik" else ("kod",)
+        for alan in alanlar:
+            if not isinstance(istek.get(alan, ""), str):
+                raise ServisHatasi(400, f"'{alan}' alanı metin olmalı")
+        if yol == "/benzerlik":
+            sonuc = await self.benzerlik(istek.get("kod1", ""), istek.get("kod2", ""))
+        else:
+            sonuc = await self.tekil(yol, istek.get("kod", ""))
+        return (422 if "Hata" in sonuc else 200), sonuc
+    async def _baglanti(self, okuyucu, yazici):
+        self._baglantilar.add(yazici)
+        try:
+            while True:
+                istek_satiri = await okuyucu.readline()
+                if not istek_satiri:
+                    break
+                parcalar = istek_satiri.decode("latin-1").split(" ", 2)
+                yontem, yol = parcalar[:2] if len(parcalar) == 3 else ("", "")
+                basliklar = {}
+                while True:
+                    satir = await okuyucu.readline()
+                    if satir in (b"\r\n", b"\n", b""):
+                        break
+                    ad, _, deger = satir.decode("latin-1").partition(":")
+                    basliklar[ad.strip().lower()] = deger.strip()
+                baslangic = time.perf_counter()
+                govde = None
+                try:
+                    if not yontem:
+                        raise ServisHatasi(400, "Geçersiz istek satırı")
+                    try:
+                        uzunluk = int(basliklar.get("content-length", 0))
+                    except ValueError:
+                        uzunluk = -1
+                    if uzunluk < 0:
+                        raise ServisHatasi(400, "Geçersiz Content-Length")
+                    if uzunluk > self.en_fazla_govde:
+                        raise ServisHatasi(413, f"Gövde {self.en_fazla_govde} baytı aşıyor")
+                    govde = await okuyucu.readexactly(uzunluk)
+                    durum, yanit = await self._isle(yontem, yol, govde)
+                except ServisHatasi as e:
+                    durum, yanit = e.durum, {"Hata": str(e)}
+                    if e.durum == 503:
+                        self.olcumler.reddedilen[yol] += 1
+                except (asyncio.IncompleteReadError, ConnectionError):
+                    raise
+                except Exception as e:
+                    # Beklenmeyen hatada da istemci yanıtsız bırakılmaz
+                    durum, yanit = 500, {"Hata": f"{type(e).__name__}: {e}"}
+                if durum in (200, 422) and yol not in ("/olcumler", "/saglik"):
+                    self.olcumler.kaydet(yol, time.perf_counter() - baslangic)
+                # Gövdesi okunmamış ya da bozuk istekten sonra bağlantı güvenle sürdürülemez
+                kapat = basliklar.get("connection", "").lower() == "close" or govde is None
+                veri = json.dumps(yanit, ensure_ascii=False, default=float).encode("utf-8")
+                ek_baslik = "Retry-After: 1\r\n" if durum == 503 else ""
+                yazici.write(
+                    f"HTTP/1.1 {durum} {_DURUM_METINLERI[durum]}\r\nContent-Type: application/json; charset=utf-8\r\n"
+                    f"Content-Length: {len(veri)}\r\n{ek_baslik}Connection: {'close' if kapat else 'keep-alive'}\r\n\r\n".encode("latin-1") + veri
+                )
+                await yazici.drain()
+                if kapat:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError, ValueError):
+            pass
+        finally:
+            self._baglantilar.discard(yazici)
+            yazici.close()
+# Yerel Yük Üreteci
+async def _istemci(adres, port, istekler, gecikmeler, durumlar):
+    okuyucu, yazici = await asyncio.open_connection(adres, port)
+    try:
+        for yol, govde in istekler:
+            veri = json.dumps(govde).encode("utf-8")
+            baslangic = time.perf_counter()
+            yazici.write(f"POST {yol} HTTP/1.1\r\nHost: {adres}\r\nContent-Type: application/json\r\nContent-Length: {len(veri)}\r\n\r\n".encode("latin-1") + veri)
+            await yazici.drain()
+            durum = int((await okuyucu.readline()).split()[1])
+            uzunluk = 0
+            while True:
+                satir = await okuyucu.readline()
+                if satir in (b"\r\n", b""):
+                    break
+                if satir.lower().startswith(b"content-length:"):
+                    uzunluk = int(satir.split(b":")[1])
+            await okuyucu.readexactly(uzunluk)
+            gecikmeler.append(time.perf_counter() - baslangic)
+            durumlar[durum] += 1
+    finally:
+        yazici.close()
+        await yazici.wait_closed()
+async def yuk_uret(adres: str, port: int, istek_sayisi: int = 500, eszamanlilik: int = 32, uc: str = "/benzerlik", satir: int = 100) -> dict:
+    """Servise eşzamanlı kalıcı bağlantılar üzerinden istek gönderir ve istemci tarafı gecikmeleri raporlar."""
+    from benchmark import sentetik_modul_uret
+    kodlar = [sentetik_modul_uret(satir, tohum=i, rastgele_adlar=True) for i in range(16)]
+    if uc == "/benzerlik":
+        govdeler = [{"kod1": kodlar[i % 16], "kod2": kodlar[(i * 7 + 3) % 16]} for i in range(istek_sayisi)]
+    else:
+        govdeler = [{"kod": kodlar[i % 16]} for i in range(istek_sayisi)]
+    gecikmeler, durumlar = [], Counter()
+    baslangic = time.perf_counter()
+    await asyncio.gather(*(
+        _istemci(adres, port, [(uc, govde) for govde in govdeler[i::eszamanlilik]], gecikmeler, durumlar)
+        for i in range(eszamanlilik)
+    ))
+    gecen = time.perf_counter() - baslangic
+    gecikmeler.sort()
+    return {
+        "İstek": istek_sayisi,
+        "Durumlar": dict(durumlar),
+        "p50 (ms)": gecikmeler[len(gecikmeler) // 2] * 1000,
+        "p99 (ms)": gecikmeler[min(len(gecikmeler) - 1, int(len(gecikmeler) * 0.99))] * 1000,
+        "Verim (istek/sn)": istek_sayisi / gecen,
+    }
+async def _sun(args):
+    servis = AnalizServisi(args.is_sayisi, args.kuyruk, args.parti)
+    sunucu = await servis.baslat(args.adres, args.port)
+    print(f"Servis http://{args.adres}:{args.port} adresinde ({servis.is_sayisi} işçi)")
+    async with sunucu:
+        await sunucu.serve_forever()
+async def _yuk(args):
+    servis = None
+    if args.sunucu_baslat:
+        servis = AnalizServisi(args.is_sayisi, args.kuyruk, args.parti)
+        await servis.baslat(args.adres, args.port)
+    try:
+        print(json.dumps(await yuk_uret(args.adres, args.port, args.istek, args.eszamanlilik, args.uc, args.satir), ensure_ascii=False, indent=2))
+        if servis:
+            print(json.dumps(servis.olcumler.rapor({}), ensure_ascii=False, indent=2))
+    finally:
+        if servis:
+            await servis.kapat()
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Analizleri yerel bir HTTP servisi olarak sunar veya servise yük üretir.")
+    alt = parser.add_subparsers(dest="komut", required=True)
+    for komut in ("sun", "yuk"):
+        p = alt.add_parser(komut)
+        p.add_argument("--adres", default="127.0.0.1")
+        p.add_argument("--port", type=int, default=8765)
+        p.add_argument("-j", "--is-sayisi", type=int, default=None)
+        p.add_argument("--kuyruk", type=int, default=256, help="Bekleyen istek sınırı; aşılırsa 503 döner")
+        p.add_argument("--parti", type=int, default=32, help="Bir benzerlik partisindeki en fazla istek")
+    yuk = alt.choices["yuk"]
+    yuk.add_argument("-n", "--istek", type=int, default=500)
+    yuk.add_argument("-c", "--eszamanlilik", type=int, default=32)
+    yuk.add_argument("--uc", default="/benzerlik", choices=["/benzerlik"] + list(TEKIL_ANALIZLER))
+    yuk.add_argument("--satir", type=int, default=100, help="Üretilen sentetik kodların satır sayısı")
+    yuk.add_argument("--sunucu-baslat", action="store_true", help="Aynı süreçte bir servis başlatıp ona yük üret")
+    args = parser.parse_args(argv)
+    asyncio.run(_sun(args) if args.komut == "sun" else _yuk(args))
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+import io
+import itertools
+import pickle
+import tokenize
+# Kalıcı TF-IDF Token Modeli
+# Kelime dağarcığı özetlenerek (hashing) sabit boyutta tutulur; model bir kez eğitilip diskten yüklenir
+_ATLANAN_TURLER = {tokenize.NEWLINE, tokenize.NL, tokenize.INDENT, tokenize.DEDENT, tokenize.COMMENT, tokenize.ENDMARKER, tokenize.ENCODING}
+def python_tokenlari(kod) -> list:
+    """Kodu Python'un kendi tokenize modülüyle ad, operatör, sayı ve string token'larına ayırır.
+
+    Yarım kalmış kodda hata verilmez; hatalı noktaya kadar okunan token'lar döndürülür.
+    """
+    kod = getattr(kod, "kod", kod)
+    tokenlar = []
+    try:
+        for token in tokenize.generate_tokens(io.StringIO(kod).readline):
+            if token.type not in _ATLANAN_TURLER:
+                tokenlar.append(token.string)
+    except (tokenize.TokenError, SyntaxError):
+        pass
+    return tokenlar
+class TokenModeli:
+    """Korpus üzerinde eğitilen IDF ağırlıklarıyla kodları seyrek TF-IDF satırlarına dönüştürür.
+
+    Eğitilen korpusun L2 normalize satırları saklanır; yeni bir kodun tüm korpusa kosinüs benzerliği
+    tek bir seyrek matris-vektör çarpımıdır.
+    """
+    def __init__(self, ozellik_sayisi: int = 2 ** 20, parti_boyutu: int = 256):
+        from sklearn.feature_extraction.text import HashingVectorizer, TfidfTransformer
+        self.parti_boyutu = parti_boyutu
+        self._vektorlestirici = HashingVectorizer(analyzer=python_tokenlari, n_features=ozellik_sayisi, alternate_sign=False, norm=None)
+        self._tfidf = TfidfTransformer(sublinear_tf=True)
+        self.anahtarlar = []
+        self.korpus = None
+    def __len__(self):
+        return len(self.anahtarlar)
+    def _sayimlar(self, kodlar):
+        # Kodlar üreteçten parti parti okunur; bellekte aynı anda yalnızca bir partinin metni bulunur
+        from scipy import sparse
+        kodlar = iter(kodlar)
+        partiler = []
+        while True:
+            parti = list(itertools.islice(kodlar, self.parti_boyutu))
+            if not parti:
+                break
+            partiler.append(self._vektorlestirici.transform(parti))
+        return sparse.vstack(partiler, format="csr") if partiler else self._vektorlestirici.transform([])
+    def egit(self, anahtarlar, kodlar) -> "TokenModeli":
+        """IDF ağırlıklarını kodlardan öğrenir ve kodları aranabilir korpus olarak saklar."""
+        sayimlar = self._sayimlar(kodlar)
+        self._tfidf.fit(sayimlar)
+        self.anahtarlar = list(anahtarlar)
+        self.korpus = self._tfidf.transform(sayimlar)
+        return self
+    def donustur(self, kodlar):
+        """Kodları parti parti L2 normalize TF-IDF satırlarına dönüştürür (scipy CSR matrisi)."""
+        return self._tfidf.transform(self._sayimlar(kodlar))
+    def ekle(self, anahtarlar, kodlar):
+        """Yeni kodları IDF ağırlıkları değiştirilmeden korpusa ekler."""
+        from scipy import sparse
+        if self.korpus is None:
+            raise ValueError("Model eğitilmemiş; ekle'den önce egit çağrılmalı.")
+        self.korpus = sparse.vstack([self.korpus, self.donustur(kodlar)], format="csr")
+        self.anahtarlar.extend(anahtarlar)
+    def benzerlikler(self, kod):
+        """Kodun korpustaki her koda kosinüs benzerliğini (yüzde) korpus sırasıyla döndürür."""
+        return (self.korpus @ self.donustur([kod]).T).toarray().ravel() * 100
+    def en_benzerler(self, kod, k: int = 10) -> list:
+        import numpy as np
+        benzerlik = self.benzerlikler(kod)
+        k = min(k, len(benzerlik))
+        if k == 0:
+            return []
+        secilen = np.argpartition(-benzerlik, k - 1)[:k]
+        return [(self.anahtarlar[i], float(benzerlik[i])) for i in secilen[np.argsort(-benzerlik[secilen])]]
+    def cift_benzerligi(self, kod1, kod2) -> float:
+        satirlar = self.donustur([kod1, kod2])
+        return float((satirlar[0] @ satirlar[1].T).toarray()[0, 0]) * 100
+    def kaydet(self, yol: str):
+        with open(yol, "wb") as f:
+            pickle.dump(self, f, protocol=pickle.HIGHEST_PROTOCOL)
+    @classmethod
+    def yukle(cls, yol: str) -> "TokenModeli":
+        with open(yol, "rb") as f:
+            return pickle.load(f)
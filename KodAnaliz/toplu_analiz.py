@@ -0,0 +1,129 @@
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from analiz import tum_analizler
+from onbellek import SonucOnbellegi
+from cikti import jsonl_akisi, jsonl_hedefi_ac, SutunluOzet
+# Toplu Proje Analizi
+HARIC_DIZINLER = {".git", ".hg", ".svn", "__pycache__", ".venv", "venv", "env", ".tox", ".nox", "node_modules", "build", "dist", ".eggs"}
+def python_dosyalarini_bul(kok: str):
+    """Kök dizin altındaki .py dosyalarını, sanal ortam ve derleme dizinlerini atlayarak sıralı üretir."""
+    if os.path.isfile(kok):
+        yield kok
+        return
+    for dizin, alt_dizinler, dosyalar in os.walk(kok):
+        alt_dizinler[:] = sorted(d for d in alt_dizinler if d not in HARIC_DIZINLER and not d.endswith(".egg-info"))
+        for dosya in sorted(dosyalar):
+            if dosya.endswith(".py"):
+                yield os.path.join(dizin, dosya)
+# Her işçi süreç kendi önbellek bağlantısını açar
+_onbellek = None
+def _isci_baslat(onbellek_yolu: str = None):
+    global _onbellek
+    _onbellek = SonucOnbellegi(onbellek_yolu) if onbellek_yolu else None
+def kodu_analiz_et(kod: str, onbellek: SonucOnbellegi = None) -> dict:
+    """Tek bir kaynak kod üzerinde metrik, kod kokusu ve güvenlik analizlerini tek ayrıştırmayla çalıştırır."""
+    sonuc = dict(onbellek.getir_veya_hesapla(tum_analizler.__name__, kod, tum_analizler) if onbellek else tum_analizler(kod))
+    sonuc["Metrikler"] = {ad: float(deger) for ad, deger in sonuc["Metrikler"].items()}
+    return sonuc
+def dosya_analiz_et(yol: str) -> dict:
+    """Dosyayı okuyup analiz eder; okunamayan veya ayrıştırılamayan dosyalar için 'Hata' alanı doldurulur."""
+    sonuc = {"Dosya": yol}
+    baslangic = time.perf_counter()
+    isabet, iska = (_onbellek.isabet, _onbellek.iska) if _onbellek else (0, 0)
+    try:
+        with open(yol, encoding="utf-8") as f:
+            kod = f.read()
+        sonuc.update(kodu_analiz_et(kod, _onbellek))
+    except Exception as e:
+        sonuc["Hata"] = f"{type(e).__name__}: {e}"
+    if _onbellek:
+        sonuc["Önbellek"] = {"İsabet": _onbellek.isabet - isabet, "Iska": _onbellek.iska - iska}
+    sonuc["Süre"] = time.perf_counter() - baslangic
+    return sonuc
+def toplu_analiz(kok: str, is_sayisi: int = None, onbellek_yolu: str = None):
+    """Dosyaları süreç havuzuna dağıtır ve sonuçları tamamlandıkça üretir.
+
+    Bellekte aynı anda en fazla is_sayisi * 4 bekleyen iş tutulur; dosya listesi de tembel okunur.
+    onbellek_yolu verilirse değişmemiş dosyaların sonuçları önbellekten okunur.
+    """
+    is_sayisi = is_sayisi or os.cpu_count() or 1
+    dosyalar = python_dosyalarini_bul(kok)
+    with ProcessPoolExecutor(max_workers=is_sayisi, initializer=_isci_baslat, initargs=(onbellek_yolu,)) as havuz:
+        bekleyenler = set()
+        for yol in dosyalar:
+            bekleyenler.add(havuz.submit(dosya_analiz_et, yol))
+            if len(bekleyenler) >= is_sayisi * 4:
+                bitenler, bekleyenler = wait(bekleyenler, return_when=FIRST_COMPLETED)
+                for is_ in bitenler:
+                    yield is_.result()
+        for is_ in wait(bekleyenler).done:
+            yield is_.result()
+def proje_ozeti(sonuclar) -> dict:
+    """Dosya sonuçlarını proje düzeyinde toplar; metrikler toplanır, oranlar satır, karmaşıklık ortalaması blok ağırlıklı hesaplanır."""
+    ozet = {"Dosya Sayısı": 0, "Hatalı Dosya": 0, "Koku Sayısı": 0, "Güvenlik Bulgusu": 0, "Önbellek": {"İsabet": 0, "Iska": 0}, "Metrikler": {}}
+    karmasiklik_toplami = 0
+    for sonuc in sonuclar:
+        ozet["Dosya Sayısı"] += 1
+        for ad, adet in sonuc.get("Önbellek", {}).items():
+            ozet["Önbellek"][ad] += adet
+        if "Hata" in sonuc:
+            ozet["Hatalı Dosya"] += 1
+            continue
+        ozet["Koku Sayısı"] += len(sonuc["Kokular"])
+        ozet["Güvenlik Bulgusu"] += len(sonuc["Güvenlik"])
+        for ad, deger in sonuc["Metrikler"].items():
+            ozet["Metrikler"][ad] = ozet["Metrikler"].get(ad, 0) + deger
+        # Ortalama karmaşıklık, artimli.py'deki gibi dosyanın blok sayısıyla ağırlıklandırılır
+        karmasiklik_toplami += sonuc["Metrikler"]["Karmaşıklık Ortalama"] * sonuc["Metrikler"]["Karmaşıklık Seviyesi"]
+    metrikler = ozet["Metrikler"]
+    if metrikler:
+        toplam_satir = metrikler["Toplam Satır"]
+        metrikler["Yorum Oranı"] = metrikler["Yorum Satırı"] / toplam_satir * 100 if toplam_satir else 0
+        metrikler["Kod Satırı Oranı"] = metrikler["Boş Satır"] / toplam_satir * 100 if toplam_satir else 0
+        seviye = metrikler["Karmaşıklık Seviyesi"]
+        metrikler["Karmaşıklık Ortalama"] = karmasiklik_toplami / seviye if seviye else 0
+    return ozet
+def _ilerlemeyi_yazdir(sonuclar, hedef=sys.stdout):
+    for sonuc in sonuclar:
+        durum = sonuc["Hata"] if "Hata" in sonuc else f"{len(sonuc['Kokular'])} koku, {len(sonuc['Güvenlik'])} güvenlik bulgusu"
+        print(f"{sonuc['Dosya']}: {durum}", file=hedef)
+        yield sonuc
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Bir dizindeki tüm Python dosyalarını paralel olarak analiz eder.")
+    parser.add_argument("kok", help="Analiz edilecek dizin veya dosya")
+    parser.add_argument("-j", "--is-sayisi", type=int, default=None, help="İşçi süreç sayısı (varsayılan: çekirdek sayısı)")
+    parser.add_argument("--onbellek", default=None, help="Sonuç önbelleği dosyası (örneğin .kodanaliz/onbellek.sqlite)")
+    parser.add_argument("--jsonl", default=None, help="Dosya başına bir JSON kaydının yazılacağı dosya ('-' standart çıktı)")
+    parser.add_argument("--ozet-csv", default=None, help="Dosya başına sayısal özetin yazılacağı CSV dosyası")
+    parser.add_argument("--ozet-npz", default=None, help="Sütunlu özetin yazılacağı .npz dosyası")
+    args = parser.parse_args(argv)
+    # JSONL standart çıktıya yazılıyorsa insan okunur çıktı standart hataya yönlendirilir
+    bilgi = sys.stderr if args.jsonl == "-" else sys.stdout
+    baslangic = time.perf_counter()
+    sonuclar = _ilerlemeyi_yazdir(toplu_analiz(args.kok, args.is_sayisi, args.onbellek), bilgi)
+    jsonl_hedefi = jsonl_hedefi_ac(args.jsonl) if args.jsonl else None
+    if jsonl_hedefi:
+        sonuclar = jsonl_akisi(sonuclar, jsonl_hedefi)
+    sutunlu = SutunluOzet() if args.ozet_csv or args.ozet_npz else None
+    if sutunlu is not None:
+        sonuclar = sutunlu.akis(sonuclar)
+    try:
+        ozet = proje_ozeti(sonuclar)
+    finally:
+        if jsonl_hedefi and jsonl_hedefi is not sys.stdout:
+            jsonl_hedefi.close()
+    if args.ozet_csv:
+        sutunlu.csv_yaz(args.ozet_csv)
+    if args.ozet_npz:
+        sutunlu.npz_yaz(args.ozet_npz)
+    print(f"\n{ozet['Dosya Sayısı']} dosya ({ozet['Hatalı Dosya']} hatalı), {time.perf_counter() - baslangic:.2f} sn", file=bilgi)
+    if args.onbellek:
+        print(f"Önbellek: {ozet['Önbellek']['İsabet']} isabet, {ozet['Önbellek']['Iska']} ıska", file=bilgi)
+    print(f"Koku: {ozet['Koku Sayısı']}, Güvenlik bulgusu: {ozet['Güvenlik Bulgusu']}", file=bilgi)
+    for ad, deger in ozet["Metrikler"].items():
+        print(f"  {ad}: {deger:.2f}", file=bilgi)
+if __name__ == "__main__":
+    main()